@@ -0,0 +1,103 @@
+import threading
+from pathlib import Path
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Tuple
+
+
+def parse_accounts_text(text: str) -> List[Dict]:
+    accs = []
+    for raw in text.splitlines():
+        line = raw.strip()
+        if not line or line.startswith("#"):
+            continue
+        parts = line.split(":")
+        if len(parts) < 4:
+            continue
+        phone, pwd, api_id, api_hash = parts[:4]
+        try:
+            parsed_api_id = int(api_id.strip())
+        except ValueError:
+            continue
+        accs.append({
+            "phone": phone.strip(),
+            "password": None if pwd.strip().upper() == "UNKOWN" else pwd.strip(),
+            "api_id": parsed_api_id,
+            "api_hash": api_hash.strip(),
+        })
+    return accs
+
+
+def parse_accounts(path: Path) -> List[Dict]:
+    if not path.exists():
+        return []
+    return parse_accounts_text(path.read_text(encoding="utf-8"))
+
+
+class AccountsSnapshot:
+    def __init__(self, accounts: List[Dict], signature: Optional[Tuple[int, int]]):
+        self.accounts: Tuple[Mapping, ...] = tuple(MappingProxyType(acc) for acc in accounts)
+        self.by_phone: Mapping[str, Mapping] = MappingProxyType({acc["phone"]: acc for acc in self.accounts})
+        self.signature = signature
+
+    def __len__(self) -> int:
+        return len(self.accounts)
+
+    def __iter__(self):
+        return iter(self.accounts)
+
+    def __contains__(self, phone: str) -> bool:
+        return phone in self.by_phone
+
+    def get(self, phone: str) -> Optional[Mapping]:
+        return self.by_phone.get(phone)
+
+
+class AccountRegistry:
+    def __init__(self, path: Path, statuses: Optional[Dict[str, Dict]] = None):
+        self.path = Path(path)
+        self.statuses: Dict[str, Dict] = statuses if statuses is not None else {}
+        self._lock = threading.Lock()
+        self._snapshot = AccountsSnapshot([], None)
+        self.loads = 0
+
+    def _signature(self) -> Optional[Tuple[int, int]]:
+        try:
+            st = self.path.stat()
+        except OSError:
+            return None
+        return st.st_mtime_ns, st.st_size
+
+    def bind_statuses(self, statuses: Dict[str, Dict]):
+        self.statuses = statuses
+
+    def invalidate(self):
+        with self._lock:
+            self._snapshot = AccountsSnapshot(self._snapshot.accounts, None)
+
+    def snapshot(self) -> AccountsSnapshot:
+        signature = self._signature()
+        current = self._snapshot
+        if signature is not None and signature == current.signature:
+            return current
+        with self._lock:
+            if self._snapshot.signature == signature and signature is not None:
+                return self._snapshot
+            accounts = parse_accounts(self.path) if signature is not None else []
+            self._snapshot = AccountsSnapshot(accounts, signature)
+            self.loads += 1
+            return self._snapshot
+
+    def get(self, phone: str) -> Optional[Mapping]:
+        return self.snapshot().get(phone)
+
+    def status(self, phone: str) -> Dict:
+        return self.statuses.get(phone, {})
+
+    def state(self, phone: str) -> str:
+        return self.status(phone).get("state", "unknown")
+
+    def with_status(self, state: Optional[str] = None) -> List[Tuple[Mapping, Dict]]:
+        rows = [(acc, self.status(acc["phone"])) for acc in self.snapshot()]
+        if state is not None:
+            rows = [(acc, status) for acc, status in rows if status.get("state") == state]
+        return rows
@@ -4,6 +4,7 @@ import platform
 import socket
 import uuid
 import hashlib
+import time
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Optional
@@ -11,6 +12,7 @@ from typing import Optional
 import requests
 
 ADMIN_API_BASE = os.environ.get("ADMIN_API_BASE", "http://155.212.168.79:8000")
+RATE_LIMIT_MAX_WAIT = 15
 LICENSE_FILE = Path(os.environ.get("BOTFACTORY_LICENSE_FILE", Path.home() / ".botfactory_license.json"))
 
 
@@ -38,14 +40,19 @@ def save_license(data: dict) -> None:
     LICENSE_FILE.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
 
 
-def _request_json(path: str, payload: dict) -> dict:
-    response = requests.post(f"{ADMIN_API_BASE}{path}", json=payload, timeout=15)
-    try:
-        data = response.json()
-    except ValueError:
-        data = {"error": "invalid_response"}
-    if not response.ok:
-        data.setdefault("status_code", response.status_code)
+def _request_json(path: str, payload: dict, headers: Optional[dict] = None) -> dict:
+    response = requests.post(f"{ADMIN_API_BASE}{path}", json=payload, headers=headers, timeout=15)
+    if response.status_code == 304:
+        data = {"status_code": 304}
+    else:
+        try:
+            data = response.json()
+        except ValueError:
+            data = {"error": "invalid_response"}
+        if not response.ok:
+            data.setdefault("status_code", response.status_code)
+    if response.headers.get("ETag"):
+        data["etag"] = response.headers["ETag"]
     return data
 
 
@@ -55,14 +62,42 @@ def redeem_code(code: str) -> dict:
 
 
 def check_status(code: str) -> dict:
+    # Every call asks the server and only the ETag (plus the expiry it covers) is stored,
+    # so editing or copying the license file cannot skip the check.
     payload = {"code": code, "fingerprint": _device_fingerprint()}
-    return _request_json("/client/status", payload)
+    license_data = load_license() or {}
+    etag = license_data.get("status_etag") if license_data.get("code") == code else None
+    headers = {"If-None-Match": etag} if etag else None
+    result = _request_json("/client/status", payload, headers)
+    new_etag = result.pop("etag", None)
+    status_code = result.get("status_code") or 200
+    if status_code == 304:
+        result = {"status": "active", "expires_at": license_data.get("status_expires_at")}
+    elif license_data.get("code") == code and (400 <= status_code < 500 or result.get("error") == "revoked"):
+        # A 429 only means "ask again later"; it never counts as an active license
+        license_data.pop("status_expires_at", None)
+        if license_data.pop("status_etag", None) is not None:
+            save_license(license_data)
+        return result
+    if license_data.get("code") == code and result.get("status") == "active" and new_etag:
+        expires_at = result.get("expires_at")
+        if new_etag != etag or "status" in license_data or license_data.get("status_expires_at") != expires_at:
+            license_data.pop("status", None)
+            license_data.pop("status_valid_until", None)
+            license_data["status_etag"] = new_etag
+            license_data["status_expires_at"] = expires_at
+            save_license(license_data)
+    return result
 
 
 def require_license() -> dict:
     data = load_license()
     if data:
         result = check_status(data["code"])
+        retry_after = int(result.get("retry_after") or 0)
+        if result.get("error") == "rate_limited" and retry_after <= RATE_LIMIT_MAX_WAIT:
+            time.sleep(retry_after)
+            result = check_status(data["code"])
         if result.get("status") == "active":
             return result
         if result.get("error") == "invalid_response":
@@ -4,14 +4,24 @@ import secrets
 import hashlib
 import hmac
 import argparse
+import atexit
+import bisect
+import gzip
 import json
+import math
+import queue
+import signal
 import sys
+import threading
+import time
+from collections import Counter, OrderedDict
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Optional, Tuple
 
 from dotenv import load_dotenv
-from flask import Flask, jsonify, request, g, render_template_string
+from flask import Flask, Response, jsonify, request, g, has_request_context, render_template_string
+from werkzeug.middleware.proxy_fix import ProxyFix
 
 load_dotenv()
 
@@ -26,14 +36,370 @@ ADMIN_ALLOWED_IPS = {
     for ip in os.environ.get("ADMIN_ALLOWED_IPS", "").split(",")
     if ip.strip()
 }
+# Reverse proxies in front of the panel; only their X-Forwarded-For entries are believed
+TRUSTED_PROXIES = int(os.environ.get("ADMIN_TRUSTED_PROXIES", "0"))
+STATUS_CACHE_SIZE = int(os.environ.get("ADMIN_STATUS_CACHE_SIZE", "4096"))
+STATUS_CACHE_TTL = int(os.environ.get("ADMIN_STATUS_CACHE_TTL", "60"))
+STATUS_SECRET = os.environ.get("ADMIN_STATUS_SECRET") or secrets.token_hex(32)
+DB_POOL_SIZE = int(os.environ.get("ADMINPANEL_DB_POOL_SIZE", "16"))
+DB_BUSY_TIMEOUT = float(os.environ.get("ADMINPANEL_DB_BUSY_TIMEOUT", "10"))
+SERVE_THREADS = int(os.environ.get("ADMINPANEL_THREADS", "8"))
+RETENTION_DAYS = int(os.environ.get("ADMIN_RETENTION_DAYS", "180"))
+LAST_SEEN_FLUSH_SECONDS = float(os.environ.get("ADMIN_LAST_SEEN_FLUSH_SECONDS", "5"))
+ARCHIVE_DIR = Path(os.environ.get("ADMINPANEL_ARCHIVE_DIR", BASE_DIR / "archive"))
+RATE_LIMIT_ENABLED = os.environ.get("ADMIN_RATE_LIMIT", "1") != "0"
+RATE_LIMIT_KEYS = int(os.environ.get("ADMIN_RATE_LIMIT_KEYS", "100000"))
+METRICS_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
 
 app = Flask(__name__)
+if TRUSTED_PROXIES > 0:
+    app.wsgi_app = ProxyFix(app.wsgi_app, x_for=TRUSTED_PROXIES)
+
+
+def _rate_budget(name: str, default: str) -> Tuple[int, float]:
+    # "20/60" allows bursts of 20 requests and refills 20 tokens per 60 seconds; "0" disables
+    value = os.environ.get(name, default).strip()
+    count, _, period = value.partition("/")
+    capacity = int(count or 0)
+    if capacity <= 0:
+        return 0, 0.0
+    return capacity, capacity / float(period or 60)
+
+
+RATE_LIMITS = {
+    "/client/redeem": (
+        ("ip", _rate_budget("ADMIN_RATE_REDEEM_IP", "20/60")),
+        ("code", _rate_budget("ADMIN_RATE_REDEEM_CODE", "10/60")),
+    ),
+    "/client/status": (
+        ("ip", _rate_budget("ADMIN_RATE_STATUS_IP", "120/60")),
+        ("code", _rate_budget("ADMIN_RATE_STATUS_CODE", "120/60")),
+    ),
+    "/admin/login": (
+        ("ip", _rate_budget("ADMIN_RATE_LOGIN_IP", "10/60")),
+        # Keyed by (IP, login): a bucket per login alone would let anyone lock the admin out
+        ("ip_login", _rate_budget("ADMIN_RATE_LOGIN_USER", "20/300")),
+        # Generous cap per login across all addresses, against guessing spread over many IPs
+        ("login", _rate_budget("ADMIN_RATE_LOGIN_GLOBAL", "100/300")),
+    ),
+}
+
+
+class StatusCache:
+    def __init__(self, maxsize: int, ttl: int):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[Tuple[str, str], dict]" = OrderedDict()
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    def get(self, code: str, fingerprint: str) -> Optional[dict]:
+        key = (code, fingerprint)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry["valid_until"] <= time.time():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry
+
+    def sync_generation(self, generation: int) -> None:
+        with self._lock:
+            if generation != self._generation:
+                self._entries.clear()
+                self._generation = generation
+
+    def put(self, code: str, fingerprint: str, entry: dict) -> None:
+        if self.maxsize <= 0 or self.ttl <= 0:
+            return
+        valid_until = time.time() + self.ttl
+        if entry["expires_ts"] is not None:
+            valid_until = min(valid_until, entry["expires_ts"])
+        key = (code, fingerprint)
+        with self._lock:
+            self._entries[key] = dict(entry, valid_until=valid_until)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def invalidate_code(self, code: str) -> None:
+        with self._lock:
+            for key in [key for key in self._entries if key[0] == code]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+status_cache = StatusCache(STATUS_CACHE_SIZE, STATUS_CACHE_TTL)
+
+
+class RateLimiter:
+    def __init__(self, maxsize: int, enabled: bool = True):
+        self.maxsize = maxsize
+        self.enabled = enabled
+        self._buckets: "OrderedDict[tuple, Tuple[float, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def take(self, key: tuple, capacity: int, refill: float) -> float:
+        now = time.monotonic()
+        with self._lock:
+            tokens, stamp = self._buckets.get(key, (float(capacity), now))
+            tokens = min(float(capacity), tokens + (now - stamp) * refill)
+            wait = 0.0
+            if tokens >= 1.0:
+                tokens -= 1.0
+            else:
+                wait = (1.0 - tokens) / refill
+            self._buckets[key] = (tokens, now)
+            self._buckets.move_to_end(key)
+            while len(self._buckets) > self.maxsize:
+                self._buckets.popitem(last=False)
+            return wait
+
+    def clear(self) -> None:
+        with self._lock:
+            self._buckets.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._buckets)
+
+
+rate_limiter = RateLimiter(RATE_LIMIT_KEYS, RATE_LIMIT_ENABLED)
+
+
+class RequestMetrics:
+    def __init__(self, buckets: Tuple[float, ...]):
+        self.buckets = buckets
+        self._lock = threading.Lock()
+        self._requests: Counter = Counter()
+        self._durations: dict = {}
+        self._queries: Counter = Counter()
+        self._busy_errors = 0
+
+    def observe(self, method: str, route: str, status: int, seconds: float, queries: int, busy: bool) -> None:
+        slot = bisect.bisect_left(self.buckets, seconds)
+        with self._lock:
+            self._requests[(method, route, status)] += 1
+            histogram = self._durations.get(route)
+            if histogram is None:
+                histogram = self._durations[route] = {"counts": [0] * (len(self.buckets) + 1), "sum": 0.0}
+            histogram["counts"][slot] += 1
+            histogram["sum"] += seconds
+            self._queries[route] += queries
+            if busy:
+                self._busy_errors += 1
+
+    def render(self) -> str:
+        with self._lock:
+            requests_total = sorted(self._requests.items())
+            durations = {
+                route: (list(data["counts"]), data["sum"]) for route, data in sorted(self._durations.items())
+            }
+            queries = sorted(self._queries.items())
+            busy_errors = self._busy_errors
+
+        lines = [
+            "# HELP adminpanel_requests_total Handled HTTP requests.",
+            "# TYPE adminpanel_requests_total counter",
+        ]
+        for (method, route, status), value in requests_total:
+            lines.append(
+                f'adminpanel_requests_total{{method="{method}",route="{_metric_label(route)}",status="{status}"}} {value}'
+            )
+        lines += [
+            "# HELP adminpanel_request_duration_seconds Request latency.",
+            "# TYPE adminpanel_request_duration_seconds histogram",
+        ]
+        for route, (counts, total) in durations.items():
+            label = _metric_label(route)
+            cumulative = 0
+            for bound, count in zip(self.buckets, counts):
+                cumulative += count
+                lines.append(f'adminpanel_request_duration_seconds_bucket{{route="{label}",le="{bound}"}} {cumulative}')
+            cumulative += counts[-1]
+            lines.append(f'adminpanel_request_duration_seconds_bucket{{route="{label}",le="+Inf"}} {cumulative}')
+            lines.append(f'adminpanel_request_duration_seconds_sum{{route="{label}"}} {total:.6f}')
+            lines.append(f'adminpanel_request_duration_seconds_count{{route="{label}"}} {cumulative}')
+        lines += [
+            "# HELP adminpanel_db_queries_total SQLite statements executed while handling requests.",
+            "# TYPE adminpanel_db_queries_total counter",
+        ]
+        for route, value in queries:
+            lines.append(f'adminpanel_db_queries_total{{route="{_metric_label(route)}"}} {value}')
+        lines += [
+            "# HELP adminpanel_sqlite_busy_errors_total Requests that failed with database is locked/busy.",
+            "# TYPE adminpanel_sqlite_busy_errors_total counter",
+            f"adminpanel_sqlite_busy_errors_total {busy_errors}",
+            "# HELP adminpanel_status_cache_entries Entries in the /client/status cache.",
+            "# TYPE adminpanel_status_cache_entries gauge",
+            f"adminpanel_status_cache_entries {len(status_cache)}",
+            "# HELP adminpanel_last_seen_pending Machine last_seen updates waiting for the next flush.",
+            "# TYPE adminpanel_last_seen_pending gauge",
+            f"adminpanel_last_seen_pending {len(last_seen_buffer)}",
+            "# HELP adminpanel_rate_limit_buckets Token buckets tracked by the rate limiter.",
+            "# TYPE adminpanel_rate_limit_buckets gauge",
+            f"adminpanel_rate_limit_buckets {len(rate_limiter)}",
+        ]
+        return "\n".join(lines) + "\n"
+
+
+def _metric_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+request_metrics = RequestMetrics(METRICS_BUCKETS)
+
+
+class ConnectionPool:
+    def __init__(self, path: Path, size: int):
+        self.path = path
+        self.size = size
+        self._idle: "queue.LifoQueue[sqlite3.Connection]" = queue.LifoQueue()
+        self._lock = threading.Lock()
+        self._schema_ready = False
+
+    def _connect(self) -> sqlite3.Connection:
+        self._ensure_schema()
+        db = sqlite3.connect(self.path, timeout=DB_BUSY_TIMEOUT, check_same_thread=False)
+        db.row_factory = sqlite3.Row
+        db.execute("PRAGMA journal_mode=WAL")
+        db.set_trace_callback(_count_query)
+        return db
+
+    def _ensure_schema(self) -> None:
+        if self._schema_ready:
+            return
+        with self._lock:
+            if self._schema_ready:
+                return
+            init_db()
+            self._schema_ready = True
+
+    def acquire(self) -> sqlite3.Connection:
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            return self._connect()
+
+    def release(self, db: sqlite3.Connection) -> None:
+        if db.in_transaction:
+            db.rollback()
+        if self._idle.qsize() >= self.size:
+            db.close()
+            return
+        self._idle.put(db)
+
+    def close_all(self) -> int:
+        closed = 0
+        while True:
+            try:
+                db = self._idle.get_nowait()
+            except queue.Empty:
+                return closed
+            db.close()
+            closed += 1
+
+
+db_pool = ConnectionPool(DB_PATH, DB_POOL_SIZE)
+
+
+class LastSeenBuffer:
+    def __init__(self, pool: ConnectionPool, interval: float):
+        self.pool = pool
+        self.interval = interval
+        self._pending: dict = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def touch(self, machine_id: int, seen_at: int) -> None:
+        if self.interval <= 0:
+            self._write({machine_id: seen_at})
+            return
+        with self._lock:
+            if seen_at > self._pending.get(machine_id, 0):
+                self._pending[machine_id] = seen_at
+            if self._thread is None:
+                self._stop.clear()
+                self._thread = threading.Thread(target=self._run, name="last-seen-flush", daemon=True)
+                self._thread.start()
+
+    def _write(self, pending: dict) -> None:
+        db = self.pool.acquire()
+        try:
+            with db:
+                db.executemany(
+                    "UPDATE machines SET last_seen_at = MAX(last_seen_at, ?) WHERE id = ?",
+                    [(seen_at, machine_id) for machine_id, seen_at in pending.items()],
+                )
+        finally:
+            self.pool.release(db)
+
+    def flush(self) -> int:
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        if not pending:
+            return 0
+        try:
+            self._write(pending)
+        except Exception:
+            with self._lock:
+                for machine_id, seen_at in pending.items():
+                    if seen_at > self._pending.get(machine_id, 0):
+                        self._pending[machine_id] = seen_at
+            raise
+        return len(pending)
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            try:
+                self.flush()
+            except sqlite3.Error as exc:
+                print(f"[LAST_SEEN] flush failed, will retry: {exc}", file=sys.stderr, flush=True)
+
+    def close(self) -> None:
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread is not None:
+            self._stop.set()
+            thread.join()
+        self.flush()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._pending)
+
+
+last_seen_buffer = LastSeenBuffer(db_pool, LAST_SEEN_FLUSH_SECONDS)
+
+
+def _count_query(statement: str) -> None:
+    if has_request_context():
+        g.db_queries = g.get("db_queries", 0) + 1
+
+
+def close_all_connections() -> None:
+    try:
+        last_seen_buffer.close()
+    except sqlite3.Error as exc:
+        print(f"[LAST_SEEN] final flush failed: {exc}", file=sys.stderr, flush=True)
+    db_pool.close_all()
+
+
+atexit.register(close_all_connections)
 
 
 def _client_ip() -> str:
-    forwarded = request.headers.get("X-Forwarded-For", "")
-    if forwarded:
-        return forwarded.split(",")[0].strip()
+    # ProxyFix rewrites remote_addr from X-Forwarded-For only when ADMIN_TRUSTED_PROXIES is set
     return request.remote_addr or ""
 
 
@@ -43,27 +409,78 @@ def _is_admin_ip_allowed() -> bool:
     return _client_ip() in ADMIN_ALLOWED_IPS
 
 
+@app.before_request
+def _start_request_timer():
+    g.request_started = time.perf_counter()
+    g.db_queries = 0
+
+
+@app.after_request
+def _remember_status(response):
+    g.response_status = response.status_code
+    return response
+
+
+@app.teardown_request
+def _record_request_metrics(exception=None):
+    started = g.get("request_started")
+    if started is None:
+        return
+    busy = isinstance(exception, sqlite3.OperationalError) and any(
+        marker in str(exception).lower() for marker in ("locked", "busy")
+    )
+    request_metrics.observe(
+        request.method,
+        request.url_rule.rule if request.url_rule is not None else "unmatched",
+        500 if exception is not None else g.get("response_status", 500),
+        time.perf_counter() - started,
+        g.get("db_queries", 0),
+        busy,
+    )
+
+
 @app.before_request
 def _restrict_admin_access():
     if request.path.startswith("/admin") and not _is_admin_ip_allowed():
         return jsonify({"error": "forbidden"}), 403
 
 
+@app.before_request
+def _apply_rate_limits():
+    if not rate_limiter.enabled or request.url_rule is None:
+        return
+    route = request.url_rule.rule
+    limits = RATE_LIMITS.get(route)
+    if not limits:
+        return
+    payload = request.get_json(silent=True)
+    if not isinstance(payload, dict):
+        payload = {}
+    for kind, (capacity, refill) in limits:
+        if capacity <= 0:
+            continue
+        if kind == "ip":
+            value = _client_ip()
+        elif kind == "ip_login":
+            login = str(payload.get("login") or "").strip()
+            value = f"{_client_ip()} {login}" if login else ""
+        else:
+            value = str(payload.get(kind) or "").strip()
+        if not value:
+            continue
+        wait = rate_limiter.take((route, kind, value), capacity, refill)
+        if wait > 0:
+            retry_after = max(1, math.ceil(wait))
+            response = jsonify({"error": "rate_limited", "retry_after": retry_after})
+            response.status_code = 429
+            response.headers["Retry-After"] = str(retry_after)
+            response.headers["Cache-Control"] = "no-store"
+            return response
+
+
 def get_db() -> sqlite3.Connection:
     if "db" not in g:
-        if not DB_PATH.exists():
-            init_db()
-        db = sqlite3.connect(DB_PATH)
-        db.row_factory = sqlite3.Row
-        needs_init = db.execute(
-            "SELECT name FROM sqlite_master WHERE type='table' AND name='users'"
-        ).fetchone() is None
-        if needs_init:
-            db.close()
-            init_db()
-            db = sqlite3.connect(DB_PATH)
-            db.row_factory = sqlite3.Row
-        g.db = db
+        g.db = db_pool.acquire()
     return g.db
 
 
@@ -71,11 +488,17 @@ def get_db() -> sqlite3.Connection:
 def close_db(exception=None):
     db = g.pop("db", None)
     if db is not None:
-        db.close()
+        db_pool.release(db)
 
 
-def _utc_now() -> str:
-    return datetime.now(timezone.utc).isoformat(timespec="seconds")
+def _now_ts() -> int:
+    return int(time.time())
+
+
+def _iso(ts: Optional[int]) -> Optional[str]:
+    if ts is None:
+        return None
+    return datetime.fromtimestamp(ts, timezone.utc).isoformat(timespec="seconds")
 
 
 def _parse_utc(value: str) -> datetime:
@@ -85,6 +508,24 @@ def _parse_utc(value: str) -> datetime:
     return parsed.astimezone(timezone.utc)
 
 
+def _iso_to_epoch(value):
+    if value is None or isinstance(value, int):
+        return value
+    text = str(value).strip()
+    if not text:
+        return None
+    if text.lstrip("-").isdigit():
+        return int(text)
+    return int(_parse_utc(text).timestamp())
+
+
+def _row_json(row: sqlite3.Row) -> dict:
+    data = dict(row)
+    for key in EPOCH_KEYS.intersection(data):
+        data[key] = _iso(data[key])
+    return data
+
+
 def _hash_password(password: str, salt: Optional[bytes] = None) -> str:
     if salt is None:
         salt = secrets.token_bytes(16)
@@ -103,53 +544,288 @@ def _verify_password(password: str, stored: str) -> bool:
     return hmac.compare_digest(digest, test_digest)
 
 
-def init_db() -> None:
-    db = sqlite3.connect(DB_PATH)
-    db.executescript(
+def _sign_status(code: str, fingerprint: str, payload: dict) -> str:
+    message = json.dumps(
+        {"code": code, "fingerprint": fingerprint, **payload},
+        sort_keys=True,
+        separators=(",", ":"),
+    )
+    return hmac.new(STATUS_SECRET.encode("utf-8"), message.encode("utf-8"), hashlib.sha256).hexdigest()
+
+
+def _build_status_entry(code: str, fingerprint: str, expires_at: Optional[int]) -> dict:
+    payload = {"status": "active", "expires_at": _iso(expires_at)}
+    signature = _sign_status(code, fingerprint, payload)
+    return {
+        "payload": dict(payload, signature=signature),
+        "etag": signature[:32],
+        "expires_ts": expires_at,
+    }
+
+
+def _status_response(entry: dict):
+    if request.if_none_match.contains(entry["etag"]):
+        response = app.response_class(status=304)
+    else:
+        response = jsonify(entry["payload"])
+    response.set_etag(entry["etag"])
+    # The client must revalidate every time; If-None-Match keeps that to an empty 304
+    response.headers["Cache-Control"] = "private, no-cache"
+    return response
+
+
+def _status_error(error: str, status: int):
+    response = jsonify({"error": error})
+    response.status_code = status
+    response.headers["Cache-Control"] = "no-store"
+    return response
+
+
+SCHEMA_VERSION = 2
+EPOCH_SCHEMA_VERSION = 1
+STATS_SCHEMA_VERSION = 2
+DAY_SECONDS = 86400
+STATS_MAX_DAYS = 366
+TABLES = OrderedDict(
+    [
+        (
+            "users",
+            """
+            CREATE TABLE IF NOT EXISTS {name} (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                login TEXT UNIQUE NOT NULL,
+                password_hash TEXT NOT NULL,
+                role TEXT NOT NULL,
+                created_at INTEGER NOT NULL,
+                last_login INTEGER
+            )
+            """,
+        ),
+        (
+            "access_codes",
+            """
+            CREATE TABLE IF NOT EXISTS {name} (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                code TEXT UNIQUE NOT NULL,
+                issued_to TEXT,
+                expires_at INTEGER,
+                revoked_at INTEGER,
+                created_at INTEGER NOT NULL,
+                created_by TEXT NOT NULL
+            )
+            """,
+        ),
+        (
+            "machines",
+            """
+            CREATE TABLE IF NOT EXISTS {name} (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                fingerprint TEXT UNIQUE NOT NULL,
+                first_seen_at INTEGER NOT NULL,
+                last_seen_at INTEGER NOT NULL
+            )
+            """,
+        ),
+        (
+            "code_usages",
+            """
+            CREATE TABLE IF NOT EXISTS {name} (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                code_id INTEGER NOT NULL,
+                machine_id INTEGER NOT NULL,
+                used_at INTEGER NOT NULL,
+                revoked_at INTEGER,
+                FOREIGN KEY(code_id) REFERENCES access_codes(id),
+                FOREIGN KEY(machine_id) REFERENCES machines(id)
+            )
+            """,
+        ),
+        (
+            "admin_sessions",
+            """
+            CREATE TABLE IF NOT EXISTS {name} (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                token TEXT UNIQUE NOT NULL,
+                user_id INTEGER NOT NULL,
+                created_at INTEGER NOT NULL,
+                expires_at INTEGER NOT NULL,
+                FOREIGN KEY(user_id) REFERENCES users(id)
+            )
+            """,
+        ),
+        (
+            "stats_totals",
+            """
+            CREATE TABLE IF NOT EXISTS {name} (
+                name TEXT PRIMARY KEY,
+                value INTEGER NOT NULL
+            ) WITHOUT ROWID
+            """,
+        ),
+        (
+            "stats_daily",
+            """
+            CREATE TABLE IF NOT EXISTS {name} (
+                metric TEXT NOT NULL,
+                day INTEGER NOT NULL,
+                value INTEGER NOT NULL,
+                PRIMARY KEY (metric, day)
+            ) WITHOUT ROWID
+            """,
+        ),
+        (
+            "cache_state",
+            """
+            CREATE TABLE IF NOT EXISTS {name} (
+                name TEXT PRIMARY KEY,
+                value INTEGER NOT NULL
+            ) WITHOUT ROWID
+            """,
+        ),
+    ]
+)
+INDEXES = (
+    "CREATE INDEX IF NOT EXISTS idx_access_codes_expires_at ON access_codes(expires_at)",
+    "CREATE INDEX IF NOT EXISTS idx_access_codes_revoked_at ON access_codes(revoked_at)",
+    "CREATE INDEX IF NOT EXISTS idx_access_codes_created_at ON access_codes(created_at)",
+    "CREATE INDEX IF NOT EXISTS idx_code_usages_code_machine ON code_usages(code_id, machine_id)",
+    "CREATE INDEX IF NOT EXISTS idx_machines_last_seen_at ON machines(last_seen_at)",
+    "CREATE INDEX IF NOT EXISTS idx_admin_sessions_expires_at ON admin_sessions(expires_at)",
+)
+EPOCH_COLUMNS = {
+    "users": ("created_at", "last_login"),
+    "access_codes": ("expires_at", "revoked_at", "created_at"),
+    "machines": ("first_seen_at", "last_seen_at"),
+    "code_usages": ("used_at", "revoked_at"),
+    "admin_sessions": ("created_at", "expires_at"),
+}
+EPOCH_KEYS = frozenset(column for columns in EPOCH_COLUMNS.values() for column in columns)
+
+
+def _migrate_to_epoch(db: sqlite3.Connection) -> dict:
+    # Version 0 stored ISO-8601 strings in TEXT columns. TEXT affinity would turn
+    # integers back into strings, so each table is rebuilt with INTEGER columns.
+    db.create_function("iso_to_epoch", 1, _iso_to_epoch, deterministic=True)
+    existing = {row[0] for row in db.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+    migrated = {}
+    db.execute("BEGIN IMMEDIATE")
+    try:
+        for table, ddl in TABLES.items():
+            if table not in existing or table not in EPOCH_COLUMNS:
+                continue
+            columns = [row[1] for row in db.execute(f"PRAGMA table_info({table})")]
+            select = ", ".join(
+                f"iso_to_epoch({column})" if column in EPOCH_COLUMNS[table] else column for column in columns
+            )
+            db.execute(ddl.format(name=f"{table}_epoch"))
+            db.execute(
+                f"INSERT INTO {table}_epoch ({', '.join(columns)}) SELECT {select} FROM {table}"
+            )
+            db.execute(f"DROP TABLE {table}")
+            db.execute(f"ALTER TABLE {table}_epoch RENAME TO {table}")
+            migrated[table] = db.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+        db.execute(f"PRAGMA user_version = {EPOCH_SCHEMA_VERSION}")
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    return migrated
+
+
+# Dashboard counters live in stats_totals / stats_daily and are updated in the same
+# transaction as the write that changes them, so /admin/stats never scans history.
+# stats_daily "codes_expiring" buckets unrevoked codes by the day they expire.
+STATS_REBUILD = (
+    ("DELETE FROM stats_totals", ()),
+    ("DELETE FROM stats_daily", ()),
+    (
         """
-        CREATE TABLE IF NOT EXISTS users (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            login TEXT UNIQUE NOT NULL,
-            password_hash TEXT NOT NULL,
-            role TEXT NOT NULL,
-            created_at TEXT NOT NULL,
-            last_login TEXT
-        );
-        CREATE TABLE IF NOT EXISTS access_codes (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            code TEXT UNIQUE NOT NULL,
-            issued_to TEXT,
-            expires_at TEXT,
-            revoked_at TEXT,
-            created_at TEXT NOT NULL,
-            created_by TEXT NOT NULL
-        );
-        CREATE TABLE IF NOT EXISTS machines (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            fingerprint TEXT UNIQUE NOT NULL,
-            first_seen_at TEXT NOT NULL,
-            last_seen_at TEXT NOT NULL
-        );
-        CREATE TABLE IF NOT EXISTS code_usages (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            code_id INTEGER NOT NULL,
-            machine_id INTEGER NOT NULL,
-            used_at TEXT NOT NULL,
-            revoked_at TEXT,
-            FOREIGN KEY(code_id) REFERENCES access_codes(id),
-            FOREIGN KEY(machine_id) REFERENCES machines(id)
-        );
-        CREATE TABLE IF NOT EXISTS admin_sessions (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            token TEXT UNIQUE NOT NULL,
-            user_id INTEGER NOT NULL,
-            created_at TEXT NOT NULL,
-            expires_at TEXT NOT NULL,
-            FOREIGN KEY(user_id) REFERENCES users(id)
-        );
+        INSERT INTO stats_totals (name, value)
+        SELECT 'codes', COUNT(*) FROM access_codes
+        UNION ALL SELECT 'codes_unrevoked', COUNT(*) FROM access_codes WHERE revoked_at IS NULL
+        UNION ALL SELECT 'redemptions', COUNT(*) FROM code_usages
+        UNION ALL SELECT 'machines', COUNT(*) FROM machines
+        """,
+        (),
+    ),
+    (
         """
+        INSERT INTO stats_daily (metric, day, value)
+        SELECT 'codes_created', created_at / :day, COUNT(*) FROM access_codes GROUP BY 2
+        UNION ALL
+        SELECT 'codes_revoked', revoked_at / :day, COUNT(*) FROM access_codes
+        WHERE revoked_at IS NOT NULL GROUP BY 2
+        UNION ALL
+        SELECT 'codes_expiring', expires_at / :day, COUNT(*) FROM access_codes
+        WHERE revoked_at IS NULL AND expires_at IS NOT NULL GROUP BY 2
+        UNION ALL
+        SELECT 'redemptions', used_at / :day, COUNT(*) FROM code_usages GROUP BY 2
+        UNION ALL
+        SELECT 'machines_new', first_seen_at / :day, COUNT(*) FROM machines GROUP BY 2
+        """,
+        {"day": DAY_SECONDS},
+    ),
+)
+
+
+def rebuild_stats(db: sqlite3.Connection) -> None:
+    for statement, params in STATS_REBUILD:
+        db.execute(statement, params)
+
+
+def _stat_total(db: sqlite3.Connection, name: str, delta: int = 1) -> None:
+    db.execute(
+        """
+        INSERT INTO stats_totals (name, value) VALUES (?, ?)
+        ON CONFLICT(name) DO UPDATE SET value = value + excluded.value
+        """,
+        (name, delta),
     )
-    db.commit()
+
+
+# Every process keeps its own StatusCache. Revoke and extend bump this counter in
+# their transaction, and each process drops its cache when it sees a new value.
+def _bump_cache_generation(db: sqlite3.Connection) -> None:
+    db.execute(
+        """
+        INSERT INTO cache_state (name, value) VALUES ('generation', 1)
+        ON CONFLICT(name) DO UPDATE SET value = value + 1
+        """
+    )
+
+
+def _cache_generation(db: sqlite3.Connection) -> int:
+    row = db.execute("SELECT value FROM cache_state WHERE name = 'generation'").fetchone()
+    return row[0] if row is not None else 0
+
+
+def _stat_daily(db: sqlite3.Connection, metric: str, ts: int, delta: int = 1) -> None:
+    db.execute(
+        """
+        INSERT INTO stats_daily (metric, day, value) VALUES (?, ?, ?)
+        ON CONFLICT(metric, day) DO UPDATE SET value = value + excluded.value
+        """,
+        (metric, ts // DAY_SECONDS, delta),
+    )
+
+
+def init_db() -> None:
+    db = sqlite3.connect(DB_PATH)
+    db.isolation_level = None
+    db.execute("PRAGMA auto_vacuum=INCREMENTAL")
+    version = db.execute("PRAGMA user_version").fetchone()[0]
+    has_tables = db.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'access_codes'").fetchone()
+    if version < EPOCH_SCHEMA_VERSION and has_tables:
+        _migrate_to_epoch(db)
+    for table, ddl in TABLES.items():
+        db.execute(ddl.format(name=table))
+    for ddl in INDEXES:
+        db.execute(ddl)
+    if version < STATS_SCHEMA_VERSION:
+        db.execute("BEGIN IMMEDIATE")
+        rebuild_stats(db)
+        db.execute("COMMIT")
+    db.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
     db.close()
 
     ensure_default_admin()
@@ -162,7 +838,7 @@ def ensure_default_admin() -> None:
     if row is None:
         db.execute(
             "INSERT INTO users (login, password_hash, role, created_at) VALUES (?, ?, ?, ?)",
-            (ADMIN_USERNAME, _hash_password(ADMIN_PASSWORD), "admin", _utc_now()),
+            (ADMIN_USERNAME, _hash_password(ADMIN_PASSWORD), "admin", _now_ts()),
         )
         db.commit()
     db.close()
@@ -175,20 +851,24 @@ def create_access_code(
     created_by: str = "cli",
 ) -> Tuple[str, Optional[str]]:
     code = secrets.token_urlsafe(10)
+    now = _now_ts()
     expires_at = None
     if expires_in_days:
-        expires_at = (datetime.now(timezone.utc) + timedelta(days=expires_in_days)).isoformat(
-            timespec="seconds"
-        )
+        expires_at = now + int(timedelta(days=expires_in_days).total_seconds())
     db.execute(
         """
         INSERT INTO access_codes (code, issued_to, expires_at, revoked_at, created_at, created_by)
         VALUES (?, ?, ?, NULL, ?, ?)
         """,
-        (code, issued_to, expires_at, _utc_now(), created_by),
+        (code, issued_to, expires_at, now, created_by),
     )
+    _stat_total(db, "codes")
+    _stat_total(db, "codes_unrevoked")
+    _stat_daily(db, "codes_created", now)
+    if expires_at is not None:
+        _stat_daily(db, "codes_expiring", expires_at)
     db.commit()
-    return code, expires_at
+    return code, _iso(expires_at)
 
 
 def require_admin() -> sqlite3.Row:
@@ -201,14 +881,10 @@ def require_admin() -> sqlite3.Row:
         SELECT admin_sessions.token, admin_sessions.expires_at, users.login, users.role
         FROM admin_sessions
         JOIN users ON users.id = admin_sessions.user_id
-        WHERE admin_sessions.token = ?
+        WHERE admin_sessions.token = ? AND admin_sessions.expires_at > ?
         """,
-        (token,),
+        (token, _now_ts()),
     ).fetchone()
-    if row is None:
-        return None
-    if _parse_utc(row["expires_at"]) < datetime.now(timezone.utc):
-        return None
     return row
 
 
@@ -217,6 +893,13 @@ def health():
     return jsonify({"status": "ok"})
 
 
+@app.route("/metrics")
+def metrics():
+    if not _is_admin_ip_allowed():
+        return jsonify({"error": "forbidden"}), 403
+    return Response(request_metrics.render(), mimetype="text/plain; version=0.0.4")
+
+
 @app.route("/")
 def index():
     return render_template_string(
@@ -227,10 +910,15 @@ def index():
           <li>POST /admin/login</li>
           <li>POST /admin/codes</li>
           <li>GET /admin/codes</li>
+          <li>GET /admin/codes/active</li>
+          <li>GET /admin/codes/expired</li>
+          <li>GET /admin/codes/revoked</li>
           <li>POST /admin/codes/&lt;id&gt;/revoke</li>
           <li>POST /admin/codes/&lt;id&gt;/extend</li>
           <li>GET /admin/machines</li>
           <li>GET /admin/usages</li>
+          <li>GET /admin/stats</li>
+          <li>GET /metrics</li>
         </ul>
         """
     )
@@ -245,17 +933,16 @@ def admin_login():
     row = db.execute("SELECT id, login, password_hash FROM users WHERE login = ?", (login,)).fetchone()
     if row is None or not _verify_password(password, row["password_hash"]):
         return jsonify({"error": "invalid_credentials"}), 401
-    db.execute("UPDATE users SET last_login = ? WHERE id = ?", (_utc_now(), row["id"]))
+    now = _now_ts()
+    db.execute("UPDATE users SET last_login = ? WHERE id = ?", (now, row["id"]))
     token = secrets.token_urlsafe(32)
-    expires_at = (datetime.now(timezone.utc) + timedelta(minutes=TOKEN_TTL_MINUTES)).isoformat(
-        timespec="seconds"
-    )
+    expires_at = now + TOKEN_TTL_MINUTES * 60
     db.execute(
         "INSERT INTO admin_sessions (token, user_id, created_at, expires_at) VALUES (?, ?, ?, ?)",
-        (token, row["id"], _utc_now(), expires_at),
+        (token, row["id"], now, expires_at),
     )
     db.commit()
-    return jsonify({"token": token, "expires_at": expires_at})
+    return jsonify({"token": token, "expires_at": _iso(expires_at)})
 
 
 @app.route("/admin/codes", methods=["POST"])
@@ -282,7 +969,26 @@ def list_codes():
         return jsonify({"error": "unauthorized"}), 401
     db = get_db()
     rows = db.execute("SELECT * FROM access_codes ORDER BY created_at DESC").fetchall()
-    return jsonify([dict(row) for row in rows])
+    return jsonify([_row_json(row) for row in rows])
+
+
+CODE_FILTERS = {
+    "active": "revoked_at IS NULL AND (expires_at IS NULL OR expires_at > :now)",
+    "expired": "revoked_at IS NULL AND expires_at <= :now",
+    "revoked": "revoked_at IS NOT NULL",
+}
+
+
+@app.route("/admin/codes/<any(active, expired, revoked):state>", methods=["GET"])
+def list_codes_by_state(state: str):
+    if require_admin() is None:
+        return jsonify({"error": "unauthorized"}), 401
+    db = get_db()
+    rows = db.execute(
+        f"SELECT * FROM access_codes WHERE {CODE_FILTERS[state]} ORDER BY created_at DESC",
+        {"now": _now_ts()},
+    ).fetchall()
+    return jsonify([_row_json(row) for row in rows])
 
 
 @app.route("/admin/codes/<int:code_id>/revoke", methods=["POST"])
@@ -290,9 +996,22 @@ def revoke_code(code_id: int):
     if require_admin() is None:
         return jsonify({"error": "unauthorized"}), 401
     db = get_db()
-    db.execute("UPDATE access_codes SET revoked_at = ? WHERE id = ?", (_utc_now(), code_id))
-    db.execute("UPDATE code_usages SET revoked_at = ? WHERE code_id = ?", (_utc_now(), code_id))
+    # Take the write lock before reading so concurrent revokes cannot both count the transition
+    db.execute("BEGIN IMMEDIATE")
+    row = db.execute("SELECT code, expires_at, revoked_at FROM access_codes WHERE id = ?", (code_id,)).fetchone()
+    now = _now_ts()
+    db.execute("UPDATE access_codes SET revoked_at = ? WHERE id = ? AND revoked_at IS NULL", (now, code_id))
+    db.execute("UPDATE code_usages SET revoked_at = ? WHERE code_id = ? AND revoked_at IS NULL", (now, code_id))
+    if row is not None and row["revoked_at"] is None:
+        _stat_total(db, "codes_unrevoked", -1)
+        _stat_daily(db, "codes_revoked", now)
+        if row["expires_at"] is not None:
+            _stat_daily(db, "codes_expiring", row["expires_at"], -1)
+    if row is not None:
+        _bump_cache_generation(db)
     db.commit()
+    if row is not None:
+        status_cache.invalidate_code(row["code"])
     return jsonify({"status": "revoked"})
 
 
@@ -305,17 +1024,21 @@ def extend_code(code_id: int):
     if days <= 0:
         return jsonify({"error": "invalid_days"}), 400
     db = get_db()
-    row = db.execute("SELECT expires_at FROM access_codes WHERE id = ?", (code_id,)).fetchone()
+    db.execute("BEGIN IMMEDIATE")
+    row = db.execute("SELECT code, expires_at, revoked_at FROM access_codes WHERE id = ?", (code_id,)).fetchone()
     if row is None:
         return jsonify({"error": "not_found"}), 404
-    if row["expires_at"]:
-        base = _parse_utc(row["expires_at"])
-    else:
-        base = datetime.now(timezone.utc)
-    new_exp = (base + timedelta(days=days)).isoformat(timespec="seconds")
+    base = row["expires_at"] if row["expires_at"] is not None else _now_ts()
+    new_exp = base + int(timedelta(days=days).total_seconds())
     db.execute("UPDATE access_codes SET expires_at = ? WHERE id = ?", (new_exp, code_id))
+    if row["revoked_at"] is None:
+        if row["expires_at"] is not None:
+            _stat_daily(db, "codes_expiring", row["expires_at"], -1)
+        _stat_daily(db, "codes_expiring", new_exp)
+    _bump_cache_generation(db)
     db.commit()
-    return jsonify({"expires_at": new_exp})
+    status_cache.invalidate_code(row["code"])
+    return jsonify({"expires_at": _iso(new_exp)})
 
 
 @app.route("/admin/machines", methods=["GET"])
@@ -324,7 +1047,7 @@ def list_machines():
         return jsonify({"error": "unauthorized"}), 401
     db = get_db()
     rows = db.execute("SELECT * FROM machines ORDER BY last_seen_at DESC").fetchall()
-    return jsonify([dict(row) for row in rows])
+    return jsonify([_row_json(row) for row in rows])
 
 
 @app.route("/admin/usages", methods=["GET"])
@@ -341,7 +1064,92 @@ def list_usages():
         ORDER BY code_usages.used_at DESC
         """
     ).fetchall()
-    return jsonify([dict(row) for row in rows])
+    return jsonify([_row_json(row) for row in rows])
+
+
+def collect_stats(db: sqlite3.Connection, days: int = 30) -> dict:
+    now = _now_ts()
+    today = now // DAY_SECONDS
+    first_day = today - days + 1
+    totals = {row["name"]: row["value"] for row in db.execute("SELECT name, value FROM stats_totals")}
+    daily: dict = {}
+    for row in db.execute(
+        "SELECT metric, day, value FROM stats_daily WHERE metric IN (?, ?, ?, ?) AND day >= ?",
+        ("codes_created", "codes_revoked", "redemptions", "machines_new", min(first_day, today - 6)),
+    ):
+        daily.setdefault(row["metric"], {})[row["day"]] = row["value"]
+    # Whole days in the past are summed from their buckets; only today needs the expires_at index
+    expired = db.execute(
+        "SELECT COALESCE(SUM(value), 0) FROM stats_daily WHERE metric = 'codes_expiring' AND day < ?",
+        (today,),
+    ).fetchone()[0]
+    expired += db.execute(
+        """
+        SELECT COUNT(*) FROM access_codes
+        WHERE expires_at >= ? AND expires_at <= ? AND revoked_at IS NULL
+        """,
+        (today * DAY_SECONDS, now),
+    ).fetchone()[0]
+    week_start = now - 7 * DAY_SECONDS
+    seen_week = db.execute("SELECT COUNT(*) FROM machines WHERE last_seen_at >= ?", (week_start,)).fetchone()[0]
+
+    def _series(metric: str) -> list:
+        values = daily.get(metric, {})
+        return [
+            {"date": _iso(day * DAY_SECONDS)[:10], "count": values.get(day, 0)}
+            for day in range(first_day, today + 1)
+        ]
+
+    def _last(metric: str, count: int) -> int:
+        values = daily.get(metric, {})
+        return sum(values.get(day, 0) for day in range(today - count + 1, today + 1))
+
+    unrevoked = totals.get("codes_unrevoked", 0)
+    return {
+        "generated_at": _iso(now),
+        "days": days,
+        "codes": {
+            "total": totals.get("codes", 0),
+            "active": unrevoked - expired,
+            "expired": expired,
+            "revoked": totals.get("codes", 0) - unrevoked,
+            "created_per_day": _series("codes_created"),
+            "revoked_per_day": _series("codes_revoked"),
+        },
+        "redemptions": {
+            "total": totals.get("redemptions", 0),
+            "today": _last("redemptions", 1),
+            "last_7_days": _last("redemptions", 7),
+            "per_day": _series("redemptions"),
+        },
+        "machines": {
+            "total": totals.get("machines", 0),
+            "new_last_7_days": _last("machines_new", 7),
+            "seen_last_7_days": seen_week,
+            "new_per_day": _series("machines_new"),
+        },
+    }
+
+
+@app.route("/admin/stats", methods=["GET"])
+def admin_stats():
+    if require_admin() is None:
+        return jsonify({"error": "unauthorized"}), 401
+    try:
+        days = int(request.args.get("days", 30))
+    except ValueError:
+        return jsonify({"error": "invalid_days"}), 400
+    if not 1 <= days <= STATS_MAX_DAYS:
+        return jsonify({"error": "invalid_days"}), 400
+    return jsonify(collect_stats(get_db(), days))
+
+
+CODE_STATE_QUERY = """
+    SELECT id, code, expires_at, revoked_at,
+           expires_at IS NOT NULL AND expires_at <= :now AS expired
+    FROM access_codes
+    WHERE code = :code
+"""
 
 
 @app.route("/client/redeem", methods=["POST"])
@@ -352,25 +1160,27 @@ def client_redeem():
     if not code or not fingerprint:
         return jsonify({"error": "missing_fields"}), 400
     db = get_db()
-    code_row = db.execute("SELECT * FROM access_codes WHERE code = ?", (code,)).fetchone()
+    now = _now_ts()
+    code_row = db.execute(CODE_STATE_QUERY, {"code": code, "now": now}).fetchone()
     if code_row is None:
         return jsonify({"error": "invalid_code"}), 404
-    if code_row["revoked_at"]:
+    if code_row["revoked_at"] is not None:
         return jsonify({"error": "revoked"}), 403
-    if code_row["expires_at"] and _parse_utc(code_row["expires_at"]) < datetime.now(timezone.utc):
+    if code_row["expired"]:
         return jsonify({"error": "expired"}), 403
 
     machine = db.execute("SELECT * FROM machines WHERE fingerprint = ?", (fingerprint,)).fetchone()
     if machine is None:
         db.execute(
             "INSERT INTO machines (fingerprint, first_seen_at, last_seen_at) VALUES (?, ?, ?)",
-            (fingerprint, _utc_now(), _utc_now()),
+            (fingerprint, now, now),
         )
+        _stat_total(db, "machines")
+        _stat_daily(db, "machines_new", now)
         db.commit()
         machine = db.execute("SELECT * FROM machines WHERE fingerprint = ?", (fingerprint,)).fetchone()
     else:
-        db.execute("UPDATE machines SET last_seen_at = ? WHERE id = ?", (_utc_now(), machine["id"]))
-        db.commit()
+        last_seen_buffer.touch(machine["id"], now)
 
     usage = db.execute(
         "SELECT id, used_at, machine_id FROM code_usages WHERE code_id = ?",
@@ -378,11 +1188,13 @@ def client_redeem():
     ).fetchone()
     activated_at = None
     if usage is None:
-        activated_at = _utc_now()
+        activated_at = now
         db.execute(
             "INSERT INTO code_usages (code_id, machine_id, used_at, revoked_at) VALUES (?, ?, ?, NULL)",
             (code_row["id"], machine["id"], activated_at),
         )
+        _stat_total(db, "redemptions")
+        _stat_daily(db, "redemptions", activated_at)
         db.commit()
     elif usage["machine_id"] != machine["id"]:
         return jsonify({"error": "already_used"}), 403
@@ -392,8 +1204,8 @@ def client_redeem():
     return jsonify(
         {
             "status": "active",
-            "expires_at": code_row["expires_at"],
-            "activated_at": activated_at,
+            "expires_at": _iso(code_row["expires_at"]),
+            "activated_at": _iso(activated_at),
         }
     )
 
@@ -404,28 +1216,151 @@ def client_status():
     code = payload.get("code", "").strip()
     fingerprint = payload.get("fingerprint", "").strip()
     if not code or not fingerprint:
-        return jsonify({"error": "missing_fields"}), 400
+        return _status_error("missing_fields", 400)
     db = get_db()
-    code_row = db.execute("SELECT * FROM access_codes WHERE code = ?", (code,)).fetchone()
+    status_cache.sync_generation(_cache_generation(db))
+    cached = status_cache.get(code, fingerprint)
+    if cached is not None:
+        return _status_response(cached)
+    code_row = db.execute(CODE_STATE_QUERY, {"code": code, "now": _now_ts()}).fetchone()
     if code_row is None:
-        return jsonify({"error": "invalid_code"}), 404
-    if code_row["revoked_at"]:
-        return jsonify({"error": "revoked"}), 403
-    if code_row["expires_at"] and _parse_utc(code_row["expires_at"]) < datetime.now(timezone.utc):
-        return jsonify({"error": "expired"}), 403
+        return _status_error("invalid_code", 404)
+    if code_row["revoked_at"] is not None:
+        return _status_error("revoked", 403)
+    if code_row["expired"]:
+        return _status_error("expired", 403)
 
     machine = db.execute("SELECT * FROM machines WHERE fingerprint = ?", (fingerprint,)).fetchone()
     if machine is None:
-        return jsonify({"error": "machine_unknown"}), 403
+        return _status_error("machine_unknown", 403)
 
     usage = db.execute(
         "SELECT id, revoked_at FROM code_usages WHERE code_id = ? AND machine_id = ?",
         (code_row["id"], machine["id"]),
     ).fetchone()
     if usage is None or usage["revoked_at"]:
-        return jsonify({"error": "not_redeemed"}), 403
+        return _status_error("not_redeemed", 403)
 
-    return jsonify({"status": "active", "expires_at": code_row["expires_at"]})
+    entry = _build_status_entry(code, fingerprint, code_row["expires_at"])
+    status_cache.put(code, fingerprint, entry)
+    return _status_response(entry)
+
+
+ARCHIVE_QUERIES = (
+    ("admin_sessions", "SELECT * FROM admin_sessions WHERE expires_at < :cutoff"),
+    (
+        "code_usages",
+        """
+        SELECT code_usages.* FROM code_usages
+        JOIN access_codes ON access_codes.id = code_usages.code_id
+        WHERE access_codes.revoked_at < :cutoff
+        """,
+    ),
+    (
+        "machines",
+        """
+        SELECT * FROM machines
+        WHERE last_seen_at < :cutoff
+          AND NOT EXISTS (SELECT 1 FROM code_usages WHERE code_usages.machine_id = machines.id)
+        """,
+    ),
+)
+
+
+# Archived rows leave the counters they were added to: (stats_totals name, stats_daily metric, day column)
+ARCHIVE_STATS = {
+    "code_usages": ("redemptions", "redemptions", "used_at"),
+    "machines": ("machines", "machines_new", "first_seen_at"),
+}
+
+
+def _unstat_archived(db: sqlite3.Connection, table: str, rows: list) -> None:
+    if table not in ARCHIVE_STATS or not rows:
+        return
+    total, metric, column = ARCHIVE_STATS[table]
+    _stat_total(db, total, -len(rows))
+    per_day = Counter(row[column] // DAY_SECONDS for row in rows)
+    for day, count in per_day.items():
+        _stat_daily(db, metric, day * DAY_SECONDS, -count)
+
+
+def _db_file_size() -> int:
+    return sum(
+        path.stat().st_size
+        for path in (DB_PATH, Path(f"{DB_PATH}-wal"))
+        if path.exists()
+    )
+
+
+def archive_old_rows(days: int, archive_dir: Path, dry_run: bool = False) -> dict:
+    init_db()
+    cutoff = _now_ts() - int(timedelta(days=days).total_seconds())
+    size_before = _db_file_size()
+    db = sqlite3.connect(DB_PATH, timeout=DB_BUSY_TIMEOUT)
+    db.row_factory = sqlite3.Row
+    archived = {}
+    archive_path = None
+    try:
+        db.execute("BEGIN IMMEDIATE")
+        batches = []
+        for table, query in ARCHIVE_QUERIES:
+            rows = db.execute(query, {"cutoff": cutoff}).fetchall()
+            archived[table] = len(rows)
+            batches.append((table, rows))
+            if rows:
+                ids = [row["id"] for row in rows]
+                for start in range(0, len(ids), 500):
+                    chunk = ids[start:start + 500]
+                    db.execute(
+                        f"DELETE FROM {table} WHERE id IN ({','.join('?' * len(chunk))})",
+                        chunk,
+                    )
+                _unstat_archived(db, table, rows)
+        if dry_run or not any(archived.values()):
+            db.rollback()
+        else:
+            archive_dir.mkdir(parents=True, exist_ok=True)
+            stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+            archive_path = archive_dir / f"adminpanel-archive-{stamp}.jsonl.gz"
+            tmp_path = archive_path.with_name(archive_path.name + ".tmp")
+            with gzip.open(tmp_path, "wt", encoding="utf-8") as handle:
+                for table, rows in batches:
+                    for row in rows:
+                        handle.write(json.dumps({"table": table, "row": _row_json(row)}, ensure_ascii=False))
+                        handle.write("\n")
+            os.replace(tmp_path, archive_path)
+            db.commit()
+    except Exception:
+        if db.in_transaction:
+            db.rollback()
+        db.close()
+        raise
+
+    freelist_before = db.execute("PRAGMA freelist_count").fetchone()[0]
+    if not dry_run:
+        if db.execute("PRAGMA auto_vacuum").fetchone()[0] != 2:
+            db.execute("PRAGMA auto_vacuum=INCREMENTAL")
+            db.execute("VACUUM")
+        else:
+            db.execute("PRAGMA incremental_vacuum")
+        db.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+    freelist_after = db.execute("PRAGMA freelist_count").fetchone()[0]
+    page_size = db.execute("PRAGMA page_size").fetchone()[0]
+    db.close()
+
+    size_after = _db_file_size()
+    return {
+        "cutoff": _iso(cutoff),
+        "dry_run": dry_run,
+        "archived": archived,
+        "archive_file": str(archive_path) if archive_path else None,
+        "freelist_pages_before": freelist_before,
+        "freelist_pages_after": freelist_after,
+        "page_size": page_size,
+        "db_bytes_before": size_before,
+        "db_bytes_after": size_after,
+        "reclaimed_bytes": size_before - size_after,
+    }
 
 
 def _build_cli_parser() -> argparse.ArgumentParser:
@@ -434,9 +1369,44 @@ def _build_cli_parser() -> argparse.ArgumentParser:
     gen = subparsers.add_parser("generate-code", help="Generate a one-time access code")
     gen.add_argument("--issued-to", dest="issued_to", default=None)
     gen.add_argument("--days", dest="days", type=int, default=None)
+    srv = subparsers.add_parser("serve", help="Run the panel under the waitress WSGI server")
+    srv.add_argument("--host", default=os.environ.get("ADMINPANEL_HOST", "0.0.0.0"))
+    srv.add_argument(
+        "--port", type=int, default=int(os.environ.get("ADMINPANEL_PORT", "8000"))
+    )
+    srv.add_argument("--threads", type=int, default=SERVE_THREADS)
+    arc = subparsers.add_parser("archive", help="Archive old sessions, usages and machines, then vacuum")
+    arc.add_argument("--days", type=int, default=RETENTION_DAYS)
+    arc.add_argument("--archive-dir", dest="archive_dir", type=Path, default=ARCHIVE_DIR)
+    arc.add_argument("--dry-run", dest="dry_run", action="store_true")
+    subparsers.add_parser("rebuild-stats", help="Recount the /admin/stats summary tables from current rows")
     return parser
 
 
+def serve(host: str, port: int, threads: int) -> int:
+    try:
+        from waitress import create_server
+    except ImportError:
+        print("waitress is not installed: pip install waitress", file=sys.stderr)
+        return 1
+
+    def _stop(signum, frame):
+        raise SystemExit(0)
+
+    init_db()
+    server = create_server(app, host=host, port=port, threads=threads)
+    signal.signal(signal.SIGTERM, _stop)
+    print(f"[SERVE] http://{host}:{port} threads={threads}", flush=True)
+    try:
+        server.run()
+    except (KeyboardInterrupt, SystemExit):
+        pass
+    finally:
+        server.close()
+        close_all_connections()
+    return 0
+
+
 def _handle_cli() -> int:
     parser = _build_cli_parser()
     args = parser.parse_args()
@@ -453,6 +1423,21 @@ def _handle_cli() -> int:
         )
         print(json.dumps({"code": code, "expires_at": expires_at}, ensure_ascii=False))
         return 0
+    if args.command == "serve":
+        return serve(args.host, args.port, args.threads)
+    if args.command == "archive":
+        report = archive_old_rows(args.days, args.archive_dir, dry_run=args.dry_run)
+        print(json.dumps(report, ensure_ascii=False))
+        return 0
+    if args.command == "rebuild-stats":
+        init_db()
+        db = sqlite3.connect(DB_PATH)
+        with db:
+            rebuild_stats(db)
+        totals = dict(db.execute("SELECT name, value FROM stats_totals"))
+        db.close()
+        print(json.dumps(totals, ensure_ascii=False))
+        return 0
     return 1
 
 
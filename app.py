@@ -3,29 +3,34 @@
 from license import check_license_or_exit
 check_license_or_exit()
 
+import abc
 import os
 import sys
 import re
 import csv
-import json
 import asyncio
 import faulthandler
+import logging
+import logging.handlers
 import threading
 import time
 import traceback
-import zipfile
 import shutil
-from dataclasses import dataclass, asdict
+import weakref
+from concurrent.futures import Future
+from dataclasses import asdict
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Optional, List, Dict, Tuple, Callable
+from types import MappingProxyType
+from typing import Optional, List, Dict, Tuple, Callable, Mapping
 
 from PyQt6.QtCore import Qt, QThread, pyqtSignal, QObject, QTimer, QSize, QPoint, QPointF, QRect, QRectF, QPropertyAnimation, QEasingCurve, QUrl
 from PyQt6 import sip
-from PyQt6.QtGui import QColor, QPainter, QPixmap, QIcon, QFont, QLinearGradient, QPen, QBrush, QDesktopServices, QPainterPath
+from PyQt6.QtGui import QColor, QPainter, QPixmap, QIcon, QFont, QLinearGradient, QPen, QBrush, QDesktopServices, QPainterPath, QTextCursor, QTextDocument
 from PyQt6.QtWidgets import (
     QTextBrowser,
     QPlainTextEdit,
+    QPlainTextDocumentLayout,
     QScrollArea,
     QApplication,
     QMainWindow,
@@ -69,69 +74,61 @@ from telethon.errors import (
     SessionPasswordNeededError,
     FloodWaitError,
     PasswordHashInvalidError,
-    SendCodeUnavailableError,
 )
 from telethon.tl.functions.messages import SendMessageRequest
 
 import adminapp
+from core import (
+    ACCOUNTS_FILE,
+    ACCOUNTS_STATUS_FILE,
+    BASE_DIR,
+    BOTFATHER_USERNAME_DEFAULT,
+    CONFIG_FILE,
+    FROZEN_FILE,
+    HAMSTERS_FILE,
+    SESSIONS_DIR,
+    AutoConfig,
+    account_registry,
+    backup_sources,
+    ensure_file,
+    extract_created_username,
+    extract_token,
+    extract_try_again_seconds,
+    has_too_many_bots,
+    is_manual_prompt,
+    job_journal,
+    load_bot_records,
+    load_config,
+    load_json,
+    parse_usernames,
+    safe_int,
+    sanitize_base,
+    save_json,
+    token_history,
+)
+from management import BotFatherOps, request_login_code
+from backups import BackupStore, recover_interrupted_restore, restore_zip
+from exports import EXPORT_FORMATS, ExportFilter, export_tokens
+from jobs import ManagementJob
+from loghistory import LogHistory, LogQuery, open_run_logger
+from loop_service import loop_service
+from profiling import ActionProfiler
+from storage import state_writer
+from tokens import BotRecord, BotRecords, write_bot_records
 
 APP_NAME = "BOTFACTORY"
 BYLINE = "by whynot"
 ADMIN_API_BASE = os.environ.get("ADMIN_API_BASE", "http://155.212.168.79:8000")
 adminapp.ADMIN_API_BASE = ADMIN_API_BASE
+action_profiler = ActionProfiler(BASE_DIR / "profiles")
 
 _CRASH_LOG_HANDLE = None
+_PERFORMANCE_RENDERING = False
+_SHADOWED_WIDGETS: "weakref.WeakSet[QWidget]" = weakref.WeakSet()
 
-BASE_DIR = Path(__file__).resolve().parent
-SESSIONS_DIR = BASE_DIR / "sessions"
-ACCOUNTS_FILE = BASE_DIR / "accounts_tg.txt"
-CONFIG_FILE = BASE_DIR / "config.json"
-HAMSTERS_FILE = BASE_DIR / "hamsters.json"
-FROZEN_FILE = BASE_DIR / "frozen.json"
-ACCOUNTS_STATUS_FILE = BASE_DIR / "accounts_status.json"
-SESSIONS_DIR.mkdir(parents=True, exist_ok=True)
-
-BOTFATHER_USERNAME_DEFAULT = "BotFather"
-
-def parse_accounts(path: Path) -> List[Dict]:
-    accs = []
-    if not path.exists():
-        return accs
-    for raw in path.read_text(encoding="utf-8").splitlines():
-        line = raw.strip()
-        if not line or line.startswith("#"):
-            continue
-        parts = line.split(":")
-        if len(parts) < 4:
-            continue
-        phone, pwd, api_id, api_hash = parts[:4]
-        try:
-            parsed_api_id = int(api_id.strip())
-        except ValueError:
-            continue
-        accs.append({
-            "phone": phone.strip(),
-            "password": None if pwd.strip().upper() == "UNKOWN" else pwd.strip(),
-            "api_id": parsed_api_id,
-            "api_hash": api_hash.strip(),
-        })
-    return accs
-
-def ensure_file(path: Path):
-    if not path.exists():
-        path.parent.mkdir(parents=True, exist_ok=True)
-        path.write_text("", encoding="utf-8")
-
-def safe_int(s: str, default: int = 0) -> int:
-    try:
-        return int(s)
-    except:
-        return default
-
-def translate_log_message(text: str, lang: str) -> str:
-    if lang != "English":
-        return text
-    patterns = [
+LOG_TRANSLATIONS_EN: Tuple[Tuple[re.Pattern, str], ...] = tuple(
+    (re.compile(pattern), repl)
+    for pattern, repl in (
         (r"^\[RATE\] Ждём (\d+) сек\.\.\.$", r"[RATE] Waiting \1s..."),
         (r"^\[WARN\] Нет запроса имени от BotFather\. \(Возможно лимит 20 ботов$", r"[WARN] No name request from BotFather. (Possibly 20-bot limit"),
         (r"^\[WARN\] Нет запроса username от BotFather\. \(Возможно лимит 20 ботов$", r"[WARN] No username request from BotFather. (Possibly 20-bot limit"),
@@ -174,94 +171,33 @@ def translate_log_message(text: str, lang: str) -> str:
         (r"^\[INFO\] Массовый revoke: (\d+) ботов\.$", r"[INFO] Mass revoke: \1 bots."),
         (r"^\[INFO\] Авто-режим\. Хомяк: (.+)$", r"[INFO] Auto mode. Hamster: \1"),
         (r"^\[INFO\] Stop запрошен\.$", r"[INFO] Stop requested."),
+        (r"^\[INFO\] Задача отменена\.$", r"[INFO] Task cancelled."),
+        (r"^\[TOKEN\] @(\S+): актуальный токен v(\d+)$", r"[TOKEN] @\1: current token v\2"),
+        (r"^\[WARN\] История токенов: (.+)$", r"[WARN] Token history: \1"),
+        (r"^\[EXPORT\] Экспортировано (\d+) токенов: (.+)$", r"[EXPORT] Exported \1 tokens: \2"),
+        (r"^\[JOB\] Продолжение задачи (\S+): осталось (\d+) из (\d+)\.$", r"[JOB] Resuming job \1: \2 of \3 left."),
+        (r"^\[JOB\] Задача (\S+): выполнено (\d+), ошибок (\d+), пропущено (\d+), осталось (\d+)\.$", r"[JOB] Job \1: \2 done, \3 failed, \4 skipped, \5 pending."),
+        (r"^\[WARN\] Журнал задачи: (.+)$", r"[WARN] Job journal: \1"),
         (r"^\[INFO\] Работаю\.\.\. \(heartbeat\)$", r"[INFO] Working... (heartbeat)"),
         (r"^\[OK\] Картинка: (.+)$", r"[OK] Image: \1"),
-    ]
-    for pattern, repl in patterns:
-        if re.match(pattern, text):
-            return re.sub(pattern, repl, text)
-    return text
-
-def parse_usernames(raw: str) -> List[str]:
-    if not raw:
-        return []
-    parts = re.split(r"[\\s/]+", raw.strip())
-    seen = set()
-    result = []
-    for part in parts:
-        name = part.strip().lstrip("@")
-        if not name or name in seen:
-            continue
-        seen.add(name)
-        result.append(name)
-    return result
-
-def extract_try_again_seconds(text: str) -> Optional[int]:
-    if not text:
-        return None
-    patterns = [
-        r"Please try again in (\d+) seconds",
-        r"Попробуйте снова через (\d+)\s*сек",
-        r"Повторите через (\d+)\s*сек",
-        r"Try again in (\d+) seconds",
-    ]
-    for pattern in patterns:
-        m = re.search(pattern, text, re.IGNORECASE)
-        if m:
-            return int(m.group(1))
-    return None
-
-def extract_created_username(text: str) -> Optional[str]:
-    if not text:
-        return None
-    m = re.search(r"(?:t\.me/|@)([A-Za-z0-9_]{4,})", text)
-    return m.group(1) if m else None
+        (r"^\[BACKUP\] Снимок ([^:]+): файлов (\d+), без изменений (\d+), записано (\d+) КБ$", r"[BACKUP] Snapshot \1: \2 files, \3 unchanged, \4 KB written"),
+        (r"^\[BACKUP\] Удалено старых снимков: (\d+), фрагментов: (\d+) \((\d+) КБ\)$", r"[BACKUP] Removed old snapshots: \1, chunks: \2 (\3 KB)"),
+        (r"^\[PROFILE\] Профилирование включено: следующие (\d+) действий и следующий запуск задачи\.$", r"[PROFILE] Profiling armed: next \1 actions and the next job run."),
+        (r"^\[PROFILE\] Профилирование выключено\.$", r"[PROFILE] Profiling disarmed."),
+        (r"^\[PROFILE\] (\S+): (\d+) мс, профиль: (.+)$", r"[PROFILE] \1: \2 ms, profile: \3"),
+        (r"^\[PROFILE\] (\S+): (\d+) мс, профиль не сохранён$", r"[PROFILE] \1: \2 ms, profile not saved"),
+        (r"^\[PROFILE\] +всего +своё +вызовы +функция$", r"[PROFILE]       total       own    calls  function"),
+        (r"^\[PERF\] Кадр: с тенями ([\d.]+) мс, без теней ([\d.]+) мс$", r"[PERF] Frame: with shadows \1 ms, flat \2 ms"),
+    )
+)
 
-def is_manual_prompt(text: str) -> bool:
-    if not text:
-        return False
-    lowered = text.lower()
-    return "see the manual" in lowered
-
-def extract_token(text: str) -> Optional[str]:
-    # Robust: BotFather token is like 123456789:AA... (base64url-ish)
-    m = re.search(r"\b\d{6,12}:[A-Za-z0-9_-]{20,}\b", text or "")
-    return m.group(0) if m else None
-
-def has_too_many_bots(text: str) -> bool:
-    return "can't add more than 20 bots" in (text or "").lower()
-
-async def request_login_code(
-    client: TelegramClient,
-    phone: str,
-    log: pyqtSignal,
-    stop_cb: Optional[Callable[[], bool]] = None,
-) -> bool:
-    try:
-        await client.send_code_request(phone)
-        return True
-    except SendCodeUnavailableError:
-        if getattr(client, "_phone_code_hash", None):
-            log.emit("[WARN] Код уже был отправлен ранее. Используйте последний код или подождите перед повторной отправкой.")
-            return False
-        log.emit("[ERROR] Нельзя повторно запросить код сейчас. Подождите и попробуйте позже.")
-        raise
-    except FloodWaitError as e:
-        log.emit(f"[RATE] FloodWait {e.seconds}s. Ждём.")
-        if stop_cb:
-            for _ in range(e.seconds):
-                if stop_cb():
-                    return False
-                await asyncio.sleep(1)
-        else:
-            await asyncio.sleep(e.seconds)
-        await client.send_code_request(phone)
-        return True
-def sanitize_base(base: str) -> str:
-    b = base.lower()
-    b = re.sub(r"[^a-z0-9_]", "", b)
-    b = re.sub(r"_+", "_", b).strip("_")
-    return b or "bot"
+def translate_log_message(text: str, lang: str) -> str:
+    if lang != "English":
+        return text
+    for pattern, repl in LOG_TRANSLATIONS_EN:
+        if pattern.match(text):
+            return pattern.sub(repl, text, count=1)
+    return text
 
 def center_on_screen(w: QWidget):
     screen = QApplication.primaryScreen()
@@ -273,12 +209,40 @@ def center_on_screen(w: QWidget):
     w.move(x, y)
 
 def apply_shadow(widget: QWidget, blur: int = 26, alpha: int = 120, offset: QPointF = QPointF(0, 6)):
+    widget.setProperty("shadowSpec", (blur, alpha, offset.x(), offset.y()))
+    _SHADOWED_WIDGETS.add(widget)
+    if _PERFORMANCE_RENDERING:
+        drop_shadow(widget)
+        return
     shadow = QGraphicsDropShadowEffect(widget)
     shadow.setBlurRadius(blur)
     shadow.setColor(QColor(0, 0, 0, alpha))
     shadow.setOffset(offset)
     widget.setGraphicsEffect(shadow)
 
+def drop_shadow(widget: QWidget):
+    if isinstance(widget.graphicsEffect(), QGraphicsDropShadowEffect):
+        widget.setGraphicsEffect(None)
+
+def is_performance_rendering() -> bool:
+    return _PERFORMANCE_RENDERING
+
+def set_performance_rendering(enabled: bool):
+    global _PERFORMANCE_RENDERING
+    _PERFORMANCE_RENDERING = bool(enabled)
+    for widget in list(_SHADOWED_WIDGETS):
+        if not is_widget_alive(widget):
+            _SHADOWED_WIDGETS.discard(widget)
+            continue
+        spec = widget.property("shadowSpec")
+        if not spec:
+            continue
+        blur, alpha, dx, dy = spec
+        if _PERFORMANCE_RENDERING:
+            drop_shadow(widget)
+        elif widget.graphicsEffect() is None:
+            apply_shadow(widget, blur=blur, alpha=alpha, offset=QPointF(dx, dy))
+
 def configure_table(widget):
     try:
         widget.setFrameShape(QFrame.Shape.NoFrame)
@@ -347,7 +311,7 @@ def create_neon_search_icon(size: int = 18, color: QColor = QColor(0, 220, 255))
     return QIcon(pixmap)
 
 def animate_neon_pulse(btn: QWidget, base_color: QColor = QColor(0, 220, 255)):
-    if btn is None or not btn.isVisible():
+    if btn is None or not btn.isVisible() or _PERFORMANCE_RENDERING:
         return
     effect = QGraphicsDropShadowEffect(btn)
     effect.setOffset(0, 0)
@@ -405,7 +369,7 @@ def animate_section_fade(widget: QWidget, duration: int = 220):
     anim.start(QPropertyAnimation.DeletionPolicy.DeleteWhenStopped)
 
 def animate_button_press(btn: QWidget, duration: int = 160):
-    if btn is None or not btn.isVisible():
+    if btn is None or not btn.isVisible() or _PERFORMANCE_RENDERING:
         return
     effect = btn.graphicsEffect()
     if not isinstance(effect, QGraphicsOpacityEffect):
@@ -452,6 +416,68 @@ def install_crash_logger(log_path: Path):
     if hasattr(threading, "excepthook"):
         threading.excepthook = _thread_excepthook
 
+class StallWatchdog:
+    def __init__(self, log_path: Path, threshold_ms: int = 250, max_bytes: int = 1_000_000, backups: int = 3):
+        self.threshold = max(threshold_ms, 20) / 1000
+        self.stalls = 0
+        self._gui_ident = threading.get_ident()
+        self._last_beat = time.monotonic()
+        self._stop = threading.Event()
+        self._timer = QTimer()
+        self._timer.setInterval(max(10, threshold_ms // 5))
+        self._timer.timeout.connect(self._beat)
+        self._thread = threading.Thread(target=self._watch, name="gui-stall-watchdog", daemon=True)
+        log_path.parent.mkdir(parents=True, exist_ok=True)
+        self._logger = logging.getLogger("botfactory.stalls")
+        self._logger.propagate = False
+        self._logger.setLevel(logging.INFO)
+        if not self._logger.handlers:
+            handler = logging.handlers.RotatingFileHandler(log_path, maxBytes=max_bytes, backupCount=backups, encoding="utf-8")
+            handler.setFormatter(logging.Formatter("[%(asctime)s] %(message)s"))
+            self._logger.addHandler(handler)
+
+    def start(self):
+        self._last_beat = time.monotonic()
+        self._timer.start()
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._timer.stop()
+
+    def _beat(self):
+        self._last_beat = time.monotonic()
+
+    def _watch(self):
+        stalled_since = None
+        next_dump = self.threshold
+        while not self._stop.wait(self.threshold / 4):
+            beat = self._last_beat
+            lag = time.monotonic() - beat
+            if stalled_since is not None and beat != stalled_since:
+                self._logger.info(f"[STALL] end: GUI thread blocked {(beat - stalled_since) * 1000:.0f} ms\n")
+                stalled_since = None
+                next_dump = self.threshold
+            if lag < next_dump:
+                continue
+            if stalled_since is None:
+                stalled_since = beat
+                self.stalls += 1
+            self._dump(lag)
+            next_dump *= 2
+
+    def _dump(self, lag: float):
+        frame = sys._current_frames().get(self._gui_ident)
+        stack = "".join(traceback.format_stack(frame)) if frame is not None else "<no frame>\n"
+        self._logger.info(f"[STALL] #{self.stalls}: event loop not responding for {lag * 1000:.0f} ms\n{stack}")
+
+def install_stall_watchdog(log_path: Path, threshold_ms: int) -> Optional[StallWatchdog]:
+    if threshold_ms <= 0:
+        return None
+    watchdog = StallWatchdog(log_path, threshold_ms)
+    watchdog.start()
+    return watchdog
+
 def animate_evaporate_rect(parent: QWidget, rect: QRect, on_done=None):
     if parent is None or rect.isNull():
         if on_done:
@@ -506,6 +532,8 @@ def animate_press(widget: QWidget, duration: int = 120, delta: int = 2):
 
 class ActionAnimator(QObject):
     def eventFilter(self, obj, event):
+        if _PERFORMANCE_RENDERING:
+            return super().eventFilter(obj, event)
         if event.type() == event.Type.MouseButtonPress and isinstance(obj, (QPushButton, QToolButton)):
             if isinstance(obj, QWidget) and obj.property("noPressAnim"):
                 return super().eventFilter(obj, event)
@@ -738,49 +766,6 @@ def show_multiline_dialog(parent: QWidget, title: str, prompt: str, placeholder:
         return entry.toPlainText().strip()
     return None
 
-def load_json(path: Path, default):
-    try:
-        if path.exists():
-            return json.loads(path.read_text(encoding="utf-8"))
-    except:
-        pass
-    return default
-
-def save_json(path: Path, data):
-    path.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
-
-@dataclass
-class AutoConfig:
-    botfather: str = BOTFATHER_USERNAME_DEFAULT
-    name_prefix: str = "ОРИГ С ТТ❤️"
-    name_suffix: str = ""
-    username_suffix: str = "_bot"
-    numbered_separator: str = "_"
-    numbered_suffix: str = "bot"
-    max_number_attempts: int = 5
-    sanitize_username: bool = True
-    tokens_txt: str = "tokens.txt"
-    tokens_csv: str = "tokens.csv"
-    revoked_tokens_txt: str = "revoked_tokens.txt"
-    per_account_limit: int = 2
-    freeze_threshold_seconds: int = 350
-    force_setuserpic_delay1: float = 1.0
-    force_setuserpic_delay2: float = 1.0
-    first_run_done: bool = False
-    language: str = "Русский"
-
-    def tokens_txt_path(self) -> Path:
-        p = Path(self.tokens_txt)
-        return p if p.is_absolute() else BASE_DIR / p
-
-    def tokens_csv_path(self) -> Path:
-        p = Path(self.tokens_csv)
-        return p if p.is_absolute() else BASE_DIR / p
-
-    def revoked_tokens_txt_path(self) -> Path:
-        p = Path(self.revoked_tokens_txt)
-        return p if p.is_absolute() else BASE_DIR / p
-
 class PromptBridge(QObject):
     request_code = pyqtSignal(str)
     request_password = pyqtSignal(str)
@@ -789,8 +774,8 @@ class PromptBridge(QObject):
         super().__init__()
         self._code = ""
         self._pwd = ""
-        self._ev_code = asyncio.Event()
-        self._ev_pwd = asyncio.Event()
+        self._ev_code: Optional[asyncio.Event] = None
+        self._ev_pwd: Optional[asyncio.Event] = None
 
     async def get_code(self, phone: str) -> str:
         self._code = ""
@@ -808,11 +793,51 @@ class PromptBridge(QObject):
 
     def set_code(self, code: str):
         self._code = code.strip()
-        self._ev_code.set()
+        if self._ev_code is not None:
+            loop_service.call_soon(self._ev_code.set)
 
     def set_password(self, pwd: str):
         self._pwd = pwd
-        self._ev_pwd.set()
+        if self._ev_pwd is not None:
+            loop_service.call_soon(self._ev_pwd.set)
+
+class _AsyncJobMeta(type(QObject), abc.ABCMeta):
+    pass
+
+class AsyncJob(QObject, metaclass=_AsyncJobMeta):
+    log = pyqtSignal(str)
+    finished_ok = pyqtSignal()
+    cancelled = pyqtSignal()
+
+    def __init__(self):
+        super().__init__()
+        self.future: Optional[Future] = None
+
+    def start(self):
+        self.future = loop_service.submit(action_profiler.wrap_coroutine(type(self).__name__, self._run_job()))
+
+    def isRunning(self) -> bool:
+        return self.future is not None and not self.future.done()
+
+    def cancel(self):
+        if self.future is not None:
+            self.future.cancel()
+
+    async def _run_job(self):
+        try:
+            await self._run_async()
+        except asyncio.CancelledError:
+            self.log.emit("[INFO] Задача отменена.")
+            self.cancelled.emit()
+            raise
+        except Exception as e:
+            self.log.emit(f"[ERROR] {e}")
+            return
+        self.finished_ok.emit()
+
+    @abc.abstractmethod
+    async def _run_async(self):
+        ...
 
 def neon_icon(kind: str, size: int = 14) -> QIcon:
     pm = QPixmap(size, size)
@@ -1365,6 +1390,30 @@ class OnboardingOverlay(QWidget):
             painter = QPainter(self)
             painter.fillRect(self.rect(), QColor(6, 10, 18, 210))
 
+LOG_MAX_BLOCKS = 5000
+
+class LogDocument(QObject):
+    appended = pyqtSignal()
+
+    def __init__(self, parent: Optional[QObject] = None, max_blocks: int = LOG_MAX_BLOCKS):
+        super().__init__(parent)
+        self.document = QTextDocument(self)
+        self.document.setDocumentLayout(QPlainTextDocumentLayout(self.document))
+        self.document.setUndoRedoEnabled(False)
+        self.document.setMaximumBlockCount(max_blocks)
+        self._cursor = QTextCursor(self.document)
+
+    def append(self, s: str):
+        # One document and one layout pass per line, however many LogBoxes view it
+        self._cursor.movePosition(QTextCursor.MoveOperation.End)
+        if not self.document.isEmpty():
+            self._cursor.insertBlock()
+        self._cursor.insertText(s)
+        self.appended.emit()
+
+    def clear(self):
+        self.document.clear()
+
 class LogBox(QFrame):
     def __init__(self):
         super().__init__()
@@ -1426,23 +1475,25 @@ class LogBox(QFrame):
 
         lay.addWidget(self.text)
 
-    def append(self, s: str):
-        # Do not resize the UI: log area is scrollable and has fixed max height
-        self.text.appendPlainText(s)
+    def attach(self, log_document: LogDocument):
+        self.text.setDocument(log_document.document)
+        log_document.appended.connect(self._scroll_to_end)
+        self._scroll_to_end()
+
+    def _scroll_to_end(self):
         sb = self.text.verticalScrollBar()
         sb.setValue(sb.maximum())
 
-class Worker(QThread):
+class Worker(AsyncJob, BotFatherOps):
 
-    log = pyqtSignal(str)
     progress = pyqtSignal(str)
-    finished_ok = pyqtSignal()
 
     def __init__(self, mode: str, chat: str, names: List[str], hamster: str,
                  image_path: str, cfg: AutoConfig, bridge: PromptBridge, overrides: Optional[Dict[str, Dict]] = None,
                  account_status: Optional[Dict[str, Dict]] = None,
                  delete_targets: Optional[List[Dict[str, str]]] = None,
-                 revoke_targets: Optional[List[Dict[str, str]]] = None):
+                 revoke_targets: Optional[List[Dict[str, str]]] = None,
+                 job: Optional[ManagementJob] = None):
         super().__init__()
         self.mode = mode
         self.chat = chat
@@ -1455,48 +1506,16 @@ class Worker(QThread):
         self.account_status = account_status or {}
         self.delete_targets = delete_targets or []
         self.revoke_targets = revoke_targets or []
+        self.job = job
         self.too_many_phones: set[str] = set()
         self.no_available_accounts = False
         self.remaining_names: List[str] = []
         self.revoked_results: List[Tuple[str, str]] = []
-        self.stop_requested = False
         self.last_freeze_seconds: int = 0
 
-    def stop(self):
-        self.stop_requested = True
-
-    def run(self):
-        asyncio.run(self._run_async())
-        self.finished_ok.emit()
-
-    async def _ensure_auth(self, client: TelegramClient, acc: Dict):
-        if await client.is_user_authorized():
-            return
-        await request_login_code(client, acc["phone"], self.log, stop_cb=lambda: self.stop_requested)
-        code = await self.bridge.get_code(acc["phone"])
-        try:
-            await client.sign_in(acc["phone"], code)
-        except SessionPasswordNeededError:
-            pass
-        if await client.is_user_authorized():
-            return
-        pwd = acc.get("password") or await self.bridge.get_password(acc["phone"])
-        if not pwd:
-            self.log.emit("[ERROR] 2FA пароль не введён.")
-            return
-        try:
-            await client.sign_in(password=pwd)
-        except PasswordHashInvalidError:
-            retry = await self.bridge.get_password(acc["phone"])
-            if retry:
-                await client.sign_in(password=retry)
-
     async def _wait_rate(self, seconds: int):
         self.log.emit(f"[RATE] Ждём {seconds} сек...")
-        for _ in range(seconds):
-            if self.stop_requested:
-                return
-            await asyncio.sleep(1)
+        await asyncio.sleep(seconds)
 
     def _build_bot_name(self, base: str) -> str:
         override = self.overrides.get(base, {})
@@ -1527,57 +1546,6 @@ class Worker(QThread):
             return False, resp
         return True, resp
 
-    async def _wait_for_new_message(self, client: TelegramClient, peer: str, last_id: int, timeout: float = 20.0) -> Optional[str]:
-        started = time.time()
-        while time.time() - started < timeout:
-            if self.stop_requested:
-                return None
-            msgs = await client.get_messages(peer, limit=6)
-            new_msgs = [m for m in reversed(msgs) if getattr(m, "id", 0) > last_id]
-            if new_msgs:
-                texts = []
-                for m in new_msgs:
-                    txt = (getattr(m, "raw_text", "") or getattr(m, "message", "") or "")
-                    if txt:
-                        texts.append(txt)
-                return "\n".join(texts) if texts else ""
-            await asyncio.sleep(0.6)
-        return None
-
-    async def _wait_for_message_contains(
-        self,
-        client: TelegramClient,
-        peer: str,
-        last_id: int,
-        phrases: List[str],
-        timeout: float = 35.0
-    ) -> Optional[str]:
-        started = time.time()
-        expect = [p.lower() for p in phrases]
-        current_last = last_id
-        while time.time() - started < timeout:
-            if self.stop_requested:
-                return None
-            msgs = await client.get_messages(peer, limit=10)
-            found = False
-            for m in reversed(msgs):
-                mid = getattr(m, "id", 0)
-                if mid <= current_last:
-                    continue
-                txt = (getattr(m, "raw_text", "") or getattr(m, "message", "") or "")
-                if not txt:
-                    continue
-                current_last = max(current_last, mid)
-                lowered = txt.lower()
-                if any(p in lowered for p in expect):
-                    return txt
-                found = True
-            if found:
-                await asyncio.sleep(0.6)
-            else:
-                await asyncio.sleep(0.6)
-        return None
-
     async def _create_one_bot(self, client: TelegramClient, base_name: str) -> Optional[Tuple[str, str]]:
         peer = self.chat
 
@@ -1629,8 +1597,6 @@ class Worker(QThread):
             return None
 
         for uname in self._build_username_candidates(base_name):
-            if self.stop_requested:
-                return None
             last = await client.get_messages(peer, limit=1)
             last_id = last[0].id if last else 0
             await client(SendMessageRequest(peer, uname))
@@ -1757,6 +1723,10 @@ class Worker(QThread):
             self.log.emit("[WARN] Нет подтверждения установки аватарки. (Возможно не успела загрузиться, проверьте вручную)")
 
     def _write_token(self, username: str, token: str, hamster: str, account: str):
+        try:
+            token_history(self.cfg).record(username, token, account)
+        except Exception as e:
+            self.log.emit(f"[WARN] История токенов: {e}")
         ensure_file(self.cfg.tokens_txt_path())
         ensure_file(self.cfg.tokens_csv_path())
         with open(self.cfg.tokens_txt_path(), "a", encoding="utf-8") as f:
@@ -1768,110 +1738,6 @@ class Worker(QThread):
                 w.writerow(["username", "token", "hamster", "account", "ts"])
             w.writerow([username, token, hamster, account, int(time.time())])
 
-    def _remove_token_rows(self, username: str) -> bool:
-        path = self.cfg.tokens_csv_path()
-        if not path.exists():
-            return False
-        try:
-            with open(path, "r", encoding="utf-8") as f:
-                reader = csv.DictReader(f)
-                fieldnames = reader.fieldnames or ["username", "token", "hamster", "account", "ts"]
-                rows = [
-                    row for row in reader
-                    if (row.get("username") or "").strip() != username
-                ]
-            with open(path, "w", newline="", encoding="utf-8") as f:
-                writer = csv.DictWriter(f, fieldnames=fieldnames)
-                writer.writeheader()
-                writer.writerows(rows)
-            return True
-        except Exception:
-            return False
-
-    def _write_revoked_token(self, username: str, token: str, account: str):
-        ensure_file(self.cfg.revoked_tokens_txt_path())
-        with open(self.cfg.revoked_tokens_txt_path(), "a", encoding="utf-8") as f:
-            f.write(f"{username},{account},{token}\n")
-
-    async def _delete_bot(self, client: TelegramClient, username: str) -> bool:
-        peer = self.chat
-        last = await client.get_messages(peer, limit=1)
-        last_id = last[0].id if last else 0
-        await client(SendMessageRequest(peer, "/start"))
-        await asyncio.sleep(0.5)
-        await self._wait_for_new_message(client, peer, last_id, timeout=12.0)
-
-        last = await client.get_messages(peer, limit=1)
-        last_id = last[0].id if last else 0
-        await client(SendMessageRequest(peer, "/deletebot"))
-        choose = await self._wait_for_message_contains(
-            client,
-            peer,
-            last_id,
-            ["Choose a bot to delete"],
-            timeout=20.0
-        )
-        if not choose:
-            self.log.emit("[WARN] Нет запроса выбора бота для удаления.")
-            return False
-
-        last = await client.get_messages(peer, limit=1)
-        last_id = last[0].id if last else 0
-        await client(SendMessageRequest(peer, f"@{username}"))
-        await self._wait_for_new_message(client, peer, last_id, timeout=12.0)
-
-        last = await client.get_messages(peer, limit=1)
-        last_id = last[0].id if last else 0
-        await client(SendMessageRequest(peer, "Yes, I am totally sure."))
-        done = await self._wait_for_message_contains(
-            client,
-            peer,
-            last_id,
-            ["Done! The bot is gone", "/help"],
-            timeout=20.0
-        )
-        return bool(done)
-
-    async def _revoke_token(self, client: TelegramClient, username: str, account: str) -> Optional[str]:
-        peer = self.chat
-        last = await client.get_messages(peer, limit=1)
-        last_id = last[0].id if last else 0
-        await client(SendMessageRequest(peer, "/start"))
-        await asyncio.sleep(0.5)
-        await self._wait_for_new_message(client, peer, last_id, timeout=12.0)
-
-        last = await client.get_messages(peer, limit=1)
-        last_id = last[0].id if last else 0
-        await client(SendMessageRequest(peer, "/revoke"))
-        choose = await self._wait_for_message_contains(
-            client,
-            peer,
-            last_id,
-            ["Choose a bot to generate a new token", "Warning: your old token will stop working"],
-            timeout=20.0
-        )
-        if not choose:
-            self.log.emit("[WARN] Нет запроса выбора бота для revoke.")
-            return None
-
-        last = await client.get_messages(peer, limit=1)
-        last_id = last[0].id if last else 0
-        await client(SendMessageRequest(peer, f"@{username}"))
-        done = await self._wait_for_message_contains(
-            client,
-            peer,
-            last_id,
-            ["Your token was replaced with a new one", "new token"],
-            timeout=20.0
-        )
-        if not done:
-            self.log.emit("[WARN] Нет подтверждения revoke токена.")
-            return None
-        token = extract_token(done) or ""
-        if token:
-            self._write_revoked_token(username, token, account)
-        return token or None
-
     async def _run_async(self):
         if self.mode == "delete":
             await self._run_delete()
@@ -1879,7 +1745,7 @@ class Worker(QThread):
         if self.mode == "revoke":
             await self._run_revoke()
             return
-        accs = parse_accounts(ACCOUNTS_FILE)
+        accs = list(account_registry.snapshot())
         if not accs:
             self.log.emit("[ERROR] accounts_tg.txt не найден или пуст.")
             return
@@ -1898,7 +1764,7 @@ class Worker(QThread):
         self.log.emit(f"[INFO] Аккаунтов: {len(accs)} | Имен: {len(names_queue)} | Лимит/акк: {self.cfg.per_account_limit} (1 запуск = 1 круг)")
 
         acc_index = 0
-        while names_queue and not self.stop_requested:
+        while names_queue:
             acc = accs[acc_index % len(accs)]
             acc_index += 1
             round_attempts += 1
@@ -2054,91 +1920,6 @@ class Worker(QThread):
 
         self.log.emit("[OK] Готово.")
 
-    async def _run_delete(self):
-        accs = parse_accounts(ACCOUNTS_FILE)
-        if not accs:
-            self.log.emit("[ERROR] accounts_tg.txt не найден или пуст.")
-            return
-        if not self.delete_targets:
-            self.log.emit("[ERROR] Нет выбранных ботов для удаления.")
-            return
-        acc_by_phone = {a["phone"]: a for a in accs}
-        for target in self.delete_targets:
-            if self.stop_requested:
-                break
-            username = (target.get("username") or "").strip()
-            phone = (target.get("account") or "").strip()
-            if not username or not phone:
-                self.log.emit("[WARN] Пропуск: нет username или аккаунта.")
-                continue
-            acc = acc_by_phone.get(phone)
-            if not acc:
-                self.log.emit(f"[WARN] Аккаунт {phone} не найден в accounts_tg.txt.")
-                continue
-            self.current_phone = acc["phone"]
-            self.progress.emit(f"Удаление: @{username} | Акк: {acc['phone']}")
-            session_path = SESSIONS_DIR / acc["phone"]
-            client = TelegramClient(str(session_path), acc["api_id"], acc["api_hash"])
-            try:
-                await client.connect()
-                await self._ensure_auth(client, acc)
-                ok = await self._delete_bot(client, username)
-                if ok:
-                    self._remove_token_rows(username)
-                    self.log.emit(f"[OK] Удалён @{username}")
-                else:
-                    self.log.emit(f"[ERROR] Не удалось удалить @{username}")
-            except Exception as e:
-                self.log.emit(f"[ERROR] {e}")
-            finally:
-                try:
-                    await client.disconnect()
-                except Exception:
-                    pass
-        self.log.emit("[OK] Удаление завершено.")
-
-    async def _run_revoke(self):
-        accs = parse_accounts(ACCOUNTS_FILE)
-        if not accs:
-            self.log.emit("[ERROR] accounts_tg.txt не найден или пуст.")
-            return
-        if not self.revoke_targets:
-            self.log.emit("[ERROR] Нет выбранного бота для revoke.")
-            return
-        acc_by_phone = {a["phone"]: a for a in accs}
-        for target in self.revoke_targets:
-            if self.stop_requested:
-                break
-            username = (target.get("username") or "").strip()
-            phone = (target.get("account") or "").strip()
-            if not username or not phone:
-                self.log.emit("[WARN] Пропуск: нет username или аккаунта.")
-                continue
-            acc = acc_by_phone.get(phone)
-            if not acc:
-                self.log.emit(f"[WARN] Аккаунт {phone} не найден в accounts_tg.txt.")
-                continue
-            self.current_phone = acc["phone"]
-            session_path = SESSIONS_DIR / acc["phone"]
-            client = TelegramClient(str(session_path), acc["api_id"], acc["api_hash"])
-            try:
-                await client.connect()
-                await self._ensure_auth(client, acc)
-                token = await self._revoke_token(client, username, acc["phone"])
-                if token:
-                    self.revoked_results.append((username, token))
-                    self.log.emit(f"[OK] Revoke токен для @{username} сохранён.")
-                else:
-                    self.log.emit(f"[ERROR] Не удалось выполнить revoke для @{username}")
-            except Exception as e:
-                self.log.emit(f"[ERROR] {e}")
-            finally:
-                try:
-                    await client.disconnect()
-                except Exception:
-                    pass
-        self.log.emit("[OK] Revoke завершён.")
-
 class AutoPage(QWidget):
     def __init__(self, ui):
         super().__init__()
@@ -2337,33 +2118,23 @@ class BotsPage(QWidget):
         self.actions_label.setText(t["section_actions"])
         self.table.setHorizontalHeaderLabels([t["bots_table_bot"], t["bots_table_account"], t["bots_table_created"]])
 
+    @action_profiler.profiled
     def refresh_table(self):
-        rows = []
-        csv_path = self.ui.cfg.tokens_csv_path()
-        if csv_path.exists():
-            try:
-                with open(csv_path, "r", encoding="utf-8") as f:
-                    reader = csv.DictReader(f)
-                    for row in reader:
-                        rows.append(row)
-            except Exception:
-                pass
+        records = load_bot_records(self.ui.cfg)
 
         self.table.setRowCount(0)
-        for row in rows:
+        for index in range(len(records)):
             r = self.table.rowCount()
             self.table.insertRow(r)
-            username = (row.get("username") or "").strip()
-            account = (row.get("account") or row.get("phone") or "").strip()
-            ts_raw = (row.get("ts") or "").strip()
+            ts = records.timestamps[index]
             ts_text = ""
-            if ts_raw.isdigit():
+            if ts > 0:
                 try:
-                    ts_text = time.strftime("%d.%m.%Y %H:%M", time.localtime(int(ts_raw)))
+                    ts_text = time.strftime("%d.%m.%Y %H:%M", time.localtime(ts))
                 except Exception:
-                    ts_text = ts_raw
-            self.table.setItem(r, 0, QTableWidgetItem(username))
-            self.table.setItem(r, 1, QTableWidgetItem(account or "-"))
+                    ts_text = str(ts)
+            self.table.setItem(r, 0, QTableWidgetItem(records.usernames[index]))
+            self.table.setItem(r, 1, QTableWidgetItem(records.accounts[index] or "-"))
             self.table.setItem(r, 2, QTableWidgetItem(ts_text))
 
 class ManageBotsPage(QWidget):
@@ -2385,12 +2156,13 @@ class ManageBotsPage(QWidget):
         content_row.setSpacing(16)
 
         left_col = QVBoxLayout()
-        self.table = QTableWidget(0, 2)
+        self.table = QTableWidget(0, 3)
         self.table.setObjectName("StatsTable")
         configure_table(self.table)
-        self.table.setHorizontalHeaderLabels(["Бот", "Аккаунт"])
+        self.table.setHorizontalHeaderLabels(["Бот", "Аккаунт", "Токен"])
         self.table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
         self.table.horizontalHeader().setSectionResizeMode(1, QHeaderView.ResizeMode.ResizeToContents)
+        self.table.horizontalHeader().setSectionResizeMode(2, QHeaderView.ResizeMode.ResizeToContents)
         self.table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
         self.table.setSelectionMode(QAbstractItemView.SelectionMode.ExtendedSelection)
         set_table_readonly(self.table)
@@ -2422,6 +2194,15 @@ class ManageBotsPage(QWidget):
         right_col.addWidget(self.revoke_mass)
         right_col.addWidget(self.revoke)
         right_col.addWidget(self.open_revoked)
+
+        self.section_jobs = QLabel("Задачи"); self.section_jobs.setObjectName("SectionTitle")
+        self.resume_job = QPushButton("Продолжить задачу"); self.resume_job.setObjectName("SecondaryBtn")
+        self.job_status = QLabel(""); self.job_status.setObjectName("Hint")
+        self.job_status.setWordWrap(True)
+        right_col.addSpacing(6)
+        right_col.addWidget(self.section_jobs)
+        right_col.addWidget(self.resume_job)
+        right_col.addWidget(self.job_status)
         right_col.addStretch(1)
 
         content_row.addLayout(left_col, 3)
@@ -2436,32 +2217,36 @@ class ManageBotsPage(QWidget):
         self.revoke_mass.clicked.connect(self.ui.revoke_mass)
         self.revoke.clicked.connect(self.ui.revoke_token)
         self.open_revoked.clicked.connect(self.ui.open_revoked_tokens_txt)
+        self.resume_job.clicked.connect(self.ui.resume_manage_job)
 
         self.refresh_table()
         self.logbox = LogBox()
         self.ui.register_logbox(self.logbox)
         lay.addWidget(self.logbox, 1)
 
+    @action_profiler.profiled
     def refresh_table(self):
-        rows = []
-        csv_path = self.ui.cfg.tokens_csv_path()
-        if csv_path.exists():
-            try:
-                with open(csv_path, "r", encoding="utf-8") as f:
-                    reader = csv.DictReader(f)
-                    for row in reader:
-                        rows.append(row)
-            except Exception:
-                pass
+        records = load_bot_records(self.ui.cfg)
 
         self.table.setRowCount(0)
-        for row in rows:
+        for index in range(len(records)):
             r = self.table.rowCount()
             self.table.insertRow(r)
-            username = (row.get("username") or "").strip()
-            account = (row.get("account") or row.get("phone") or "").strip()
-            self.table.setItem(r, 0, QTableWidgetItem(username))
-            self.table.setItem(r, 1, QTableWidgetItem(account or "-"))
+            token = records.tokens[index]
+            version = records.versions[index]
+            self.table.setItem(r, 0, QTableWidgetItem(records.usernames[index]))
+            self.table.setItem(r, 1, QTableWidgetItem(records.accounts[index] or "-"))
+            self.table.setItem(r, 2, QTableWidgetItem(f"{token} (v{version})" if version else token))
+        self.refresh_jobs()
+
+    @action_profiler.profiled
+    def refresh_jobs(self):
+        try:
+            count = job_journal(self.ui.cfg).unfinished_count()
+        except Exception:
+            count = 0
+        self.resume_job.setEnabled(count > 0)
+        self.job_status.setText(self.ui.translate_text(f"Незавершённых задач: {count}") if count else "")
 
     def selected_targets(self) -> List[Dict[str, str]]:
         targets = []
@@ -2487,7 +2272,109 @@ class ManageBotsPage(QWidget):
         self.section_data.setText(t["section_list"])
         self.section_delete.setText(t["section_delete"])
         self.section_revoke.setText(t["section_revoke"])
-        self.table.setHorizontalHeaderLabels([t["manage_table_bot"], t["manage_table_account"]])
+        self.section_jobs.setText(t["section_jobs"])
+        self.resume_job.setText(t["manage_resume_job"])
+        self.refresh_jobs()
+        self.table.setHorizontalHeaderLabels([t["manage_table_bot"], t["manage_table_account"], t["manage_table_token"]])
+
+LOG_HISTORY_TAGS = ("OK", "WARN", "ERROR", "FREEZE", "RATE", "INFO", "TOKEN", "JOB", "AUTH")
+LOG_HISTORY_LIMIT = 2000
+
+class LogHistoryPage(QWidget):
+    def __init__(self, ui):
+        super().__init__()
+        self.ui = ui
+        self.history = LogHistory(self.ui.cfg.log_dir_path())
+        lay = QVBoxLayout(self); lay.setContentsMargins(0,0,0,0)
+
+        card = QFrame(); card.setObjectName("Card")
+        apply_shadow(card, blur=28, alpha=150, offset=QPointF(0, 8))
+        c = QVBoxLayout(card); c.setContentsMargins(14,14,14,14); c.setSpacing(10)
+
+        self.title = QLabel("История логов"); self.title.setObjectName("PageTitle")
+        self.hint = QLabel("Поиск по сохранённым логам прошлых запусков: по дате, тегу, телефону или username."); self.hint.setObjectName("Hint")
+        self.hint.setWordWrap(True)
+        c.addWidget(self.title)
+        c.addWidget(self.hint)
+
+        row = QHBoxLayout()
+        self.date_from = QLineEdit(""); self.date_from.setObjectName("Input"); self.date_from.setPlaceholderText("YYYY-MM-DD")
+        self.date_to = QLineEdit(""); self.date_to.setObjectName("Input"); self.date_to.setPlaceholderText("YYYY-MM-DD")
+        self.tag_box = QComboBox(); self.tag_box.setObjectName("Input")
+        self.tag_box.addItems(["Все"] + [f"[{tag}]" for tag in LOG_HISTORY_TAGS])
+        self.text_input = QLineEdit(""); self.text_input.setObjectName("Input")
+        self.text_input.setPlaceholderText("Телефон или username")
+        self.search_btn = QPushButton("Найти"); self.search_btn.setObjectName("PrimaryBtn")
+        row.addWidget(self.date_from, 1)
+        row.addWidget(self.date_to, 1)
+        row.addWidget(self.tag_box, 1)
+        row.addWidget(self.text_input, 2)
+        row.addWidget(self.search_btn)
+        c.addLayout(row)
+
+        self.status = QLabel(""); self.status.setObjectName("Hint")
+        self.status.setWordWrap(True)
+        c.addWidget(self.status)
+
+        self.results = LogBox()
+        self.results.text.setMaximumHeight(16777215)
+        self.results.text.setMaximumBlockCount(LOG_HISTORY_LIMIT)
+        self.results.text.setPlaceholderText("Нажмите «Найти», чтобы показать последние записи.")
+        c.addWidget(self.results, 1)
+
+        lay.addWidget(card)
+
+        self.search_btn.clicked.connect(self.run_search)
+        self.text_input.returnPressed.connect(self.run_search)
+        self.date_from.returnPressed.connect(self.run_search)
+        self.date_to.returnPressed.connect(self.run_search)
+
+    def _query(self) -> Optional[LogQuery]:
+        query = LogQuery(
+            date_from=self.date_from.text().strip(),
+            date_to=self.date_to.text().strip(),
+            text=self.text_input.text().strip(),
+        )
+        if self.tag_box.currentIndex() > 0:
+            query.tags = {LOG_HISTORY_TAGS[self.tag_box.currentIndex() - 1]}
+        try:
+            query.compile()
+        except ValueError:
+            show_message(self.ui, "Ошибка", "Дата должна быть в формате YYYY-MM-DD.")
+            return None
+        return query
+
+    def run_search(self):
+        query = self._query()
+        if query is None:
+            return
+        started = time.perf_counter()
+        try:
+            lines, _ = self.history.search(query, LOG_HISTORY_LIMIT)
+        except OSError as e:
+            show_message(self.ui, "Ошибка", f"Ошибка чтения логов: {e}")
+            return
+        elapsed = (time.perf_counter() - started) * 1000
+        lang = self.ui.cfg.language
+        shown = []
+        for line in reversed(lines):
+            stamp, sep, message = line.partition("] ")
+            shown.append(f"{stamp}{sep}{translate_log_message(message, lang)}" if sep else line)
+        self.results.text.setPlainText("\n".join(shown))
+        self.results._scroll_to_end()
+        stats = self.history.stats()
+        self.status.setText(self.ui.ui_strings()["logs_status"].format(
+            found=len(lines), files=stats["files"], lines=stats["lines"], ms=elapsed
+        ))
+
+    def update_language(self, t: Dict[str, str]):
+        self.title.setText(t["logs_title"])
+        self.hint.setText(t["logs_hint"])
+        self.tag_box.setItemText(0, t["logs_all_tags"])
+        self.text_input.setPlaceholderText(t["logs_text_placeholder"])
+        self.search_btn.setText(t["logs_search"])
+        self.results.text.setPlaceholderText(t["logs_placeholder"])
+        self.status.setText("")
 
 class SettingsPage(QWidget):
     def __init__(self, ui):
@@ -2519,6 +2406,28 @@ class SettingsPage(QWidget):
         self.autostart_toggle = QCheckBox("Включить автозапуск")
         form.addRow(self.autostart_label, self.autostart_toggle)
 
+        self.perf_label = QLabel("Отрисовка:")
+        self.perf_toggle = QCheckBox("Режим производительности (без теней и анимаций)")
+        form.addRow(self.perf_label, self.perf_toggle)
+
+        perf_row = QHBoxLayout()
+        self.frame_btn = QPushButton("Замерить кадр"); self.frame_btn.setObjectName("SecondaryBtn")
+        self.frame_result = QLabel(""); self.frame_result.setObjectName("Hint")
+        self.frame_result.setWordWrap(True)
+        perf_row.addWidget(self.frame_btn)
+        perf_row.addWidget(self.frame_result, 1)
+        form.addRow(QLabel(""), perf_row)
+
+        self.profile_label = QLabel("Профилирование:")
+        profile_row = QHBoxLayout()
+        self.profile_toggle = QCheckBox("Профилировать следующие действия")
+        self.profile_count = QSpinBox(); self.profile_count.setRange(1, 50); self.profile_count.setValue(5)
+        self.profile_count.setObjectName("Input")
+        profile_row.addWidget(self.profile_toggle)
+        profile_row.addWidget(self.profile_count)
+        profile_row.addStretch(1)
+        form.addRow(self.profile_label, profile_row)
+
         c.addLayout(form)
 
         btn_row = QGridLayout()
@@ -2535,6 +2444,9 @@ class SettingsPage(QWidget):
         btn_row.setColumnStretch(0, 1)
         btn_row.setColumnStretch(1, 1)
         c.addLayout(btn_row)
+        self.backup_status = QLabel(""); self.backup_status.setObjectName("Hint")
+        self.backup_status.setWordWrap(True)
+        c.addWidget(self.backup_status)
 
         help_row = QHBoxLayout()
         self.onboarding_btn = QPushButton("Мастер новичка"); self.onboarding_btn.setObjectName("SecondaryBtn")
@@ -2578,6 +2490,9 @@ class SettingsPage(QWidget):
 
         self.lang_combo.currentTextChanged.connect(self.ui.set_language)
         self.autostart_toggle.toggled.connect(self.ui.toggle_autostart)
+        self.perf_toggle.toggled.connect(self.ui.set_performance_rendering)
+        self.frame_btn.clicked.connect(self.ui.measure_frame_times)
+        self.profile_toggle.toggled.connect(self.ui.set_profiling)
         self.backup_btn.clicked.connect(self.ui.create_backup)
         self.restore_btn.clicked.connect(self.ui.restore_backup)
         self.reset_btn.clicked.connect(self.ui.reset_factory)
@@ -2589,12 +2504,16 @@ class SettingsPage(QWidget):
 
         self.refresh_state()
 
+    @action_profiler.profiled
     def refresh_state(self):
         lang = getattr(self.ui.cfg, "language", "Русский")
         idx = self.lang_combo.findText(lang)
         if idx >= 0:
             self.lang_combo.setCurrentIndex(idx)
         self.autostart_toggle.setChecked(self.ui.is_autostart_enabled())
+        self.perf_toggle.blockSignals(True)
+        self.perf_toggle.setChecked(bool(getattr(self.ui.cfg, "performance_rendering", False)))
+        self.perf_toggle.blockSignals(False)
         self.info_paths.setText(
             "Файлы:\n"
             f"• accounts_tg.txt — {ACCOUNTS_FILE}\n"
@@ -2609,6 +2528,11 @@ class SettingsPage(QWidget):
         self.lang_label.setText(t["settings_language"])
         self.autostart_label.setText(t["settings_autostart_label"])
         self.autostart_toggle.setText(t["settings_autostart_toggle"])
+        self.perf_label.setText(t["settings_perf_label"])
+        self.perf_toggle.setText(t["settings_perf_toggle"])
+        self.frame_btn.setText(t["settings_frame_measure"])
+        self.profile_label.setText(t["settings_profile_label"])
+        self.profile_toggle.setText(t["settings_profile_toggle"])
         self.backup_btn.setText(t["settings_backup"])
         self.restore_btn.setText(t["settings_restore"])
         self.reset_btn.setText(t["settings_reset"])
@@ -2690,6 +2614,8 @@ class TokensPage(QWidget):
         self.copy_latest = QPushButton("Копировать последние"); self.copy_latest.setObjectName("SecondaryBtn")
         self.delete_selected = QPushButton("Удалить выбранные"); self.delete_selected.setObjectName("SecondaryBtn")
         self.clear_all = QPushButton("Очистить список"); self.clear_all.setObjectName("SecondaryBtn")
+        self.export_btn = QPushButton("Экспорт..."); self.export_btn.setObjectName("SecondaryBtn")
+        self.export_status = QLabel(""); self.export_status.setObjectName("Hint")
 
         self.refresh.clicked.connect(self.refresh_view)
         self.save.clicked.connect(self.save_current_group)
@@ -2697,6 +2623,7 @@ class TokensPage(QWidget):
         self.copy_latest.clicked.connect(self.copy_latest_group)
         self.delete_selected.clicked.connect(self.delete_selected_groups)
         self.clear_all.clicked.connect(self.clear_tokens)
+        self.export_btn.clicked.connect(self.export_tokens)
 
         row1.addWidget(self.refresh)
         row1.addWidget(self.save)
@@ -2705,6 +2632,8 @@ class TokensPage(QWidget):
         row2.addWidget(self.copy_latest)
         row2.addWidget(self.delete_selected)
         row2.addWidget(self.clear_all)
+        row2.addWidget(self.export_btn)
+        row2.addWidget(self.export_status)
         row2.addStretch(1)
         btn_row.addLayout(row1)
         btn_row.addLayout(row2)
@@ -2724,6 +2653,7 @@ class TokensPage(QWidget):
         self.copy_latest.setText(t["tokens_copy_latest"])
         self.delete_selected.setText(t["tokens_delete_selected"])
         self.clear_all.setText(t["tokens_clear"])
+        self.export_btn.setText(t["tokens_export"])
         self.actions_label.setText(t["section_actions"])
         self.tree.setHeaderLabels([t["tokens_table_date"], t["tokens_table_bot"]])
         if self.current_date:
@@ -2731,35 +2661,22 @@ class TokensPage(QWidget):
         else:
             self.date_label.setText(f"{t['tokens_date_label']}: —")
 
-    def _load_rows(self) -> List[Dict]:
-        rows = []
-        csv_path = self.ui.cfg.tokens_csv_path()
-        if csv_path.exists():
-            try:
-                with open(csv_path, "r", encoding="utf-8") as f:
-                    reader = csv.DictReader(f)
-                    for row in reader:
-                        rows.append(row)
-            except Exception:
-                pass
-        return rows
+    def _load_rows(self) -> BotRecords:
+        return load_bot_records(self.ui.cfg)
 
-    def _date_key(self, row: Dict) -> str:
-        ts_raw = (row.get("ts") or "").strip()
-        if ts_raw.isdigit():
-            try:
-                return time.strftime("%Y-%m-%d", time.localtime(int(ts_raw)))
-            except Exception:
-                return "Без даты"
-        return "Без даты"
+    def _date_key(self, records: BotRecords, index: int) -> str:
+        try:
+            return records.date_key(index) or "Без даты"
+        except Exception:
+            return "Без даты"
 
+    @action_profiler.profiled
     def refresh_view(self):
         self.tree.clear()
-        rows = self._load_rows()
-        groups: Dict[str, List[Dict]] = {}
-        for row in rows:
-            key = self._date_key(row)
-            groups.setdefault(key, []).append(row)
+        records = self._load_rows()
+        groups: Dict[str, List[int]] = {}
+        for index in range(len(records)):
+            groups.setdefault(self._date_key(records, index), []).append(index)
 
         bold_font = QFont()
         bold_font.setBold(True)
@@ -2777,10 +2694,8 @@ class TokensPage(QWidget):
             top.setChildIndicatorPolicy(QTreeWidgetItem.ChildIndicatorPolicy.ShowIndicator)
             for col in range(2):
                 top.setBackground(col, QBrush(QColor(10, 16, 30)))
-            for row in groups[date_key]:
-                token = (row.get("token") or "").strip()
-                username = (row.get("username") or "").strip()
-                child = QTreeWidgetItem([token, username])
+            for index in groups[date_key]:
+                child = QTreeWidgetItem([records.tokens[index], records.usernames[index]])
                 child.setFont(0, token_font)
                 child.setFont(1, token_font)
                 child.setTextAlignment(0, Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter)
@@ -2796,7 +2711,7 @@ class TokensPage(QWidget):
 
         self.editor.clear()
         self.current_date = None
-        t = self.ui._translations().get(self.ui.cfg.language, self.ui._translations()["Русский"])
+        t = self.ui.ui_strings()
         self.date_label.setText(f"{t['tokens_date_label']}: —")
 
     def _on_select(self):
@@ -2810,7 +2725,7 @@ class TokensPage(QWidget):
         if not date_key:
             return
         self.current_date = date_key
-        t = self.ui._translations().get(self.ui.cfg.language, self.ui._translations()["Русский"])
+        t = self.ui.ui_strings()
         self.date_label.setText(f"{t['tokens_date_label']}: {date_key}")
         tokens = []
         for i in range(item.childCount()):
@@ -2833,21 +2748,15 @@ class TokensPage(QWidget):
         if not self.current_date:
             show_message(self, "Нет даты", "Выберите дату в списке слева.")
             return
-        rows = self._load_rows()
-        keep_rows = [r for r in rows if self._date_key(r) != self.current_date]
+        records = self._load_rows()
+        keep_rows = [records.record(i) for i in range(len(records)) if self._date_key(records, i) != self.current_date]
         tokens = [t.strip() for t in self.editor.toPlainText().splitlines() if t.strip()]
         try:
             base_ts = int(time.mktime(time.strptime(self.current_date, "%Y-%m-%d")))
         except Exception:
             base_ts = int(time.time())
         for token in tokens:
-            keep_rows.append({
-                "username": "",
-                "token": token,
-                "hamster": "",
-                "account": "",
-                "ts": str(base_ts),
-            })
+            keep_rows.append(BotRecord(token=token, ts=base_ts))
         self._write_rows(keep_rows)
         self.refresh_view()
 
@@ -2856,21 +2765,21 @@ class TokensPage(QWidget):
         if not keys:
             show_message(self, "Нет выбора", "Отметьте даты галочками слева.")
             return
-        rows = self._load_rows()
-        tokens = [r.get("token", "") for r in rows if self._date_key(r) in keys and r.get("token")]
+        records = self._load_rows()
+        tokens = [records.tokens[i] for i in range(len(records)) if records.tokens[i] and self._date_key(records, i) in keys]
         QApplication.clipboard().setText("\n".join(tokens))
 
     def copy_latest_group(self):
-        rows = self._load_rows()
-        if not rows:
+        records = self._load_rows()
+        if not len(records):
             show_message(self, "Пусто", "Токены не найдены.")
             return
-        latest = max((safe_int(r.get("ts", "0")), r) for r in rows)[0]
+        latest = max(records.timestamps)
         if latest <= 0:
             show_message(self, "Пусто", "Нет дат для токенов.")
             return
         latest_date = time.strftime("%Y-%m-%d", time.localtime(latest))
-        tokens = [r.get("token", "") for r in rows if self._date_key(r) == latest_date and r.get("token")]
+        tokens = [records.tokens[i] for i in range(len(records)) if records.tokens[i] and self._date_key(records, i) == latest_date]
         QApplication.clipboard().setText("\n".join(tokens))
 
     def delete_selected_groups(self):
@@ -2883,8 +2792,8 @@ class TokensPage(QWidget):
         if target and target.parent() is not None:
             target = target.parent()
         rect = self.tree.visualItemRect(target) if target else QRect()
-        rows = self._load_rows()
-        keep_rows = [r for r in rows if self._date_key(r) not in keys]
+        records = self._load_rows()
+        keep_rows = [records.record(i) for i in range(len(records)) if self._date_key(records, i) not in keys]
         def _finish():
             self._write_rows(keep_rows)
             self.refresh_view()
@@ -2897,29 +2806,128 @@ class TokensPage(QWidget):
             self.refresh_view()
         animate_evaporate_rect(self.tree.viewport(), rect, _finish)
 
-    def _write_rows(self, rows: List[Dict]):
-        ensure_file(self.ui.cfg.tokens_txt_path())
-        ensure_file(self.ui.cfg.tokens_csv_path())
-        with open(self.ui.cfg.tokens_csv_path(), "w", newline="", encoding="utf-8") as f:
-            w = csv.writer(f)
-            w.writerow(["username", "token", "hamster", "account", "ts"])
-            for row in rows:
-                w.writerow([
-                    row.get("username", ""),
-                    row.get("token", ""),
-                    row.get("hamster", ""),
-                    row.get("account", ""),
-                    row.get("ts", ""),
-                ])
-        with open(self.ui.cfg.tokens_txt_path(), "w", encoding="utf-8") as f:
-            for row in rows:
-                token = (row.get("token") or "").strip()
-                if token:
-                    f.write(f"{token}\n")
+    def _ask_export_options(self) -> Optional[Tuple[str, ExportFilter]]:
+        records = self._load_rows()
+        dated = sorted(k for k in self._selected_group_keys() if k != "Без даты")
 
-class AccountsAuthWorker(QThread):
-    log = pyqtSignal(str)
-    finished_ok = pyqtSignal()
+        dlg = StyledDialog(self, self.ui.translate_text("Экспорт токенов"))
+        dlg.resize(560, 340)
+        form = QFormLayout()
+        form.setHorizontalSpacing(18)
+        form.setVerticalSpacing(10)
+
+        fmt_box = QComboBox(); fmt_box.setObjectName("Input")
+        fmt_box.addItems([fmt.upper() for fmt in EXPORT_FORMATS])
+        date_from = QLineEdit(dated[0] if dated else ""); date_from.setObjectName("Input")
+        date_to = QLineEdit(dated[-1] if dated else ""); date_to.setObjectName("Input")
+        date_from.setPlaceholderText("YYYY-MM-DD")
+        date_to.setPlaceholderText("YYYY-MM-DD")
+        all_label = self.ui.translate_text("Все")
+        hamster_box = QComboBox(); hamster_box.setObjectName("Input")
+        hamster_box.addItems([all_label] + sorted({h or "None" for h in records.hamsters}))
+        account_box = QComboBox(); account_box.setObjectName("Input")
+        account_box.addItems([all_label] + sorted({a for a in records.accounts if a}))
+
+        form.addRow(self.ui.translate_text("Формат:"), fmt_box)
+        form.addRow(self.ui.translate_text("С даты:"), date_from)
+        form.addRow(self.ui.translate_text("По дату:"), date_to)
+        form.addRow(self.ui.translate_text("Хомяк:"), hamster_box)
+        form.addRow(self.ui.translate_text("Аккаунт:"), account_box)
+
+        row = QHBoxLayout()
+        ok = QPushButton(self.ui.translate_text("Продолжить")); ok.setObjectName("PrimaryBtn")
+        cancel = QPushButton(self.ui.translate_text("Отмена")); cancel.setObjectName("SecondaryBtn")
+        row.addStretch(1)
+        row.addWidget(cancel)
+        row.addWidget(ok)
+
+        body = QVBoxLayout()
+        body.addLayout(form)
+        body.addLayout(row)
+        dlg.set_body_layout(body)
+        ok.clicked.connect(dlg.accept)
+        cancel.clicked.connect(dlg.reject)
+        if dlg.exec() != QDialog.DialogCode.Accepted:
+            return None
+
+        flt = ExportFilter(date_from=date_from.text().strip(), date_to=date_to.text().strip())
+        if hamster_box.currentIndex() > 0:
+            flt.hamsters = {hamster_box.currentText()}
+        if account_box.currentIndex() > 0:
+            flt.accounts = {account_box.currentText()}
+        try:
+            flt.bounds()
+        except ValueError:
+            show_message(self, "Ошибка", "Дата должна быть в формате YYYY-MM-DD.")
+            return None
+        return EXPORT_FORMATS[fmt_box.currentIndex()], flt
+
+    def export_tokens(self):
+        if self.ui.job_blocked(getattr(self, "_export_worker", None)):
+            return
+        options = self._ask_export_options()
+        if options is None:
+            return
+        fmt, flt = options
+        path, _ = QFileDialog.getSaveFileName(
+            self,
+            self.ui.translate_text("Экспорт токенов"),
+            str(BASE_DIR / f"tokens_export.{fmt}"),
+            f"{fmt.upper()} (*.{fmt})",
+        )
+        if not path:
+            return
+        source = self.ui.cfg.tokens_csv_path()
+        try:
+            current = token_history(self.ui.cfg).snapshot()
+        except Exception:
+            current = {}
+        self.export_btn.setEnabled(False)
+        self._export_worker = JobWorker(
+            lambda progress: export_tokens(source, Path(path), fmt, flt, current, progress)
+        )
+        self._export_worker.progress.connect(
+            lambda done, total, exported: self.export_status.setText(
+                f"{done * 100 // total if total else 100}% • {exported}"
+            )
+        )
+
+        def _ok(result: dict):
+            self.export_btn.setEnabled(True)
+            self.export_status.setText("")
+            self.ui.log(f"[EXPORT] Экспортировано {result['exported']} токенов: {result['path']}")
+            show_message(self, "Готово", f"Экспортировано токенов: {result['exported']}")
+
+        def _failed(error: str):
+            self.export_btn.setEnabled(True)
+            self.export_status.setText("")
+            show_message(self, "Ошибка", f"Ошибка экспорта: {error}")
+
+        self._export_worker.finished_ok.connect(_ok)
+        self._export_worker.failed.connect(_failed)
+        self._export_worker.start()
+
+    def _write_rows(self, rows: List[BotRecord]):
+        write_bot_records(self.ui.cfg.tokens_csv_path(), rows, self.ui.cfg.tokens_txt_path())
+
+class JobWorker(QThread):
+    progress = pyqtSignal(int, int, str)
+    finished_ok = pyqtSignal(dict)
+    failed = pyqtSignal(str)
+
+    def __init__(self, job: Callable[[Callable[[int, int, str], None]], dict]):
+        super().__init__()
+        self.job = job
+
+    def run(self):
+        try:
+            result = self.job(self.progress.emit)
+        except Exception as e:
+            self.failed.emit(str(e))
+            return
+        self.finished_ok.emit(result)
+
+class AccountsAuthWorker(AsyncJob):
     status_update = pyqtSignal(str, dict)
 
     def __init__(self, accounts: List[Dict], bridge: PromptBridge, only_errors: bool = False):
@@ -2927,19 +2935,9 @@ class AccountsAuthWorker(QThread):
         self.accounts = accounts
         self.bridge = bridge
         self.only_errors = only_errors
-        self.stop_requested = False
-
-    def stop(self):
-        self.stop_requested = True
-
-    def run(self):
-        asyncio.run(self._run_async())
-        self.finished_ok.emit()
 
     async def _run_async(self):
         for acc in self.accounts:
-            if self.stop_requested:
-                return
             phone = acc["phone"]
             self.log.emit(f"[AUTH] {phone}")
             session_path = SESSIONS_DIR / phone
@@ -3082,12 +3080,11 @@ class AccountsPage(QWidget):
         self.auth_label.setText(t["section_auth"])
         self.table.setHorizontalHeaderLabels([t["accounts_table_phone"], t["accounts_table_status"], t["accounts_table_reason"]])
 
+    @action_profiler.profiled
     def refresh_table(self):
-        accounts = parse_accounts(ACCOUNTS_FILE)
         self.table.setRowCount(0)
-        for acc in accounts:
+        for acc, status in account_registry.with_status():
             phone = acc["phone"]
-            status = self.ui.account_status.get(phone, {})
             state = status.get("state", "unknown")
             reason = status.get("reason", "")
             r = self.table.rowCount()
@@ -3119,6 +3116,7 @@ class AccountsPage(QWidget):
                 if line in existing:
                     continue
                 f.write(f"{line}\n")
+        account_registry.invalidate()
         self.refresh_table()
         self._update_actions_state()
 
@@ -3134,6 +3132,7 @@ class AccountsPage(QWidget):
                 for line in lines:
                     if not line.startswith(f"{phone}:"):
                         f.write(f"{line}\n")
+            account_registry.invalidate()
             session_path = SESSIONS_DIR / phone
             for ext in [".session", ".session-journal"]:
                 p = session_path.with_suffix(ext)
@@ -3157,8 +3156,7 @@ class AccountsPage(QWidget):
         if r < 0:
             return
         phone = self.table.item(r, 0).text().strip()
-        accounts = parse_accounts(ACCOUNTS_FILE)
-        acc = next((a for a in accounts if a["phone"] == phone), None)
+        acc = account_registry.get(phone)
         if not acc:
             show_message(self, "Ошибка", "Аккаунт не найден.")
             return
@@ -3203,7 +3201,7 @@ class AccountsPage(QWidget):
             if not api_hash:
                 show_message(self, "Ошибка", "API Hash не может быть пустым.")
                 return
-            if new_phone != phone and any(a["phone"] == new_phone for a in accounts):
+            if new_phone != phone and new_phone in account_registry.snapshot():
                 show_message(self, "Ошибка", "Аккаунт с таким телефоном уже существует.")
                 return
 
@@ -3219,6 +3217,7 @@ class AccountsPage(QWidget):
                     updated.append(line)
             ensure_file(ACCOUNTS_FILE)
             ACCOUNTS_FILE.write_text("\n".join(updated) + ("\n" if updated else ""), encoding="utf-8")
+            account_registry.invalidate()
 
             if new_phone != phone:
                 for ext in [".session", ".session-journal"]:
@@ -3242,12 +3241,13 @@ class AccountsPage(QWidget):
             self.refresh_table()
 
     def authorize_accounts(self, only_errors: bool):
-        accounts = parse_accounts(ACCOUNTS_FILE)
-        if only_errors:
-            accounts = [a for a in accounts if self.ui.account_status.get(a["phone"], {}).get("state") == "error"]
+        rows = account_registry.with_status("error" if only_errors else None)
+        accounts = [dict(acc) for acc, _ in rows]
         if not accounts:
             show_message(self, "Нет аккаунтов", "Нет аккаунтов для авторизации.")
             return
+        if self.ui.job_blocked(getattr(self, "worker", None)):
+            return
         self.worker = AccountsAuthWorker(accounts, self.ui.bridge, only_errors=only_errors)
         self.worker.log.connect(self.ui.log)
         self.worker.status_update.connect(self._update_status)
@@ -3361,18 +3361,9 @@ class StatsPage(QWidget):
         self.refresh_table()
         self.ui.auto_page_update_hamsters()
 
+    @action_profiler.profiled
     def refresh_table(self):
-        counts = {}
-        csv_path = self.ui.cfg.tokens_csv_path()
-        if csv_path.exists():
-            try:
-                with open(csv_path, "r", encoding="utf-8") as f:
-                    reader = csv.DictReader(f)
-                    for row in reader:
-                        h = (row.get("hamster") or "None").strip() or "None"
-                        counts[h] = counts.get(h, 0) + 1
-            except Exception:
-                pass
+        counts = load_bot_records(self.ui.cfg).hamster_counts()
 
         self.table.setRowCount(0)
         for name, meta in self.ui.hamsters.items():
@@ -3447,9 +3438,396 @@ class StatsPage(QWidget):
             self.ui.auto_page_update_hamsters()
         animate_evaporate_rect(self.table.viewport(), rect, _finish)
 
+TEXT_TRANSLATIONS_EN: Mapping[str, str] = MappingProxyType({
+    "Задачи": "Jobs",
+    "Продолжить задачу": "Resume job",
+    "Удалить задачу": "Discard job",
+    "Незавершённые задачи удаления и revoke. Готовые боты будут пропущены.": "Unfinished delete and revoke jobs. Completed bots will be skipped.",
+    "Нет незавершённых задач.": "No unfinished jobs.",
+    "Ошибка": "Error",
+    "Экспорт токенов": "Export tokens",
+    "Все": "All",
+    "Формат:": "Format:",
+    "С даты:": "From date:",
+    "По дату:": "To date:",
+    "Хомяк:": "Hamster:",
+    "Аккаунт:": "Account:",
+    "Дата должна быть в формате YYYY-MM-DD.": "Date must be in YYYY-MM-DD format.",
+    "Готово": "Done",
+    "Сброс": "Reset",
+    "Пусто": "Empty",
+    "Нет даты": "No date",
+    "Нет выбора": "No selection",
+    "Нет аккаунтов": "No accounts",
+    "Нет аккаунтов для авторизации.": "No accounts for authorization.",
+    "Введите название хомяка.": "Enter a hamster name.",
+    "Уже работает": "Already running",
+    "Сначала остановите текущий процесс.": "Stop the current process first.",
+    "Введите имена через '/'.": "Enter names separated by '/'.",
+    "Выберите картинку (обязательно).": "Select an image (required).",
+    "Выберите одного бота для единичного удаления.": "Select one bot for single deletion.",
+    "Выберите одного бота для revoke token.": "Select one bot for revoke token.",
+    "Выберите ботов в таблице или укажите usernames для удаления.": "Select bots in the table or enter usernames for deletion.",
+    "Выберите ботов или укажите usernames для массового revoke.": "Select bots or enter usernames for mass revoke.",
+    "Нет выбранных ботов для удаления.": "No bots selected for deletion.",
+    "Введите хотя бы один username.": "Enter at least one username.",
+    "Нет доступных аккаунтов для создания.": "No available accounts for creation.",
+    "Лимит ботов": "Bot limit",
+    "Сколько ботов можно создать на аккаунт за запуск?": "How many bots can be created per account per run?",
+    "Редактировать хомяка": "Edit hamster",
+    "Название:": "Name:",
+    "Процент:": "Percent:",
+    "Сохранить": "Save",
+    "Кастомизация авто-режима": "Auto mode customization",
+    "Имя бота (видимое в Telegram)": "Bot name (visible in Telegram)",
+    "Префикс (будет ПЕРЕД СУФФИКСОМ):": "Prefix (before suffix):",
+    "Суффикс (БУДЕТ ПОСЛЕ ПРЕФИКСА):": "Suffix (after prefix):",
+    "Username бота (адрес @...)": "Bot username (address @...)",
+    "Автоматически приводить username к допустимому виду (латиница/цифры/_)": "Automatically sanitize username (latin/number/_)",
+    "Окончание (пример: cat + _bot → cat_bot):": "Suffix (example: cat + _bot → cat_bot):",
+    "Разделитель перед номером (пример: cat_1bot):": "Separator before number (example: cat_1bot):",
+    "Текст после номера (пример: cat_1bot):": "Text after number (example: cat_1bot):",
+    "Сколько вариантов с номером пробовать:": "How many numbered variants to try:",
+    "Сохранение токенов": "Token saving",
+    "Изменить": "Change",
+    "Куда сохранить tokens.txt": "Where to save tokens.txt",
+    "Куда сохранить tokens.csv": "Where to save tokens.csv",
+    "tokens.txt (только токены):": "tokens.txt (tokens only):",
+    "tokens.csv (для статистики):": "tokens.csv (for stats):",
+    "Применить": "Apply",
+    "Закрыть": "Close",
+    "Санитизировать username": "Sanitize username",
+    "Префикс имени:": "Name prefix:",
+    "Суффикс имени:": "Name suffix:",
+    "Окончание username:": "Username suffix:",
+    "Разделитель перед номером:": "Separator before number:",
+    "Текст после номера:": "Text after number:",
+    "Попыток номеров:": "Number attempts:",
+    "Кастомизация сохранена для:": "Customization saved for:",
+    "Токены не найдены.": "No tokens found.",
+    "Нет дат для токенов.": "No token dates found.",
+    "Выберите дату в списке слева.": "Select a date from the list on the left.",
+    "Отметьте даты галочками слева.": "Select dates on the left.",
+    "Токены сгруппированы по датам. Можно копировать, редактировать и удалять.": "Tokens are grouped by dates. You can copy, edit, and delete them.",
+    "Ручной режим": "Manual mode",
+    "Ручной режим в этой версии использует авто-логику. Рекомендуется авто-режим.": "Manual mode in this version uses auto logic. Auto mode is recommended.",
+    "Код авторизации": "Authorization code",
+    "Введите код для": "Enter code for",
+    "Пароль 2FA": "2FA password",
+    "Введите пароль 2FA для": "Enter 2FA password for",
+    "Массовое удаление": "Mass delete",
+    "Массовый Revoke": "Mass revoke",
+    "Продолжить": "Continue",
+    "Отмена": "Cancel",
+    "Поиск": "Search",
+    "Совпадения не найдены.": "No matches found.",
+    "Результаты поиска": "Search results",
+    "Открыть": "Open",
+    "Скопировать": "Copy",
+    "ОК": "OK",
+    "Как выбрать ботов для действия: Удаление?": "How to choose bots for delete?",
+    "Как выбрать ботов для действия: Revoke Token?": "How to choose bots for revoke?",
+    "Выбрать в таблице": "Select in table",
+    "Ввести usernames вручную (без @, через /)": "Enter usernames manually (without @, via /)",
+    "Не найдены": "Not found",
+    "Не удалось найти аккаунты для:": "Could not find accounts for:",
+    "Автозапуск": "Autostart",
+    "Автозапуск доступен только в Windows.": "Autostart is available on Windows only.",
+    "Автозапуск включён.": "Autostart enabled.",
+    "Автозапуск отключён.": "Autostart disabled.",
+    "Ошибка автозапуска:": "Autostart error:",
+    "Резервная копия": "Backup",
+    "Резервная копия создана.": "Backup created.",
+    "Дождитесь окончания импорта резервной копии.": "Wait for the backup import to finish.",
+    "Ошибка создания:": "Create error:",
+    "Импорт резервной копии": "Import backup",
+    "Резервная копия импортирована. Перезапустите приложение.": "Backup imported. Restart the app.",
+    "Ошибка импорта:": "Import error:",
+    "Настройки сброшены. Перезапустите приложение.": "Settings reset. Restart the app.",
+    "Ошибка сброса:": "Reset error:",
+    "Добавить аккаунты": "Add accounts",
+    "Вставьте аккаунты (по одному в строке).": "Paste accounts (one per line).",
+    "Выберите бота": "Select bot",
+    "Имя бота:": "Bot name:",
+    "Кастомизация авто-режима": "Auto mode customization",
+    "Кастомизация:": "Customization:",
+    "Скопировать": "Copy",
+    "Revoke завершён": "Revoke completed",
+    "Операция завершена. Полученные токены:": "Operation completed. Received tokens:",
+    "Токены не были получены.": "No tokens were received.",
+    "Лимит ботов": "Bot limit",
+    "На аккаунтах достигнут лимит 20 ботов:": "Accounts reached the 20-bot limit:",
+    "Перезапуск": "Restart",
+    "Рекомендуется перезапустить авто-режим, чтобы сбросить лимиты/ошибки аккаунтов. Если бот зацикливается на 1-2 аккаунтах, попробуйте снизить лимит на аккаунт и повторить запуск.": "It is recommended to restart auto mode to reset limits/errors. If the bot loops on 1-2 accounts, try lowering the per-account limit and run again.",
+    "ОК": "OK",
+})
+
+UI_TRANSLATIONS: Mapping[str, Mapping[str, str]] = MappingProxyType({
+    "Русский": MappingProxyType({
+        "nav_auto": "Автоматическое создание",
+        "nav_bots": "Боты",
+        "nav_accounts": "Аккаунты",
+        "nav_tokens": "Токены",
+        "nav_stats": "Статистика",
+        "nav_manage": "Удаление / Revoke",
+        "nav_settings": "Настройки",
+        "nav_logs": "История логов",
+        "logs_title": "История логов",
+        "logs_hint": "Поиск по сохранённым логам прошлых запусков: по дате, тегу, телефону или username.",
+        "logs_all_tags": "Все",
+        "logs_text_placeholder": "Телефон или username",
+        "logs_search": "Найти",
+        "logs_placeholder": "Нажмите «Найти», чтобы показать последние записи.",
+        "logs_status": "Найдено: {found} • файлов: {files} • строк в индексе: {lines} • {ms:.0f} мс",
+        "search_placeholder": "Поиск по ботам...",
+        "auto_title": "Автоматическое создание",
+        "auto_chat": "Чат:",
+        "auto_names": "Имена:",
+        "auto_hamster": "Хомяк:",
+        "auto_names_placeholder": "name/name2/name3 (без пробелов)",
+        "auto_pick_img": "Выбрать аватарку (обязательно)",
+        "auto_open_tokens": "Открыть tokens.txt",
+        "auto_limit_edit": "Изменить лимит",
+        "auto_limit_hint": "Лимит: {limit} бота(ов) на аккаунт за 1 запуск (1 запуск = 1 круг).",
+        "auto_custom": "Кастомизация (all bots)",
+        "auto_edit": "Изменить (one bot)",
+        "auto_start": "Запуск (Авто режим)",
+        "auto_stop": "Стоп",
+        "bots_title": "Боты",
+        "bots_hint": "Список ботов и аккаунтов, на которых они созданы.",
+        "bots_refresh": "Обновить",
+        "accounts_title": "Аккаунты",
+        "accounts_hint": "Управление аккаунтами и авторизацией.",
+        "accounts_add": "Добавить аккаунты",
+        "accounts_edit": "Редактировать",
+        "accounts_delete": "Удалить аккаунт",
+        "accounts_auth_all": "Авторизовать все",
+        "accounts_auth_failed": "Авторизовать ошибки",
+        "accounts_refresh": "Обновить",
+        "tokens_title": "Токены",
+        "tokens_hint": "Токены сгруппированы по датам. Можно копировать, редактировать и удалять.",
+        "tokens_placeholder": "Токены для выбранной даты (по одному в строке)...",
+        "tokens_refresh": "Обновить",
+        "tokens_save": "Сохранить изменения",
+        "tokens_copy_selected": "Копировать выбранные",
+        "tokens_copy_latest": "Копировать последние",
+        "tokens_delete_selected": "Удалить выбранные",
+        "tokens_clear": "Очистить список",
+        "tokens_export": "Экспорт...",
+        "stats_title": "Статистика",
+        "stats_name_placeholder": "Название хомяка",
+        "stats_percent_label": "Процент:",
+        "stats_add": "Добавить хомяка",
+        "stats_edit": "Редактировать",
+        "stats_delete": "Удалить выбранный",
+        "stats_refresh": "Обновить",
+        "manage_title": "Удаление и Revoke Token",
+        "manage_hint": "Выберите ботов в таблице или введите usernames для массового удаления или revoke токена.",
+        "manage_refresh": "Обновить список",
+        "manage_delete_mass": "Массовое удаление",
+        "manage_delete_single": "Единичное удаление",
+        "manage_revoke_mass": "Массовый Revoke",
+        "manage_revoke_single": "Revoke Token",
+        "manage_open_revoked": "Открыть revoke_tokens.txt",
+        "manage_resume_job": "Продолжить задачу",
+        "section_jobs": "Задачи",
+        "section_files": "Файлы",
+        "section_run": "Запуск",
+        "section_actions": "Действия",
+        "section_list": "Список",
+        "section_delete": "Удаление",
+        "section_revoke": "Revoke",
+        "section_manage": "Управление",
+        "section_auth": "Авторизация",
+        "bots_table_bot": "Бот",
+        "bots_table_account": "Аккаунт",
+        "bots_table_created": "Создан",
+        "accounts_table_phone": "Телефон",
+        "accounts_table_status": "Статус",
+        "accounts_table_reason": "Причина",
+        "tokens_table_date": "Дата / Токен",
+        "tokens_table_bot": "Бот",
+        "tokens_date_label": "Дата",
+        "stats_table_hamster": "Хомяк",
+        "stats_table_percent": "Процент",
+        "stats_table_bots": "Ботов",
+        "manage_table_bot": "Бот",
+        "manage_table_account": "Аккаунт",
+        "manage_table_token": "Токен",
+        "settings_title": "Настройки",
+        "settings_hint": "",
+        "settings_language": "Язык:",
+        "settings_autostart_label": "Автозапуск с Windows:",
+        "settings_autostart_toggle": "Включить автозапуск",
+        "settings_perf_label": "Отрисовка:",
+        "settings_perf_toggle": "Режим производительности (без теней и анимаций)",
+        "settings_frame_measure": "Замерить кадр",
+        "settings_profile_label": "Профилирование:",
+        "settings_profile_toggle": "Профилировать следующие действия",
+        "settings_frame_result": "Кадр: с тенями {normal:.1f} мс, без теней {fast:.1f} мс",
+        "settings_backup": "Создать резервную копию",
+        "settings_restore": "Импорт резервной копии",
+        "settings_reset": "Сброс до заводских настроек",
+        "settings_onboarding": "Мастер новичка",
+        "settings_support": "Тех. Поддержка",
+        "settings_info_title": "Полезное",
+        "settings_info_tip": "Подсказка: для быстрых операций можно вставлять имена через «/».",
+        "settings_quick_actions": "Быстрые действия",
+        "settings_quick_tokens": "Открыть tokens.txt",
+        "settings_quick_tokens_csv": "Открыть tokens.csv",
+        "settings_quick_revoked": "Открыть revoke_tokens.txt",
+        "onb_auto_title": "Авто‑создание",
+        "onb_auto_body": "• Поле имён принимает список через «/» — это быстрый способ создать несколько ботов за один запуск.\n• Блок «Хомяк» влияет на статистику дохода — выберите того, кому начисляется доля.\n• Картинка в этом разделе назначится всем новым ботам, поэтому проверьте предпросмотр.\n• Кнопка «Запуск (Авто режим)» стартует процесс и запускает очередь по аккаунтам.\n• Лимит «ботов на аккаунт» задаёт, сколько ботов сделает один аккаунт за круг; это помогает обходить лимиты.",
+        "onb_bots_title": "Боты",
+        "onb_bots_body": "• В таблице показаны все созданные боты: username, аккаунт‑создатель и дата.\n• Нажимайте строку, чтобы быстро скопировать нужные данные.\n• «Обновить» подтягивает новые записи сразу после создания.\n• Список помогает проверить, что бот создался и на каком аккаунте он находится.",
+        "onb_accounts_title": "Аккаунты",
+        "onb_accounts_body": "• Формат строки: phone:password:api_id:api_hash. Если 2FA нет — пароль ставьте UNKOWN.\n• «Авторизовать все» проверяет вход и создаёт сессии в папке sessions/.\n• «Авторизовать ошибки» полезно, когда нужно перезапустить только проблемные аккаунты.\n• Колонка статуса показывает причину, по которой аккаунт не участвует в создании ботов.",
+        "onb_tokens_title": "Токены",
+        "onb_tokens_body": "• Токены группируются по датам — так проще находить свежие или старые партии.\n• Раскрывайте дату стрелкой, затем выделяйте нужные токены.\n• Доступны действия: копирование, редактирование и удаление выбранных строк.\n• Это ваш основной «склад» токенов для выдачи пользователям.",
+        "onb_stats_title": "Статистика",
+        "onb_stats_body": "• Здесь вы задаёте «хомяков» с процентами — это виртуальные роли для распределения статистики.\n• Таблица показывает общее количество ботов, относящихся к каждому хомяку.\n• Записи можно редактировать и удалять, если схема распределения изменилась.",
+        "onb_manage_title": "Удаление / Revoke",
+        "onb_manage_body": "• Раздел для обслуживания уже созданных ботов.\n• Массовое удаление удалит всех выделенных ботов одним запуском.\n• Единичное удаление подходит для точечной очистки.\n• Revoke Token создаёт новый токен у BotFather и сохраняет его в revoke_tokens.txt.",
+        "onb_final_title": "Финал",
+        "onb_final_body": "Готово! Теперь вы знаете ключевые функции приложения.\nЕсли захотите повторить — нажмите «Мастер новичка» в настройках.\n\ncreated by whynot",
+    }),
+    "English": MappingProxyType({
+        "nav_auto": "Auto creation",
+        "nav_bots": "Bots",
+        "nav_accounts": "Accounts",
+        "nav_tokens": "Tokens",
+        "nav_stats": "Stats",
+        "nav_manage": "Delete / Revoke",
+        "nav_settings": "Settings",
+        "nav_logs": "Log history",
+        "logs_title": "Log history",
+        "logs_hint": "Search saved logs of past runs by date, tag, phone or username.",
+        "logs_all_tags": "All",
+        "logs_text_placeholder": "Phone or username",
+        "logs_search": "Search",
+        "logs_placeholder": "Press Search to show the latest entries.",
+        "logs_status": "Found: {found} • files: {files} • indexed lines: {lines} • {ms:.0f} ms",
+        "search_placeholder": "Search bots...",
+        "auto_title": "Auto creation",
+        "auto_chat": "Chat:",
+        "auto_names": "Names:",
+        "auto_hamster": "Hamster:",
+        "auto_names_placeholder": "name/name2/name3 (no spaces preferred)",
+        "auto_pick_img": "Pick image (required)",
+        "auto_open_tokens": "Open tokens.txt",
+        "auto_limit_edit": "Change limit",
+        "auto_limit_hint": "Limit: {limit} bot(s) per account per run (1 run = 1 round).",
+        "auto_custom": "Customization",
+        "auto_edit": "Edit",
+        "auto_start": "Start (Auto mode)",
+        "auto_stop": "Stop",
+        "bots_title": "Bots",
+        "bots_hint": "List of bots and the accounts they were created on.",
+        "bots_refresh": "Refresh",
+        "accounts_title": "Accounts",
+        "accounts_hint": "Manage accounts and authorization.",
+        "accounts_add": "Add accounts",
+        "accounts_edit": "Edit",
+        "accounts_delete": "Delete account",
+        "accounts_auth_all": "Authorize all",
+        "accounts_auth_failed": "Authorize failed",
+        "accounts_refresh": "Refresh",
+        "tokens_title": "Tokens",
+        "tokens_hint": "Tokens are grouped by dates. You can copy, edit, and delete them.",
+        "tokens_placeholder": "Tokens for the selected date (one per line)...",
+        "tokens_refresh": "Refresh",
+        "tokens_save": "Save changes",
+        "tokens_copy_selected": "Copy selected",
+        "tokens_copy_latest": "Copy latest",
+        "tokens_delete_selected": "Delete selected",
+        "tokens_clear": "Clear list",
+        "tokens_export": "Export...",
+        "stats_title": "Stats",
+        "stats_name_placeholder": "Hamster name",
+        "stats_percent_label": "Percent:",
+        "stats_add": "Add hamster",
+        "stats_edit": "Edit",
+        "stats_delete": "Delete selected",
+        "stats_refresh": "Refresh",
+        "manage_title": "Delete and Revoke Token",
+        "manage_hint": "Select bots in the table or enter usernames for mass delete or revoke.",
+        "manage_refresh": "Refresh list",
+        "manage_delete_mass": "Mass delete",
+        "manage_delete_single": "Single delete",
+        "manage_revoke_mass": "Mass revoke",
+        "manage_revoke_single": "Revoke token",
+        "manage_open_revoked": "Open revoke_tokens.txt",
+        "manage_resume_job": "Resume job",
+        "section_jobs": "Jobs",
+        "section_files": "Files",
+        "section_run": "Run",
+        "section_actions": "Actions",
+        "section_list": "List",
+        "section_delete": "Delete",
+        "section_revoke": "Revoke",
+        "section_manage": "Manage",
+        "section_auth": "Authorization",
+        "bots_table_bot": "Bot",
+        "bots_table_account": "Account",
+        "bots_table_created": "Created",
+        "accounts_table_phone": "Phone",
+        "accounts_table_status": "Status",
+        "accounts_table_reason": "Reason",
+        "tokens_table_date": "Date / Token",
+        "tokens_table_bot": "Bot",
+        "tokens_date_label": "Date",
+        "stats_table_hamster": "Hamster",
+        "stats_table_percent": "Percent",
+        "stats_table_bots": "Bots",
+        "manage_table_bot": "Bot",
+        "manage_table_account": "Account",
+        "manage_table_token": "Token",
+        "settings_title": "Settings",
+        "settings_hint": "Manage language, autostart, and backups.",
+        "settings_language": "Language:",
+        "settings_autostart_label": "Autostart with Windows:",
+        "settings_autostart_toggle": "Enable autostart",
+        "settings_perf_label": "Rendering:",
+        "settings_perf_toggle": "Performance mode (no shadows or animations)",
+        "settings_frame_measure": "Measure frame",
+        "settings_profile_label": "Profiling:",
+        "settings_profile_toggle": "Profile the next actions",
+        "settings_frame_result": "Frame: with shadows {normal:.1f} ms, flat {fast:.1f} ms",
+        "settings_backup": "Create backup",
+        "settings_restore": "Import backup",
+        "settings_reset": "Factory reset",
+        "settings_onboarding": "Onboarding wizard",
+        "settings_support": "Support",
+        "settings_info_title": "Helpful",
+        "settings_info_tip": "Tip: you can paste names separated by “/” for quick operations.",
+        "settings_quick_actions": "Quick actions",
+        "settings_quick_tokens": "Open tokens.txt",
+        "settings_quick_tokens_csv": "Open tokens.csv",
+        "settings_quick_revoked": "Open revoke_tokens.txt",
+        "onb_auto_title": "Auto creation",
+        "onb_auto_body": "• Enter names using “/” to queue multiple bots in one run.\n• The hamster selector impacts revenue stats — pick who should receive the share.\n• The image you choose here becomes the avatar for every new bot.\n• “Start (Auto mode)” launches the creation flow and cycles through accounts.\n• The per‑account limit controls how many bots one account creates per round.",
+        "onb_bots_title": "Bots",
+        "onb_bots_body": "• This table lists every created bot with username, creator account, and date.\n• Click a row to quickly copy or verify details.\n• “Refresh” syncs new bots right after creation.\n• Use this view to confirm where a bot was created.",
+        "onb_accounts_title": "Accounts",
+        "onb_accounts_body": "• Format: phone:password:api_id:api_hash. Use UNKOWN if 2FA is not enabled.\n• “Authorize all” validates logins and creates sessions in sessions/.\n• “Authorize failed” retries only the accounts with errors.\n• Statuses explain why an account is unavailable.",
+        "onb_tokens_title": "Tokens",
+        "onb_tokens_body": "• Tokens are grouped by date to keep batches organized.\n• Expand a date to see individual tokens.\n• You can copy, edit, or delete selected rows.\n• This is your main storage for distribution.",
+        "onb_stats_title": "Stats",
+        "onb_stats_body": "• Define hamsters with percentages to track revenue distribution.\n• The table shows bot counts per hamster.\n• Edit or delete entries when your scheme changes.",
+        "onb_manage_title": "Delete / Revoke",
+        "onb_manage_body": "• This section is for maintaining existing bots.\n• Mass delete removes all selected bots in one run.\n• Single delete is for precise cleanup.\n• Revoke Token generates a new BotFather token and saves it to revoke_tokens.txt.",
+        "onb_final_title": "Finish",
+        "onb_final_body": "All set! You now know the key features.\nTo replay the tour, use “Onboarding wizard” in Settings.\n\ncreated by whynot_repow",
+    }),
+})
+
 class BotFactoryApp(QMainWindow):
+    profile_ready = pyqtSignal(str, str, float, list)
+
     def __init__(self):
         super().__init__()
+        self.profile_ready.connect(self._on_profile_ready)
+        action_profiler.on_result = self.profile_ready.emit
         self.setLayoutDirection(Qt.LayoutDirection.LeftToRight)
         self.setWindowTitle(APP_NAME)
         self.setWindowFlags(Qt.WindowType.FramelessWindowHint | Qt.WindowType.Window)
@@ -3462,7 +3840,8 @@ class BotFactoryApp(QMainWindow):
         self.setMinimumSize(980, 640)
         self._compact_state: Optional[bool] = None
 
-        self.cfg = AutoConfig(**load_json(CONFIG_FILE, asdict(AutoConfig())))
+        self.cfg = load_config()
+        set_performance_rendering(self.cfg.performance_rendering)
         # Ensure tokens output files exist on startup
         ensure_file(self.cfg.tokens_txt_path())
         ensure_file(self.cfg.tokens_csv_path())
@@ -3476,6 +3855,7 @@ class BotFactoryApp(QMainWindow):
         self.account_status = load_json(ACCOUNTS_STATUS_FILE, {})
         if not isinstance(self.account_status, dict):
             self.account_status = {}
+        account_registry.bind_statuses(self.account_status)
         self.bridge = PromptBridge()
 
         root = QWidget(); self.setCentralWidget(root)
@@ -3523,23 +3903,27 @@ class BotFactoryApp(QMainWindow):
         self.btn_tokens = QPushButton("Токены"); self.btn_tokens.setObjectName("NavBtn")
         self.btn_stats = QPushButton("Статистика"); self.btn_stats.setObjectName("NavBtn")
         self.btn_manage = QPushButton("Удаление / Revoke"); self.btn_manage.setObjectName("NavBtn")
+        self.btn_logs = QPushButton("История логов"); self.btn_logs.setObjectName("NavBtn")
         self.btn_settings = QPushButton("Настройки"); self.btn_settings.setObjectName("NavBtn")
         self.nav_group = QButtonGroup(self)
         self.nav_group.setExclusive(True)
-        for btn in (self.btn_auto, self.btn_bots, self.btn_accounts, self.btn_tokens, self.btn_stats, self.btn_manage, self.btn_settings):
+        for btn in (self.btn_auto, self.btn_bots, self.btn_accounts, self.btn_tokens, self.btn_stats, self.btn_manage, self.btn_settings, self.btn_logs):
             btn.setCheckable(True)
             btn.setProperty("noPressAnim", True)
             self.nav_group.addButton(btn)
 
         side.addWidget(self.btn_auto); side.addWidget(self.btn_bots); side.addWidget(self.btn_accounts); side.addWidget(self.btn_tokens); side.addWidget(self.btn_stats); side.addWidget(self.btn_manage)
         side.addStretch(1)
+        side.addWidget(self.btn_logs)
         side.addWidget(self.btn_settings)
         side.addSpacing(6)
         foot = QLabel("Выход: tokens.txt • tokens.csv • sessions/"); foot.setObjectName("Footer")
         side.addWidget(foot)
         body.addWidget(sidebar, 1)
 
+        self._run_log = open_run_logger(self.cfg.log_dir_path())
         self._logboxes: List[LogBox] = []
+        self.log_document = LogDocument(self)
         self.logbox = LogBox()
         self.register_logbox(self.logbox)
         self.stack = QStackedWidget(); self.stack.setObjectName("Stack")
@@ -3551,6 +3935,7 @@ class BotFactoryApp(QMainWindow):
         self.stats_page = StatsPage(self)
         self.manage_page = ManageBotsPage(self)
         self.settings_page = SettingsPage(self)
+        self.logs_page = LogHistoryPage(self)
 
         self.stack.addWidget(self.auto_page)
         self.stack.addWidget(self.bots_page)
@@ -3559,6 +3944,7 @@ class BotFactoryApp(QMainWindow):
         self.stack.addWidget(self.stats_page)
         self.stack.addWidget(self.manage_page)
         self.stack.addWidget(self.settings_page)
+        self.stack.addWidget(self.logs_page)
 
         content_wrap = QFrame(); content_wrap.setObjectName("ContentWrap")
         apply_shadow(content_wrap, blur=30, alpha=150, offset=QPointF(0, 8))
@@ -3575,12 +3961,13 @@ class BotFactoryApp(QMainWindow):
         self.btn_stats.clicked.connect(lambda: self._nav(4))
         self.btn_manage.clicked.connect(lambda: self._nav(5))
         self.btn_settings.clicked.connect(lambda: self._nav(6))
+        self.btn_logs.clicked.connect(lambda: self._nav(7))
         self._nav(0)
 
         self.bridge.request_code.connect(self._ask_code)
         self.bridge.request_password.connect(self._ask_password)
 
-        self.setStyleSheet(self._style())
+        self.setStyleSheet(self._full_style())
         self._init_compact_state()
         self.animator = ActionAnimator(self)
         QApplication.instance().installEventFilter(self.animator)
@@ -3960,9 +4347,10 @@ class BotFactoryApp(QMainWindow):
         QScrollArea QWidget { background: transparent; }
     """
 
+    @action_profiler.profiled
     def _nav(self, idx: int):
         self.stack.setCurrentIndex(idx)
-        btns = [self.btn_auto, self.btn_bots, self.btn_accounts, self.btn_tokens, self.btn_stats, self.btn_manage, self.btn_settings]
+        btns = [self.btn_auto, self.btn_bots, self.btn_accounts, self.btn_tokens, self.btn_stats, self.btn_manage, self.btn_settings, self.btn_logs]
         for i, b in enumerate(btns):
             is_active = i == idx
             b.setProperty("active", "true" if is_active else "false")
@@ -3975,6 +4363,7 @@ class BotFactoryApp(QMainWindow):
             pass
         animate_section_fade(self.stack.currentWidget(), 180)
 
+    @action_profiler.profiled
     def _handle_global_search(self):
         query = self.global_search.text().strip().lower()
         if not query:
@@ -3988,7 +4377,7 @@ class BotFactoryApp(QMainWindow):
 
     def _find_bot_matches(self, query: str):
         results = {}
-        t = self._translations().get(self.cfg.language, self._translations()["Русский"])
+        t = self.ui_strings()
 
         bots_table = self.bots_page.table
         bot_rows = []
@@ -4191,7 +4580,7 @@ class BotFactoryApp(QMainWindow):
         _sync_section(0)
 
     def _onboarding_sections(self) -> List[Dict[str, object]]:
-        t = self._translations().get(self.cfg.language, self._translations()["Русский"])
+        t = self.ui_strings()
         return [
             {"title": t["onb_auto_title"], "body": t["onb_auto_body"], "page": self.auto_page,
              "spotlight": self._section_spotlight(self.auto_page)},
@@ -4248,362 +4637,43 @@ class BotFactoryApp(QMainWindow):
     def register_logbox(self, logbox: LogBox):
         if logbox not in self._logboxes:
             self._logboxes.append(logbox)
+            logbox.attach(self.log_document)
 
     def log(self, s: str):
-        msg = translate_log_message(s, self.cfg.language)
-        for box in self._logboxes:
-            box.append(msg)
+        for line in s.splitlines():
+            self._run_log.info(line)
+        self.log_document.append(translate_log_message(s, self.cfg.language))
 
     def translate_text(self, text: str) -> str:
         if self.cfg.language != "English":
             return text
-        mapping = {
-            "Ошибка": "Error",
-            "Готово": "Done",
-            "Сброс": "Reset",
-            "Пусто": "Empty",
-            "Нет даты": "No date",
-            "Нет выбора": "No selection",
-            "Нет аккаунтов": "No accounts",
-            "Нет аккаунтов для авторизации.": "No accounts for authorization.",
-            "Введите название хомяка.": "Enter a hamster name.",
-            "Уже работает": "Already running",
-            "Сначала остановите текущий процесс.": "Stop the current process first.",
-            "Введите имена через '/'.": "Enter names separated by '/'.",
-            "Выберите картинку (обязательно).": "Select an image (required).",
-            "Выберите одного бота для единичного удаления.": "Select one bot for single deletion.",
-            "Выберите одного бота для revoke token.": "Select one bot for revoke token.",
-            "Выберите ботов в таблице или укажите usernames для удаления.": "Select bots in the table or enter usernames for deletion.",
-            "Выберите ботов или укажите usernames для массового revoke.": "Select bots or enter usernames for mass revoke.",
-            "Нет выбранных ботов для удаления.": "No bots selected for deletion.",
-            "Введите хотя бы один username.": "Enter at least one username.",
-            "Нет доступных аккаунтов для создания.": "No available accounts for creation.",
-            "Лимит ботов": "Bot limit",
-            "Сколько ботов можно создать на аккаунт за запуск?": "How many bots can be created per account per run?",
-            "Редактировать хомяка": "Edit hamster",
-            "Название:": "Name:",
-            "Процент:": "Percent:",
-            "Сохранить": "Save",
-            "Кастомизация авто-режима": "Auto mode customization",
-            "Имя бота (видимое в Telegram)": "Bot name (visible in Telegram)",
-            "Префикс (будет ПЕРЕД СУФФИКСОМ):": "Prefix (before suffix):",
-            "Суффикс (БУДЕТ ПОСЛЕ ПРЕФИКСА):": "Suffix (after prefix):",
-            "Username бота (адрес @...)": "Bot username (address @...)",
-            "Автоматически приводить username к допустимому виду (латиница/цифры/_)": "Automatically sanitize username (latin/number/_)",
-            "Окончание (пример: cat + _bot → cat_bot):": "Suffix (example: cat + _bot → cat_bot):",
-            "Разделитель перед номером (пример: cat_1bot):": "Separator before number (example: cat_1bot):",
-            "Текст после номера (пример: cat_1bot):": "Text after number (example: cat_1bot):",
-            "Сколько вариантов с номером пробовать:": "How many numbered variants to try:",
-            "Сохранение токенов": "Token saving",
-            "Изменить": "Change",
-            "Куда сохранить tokens.txt": "Where to save tokens.txt",
-            "Куда сохранить tokens.csv": "Where to save tokens.csv",
-            "tokens.txt (только токены):": "tokens.txt (tokens only):",
-            "tokens.csv (для статистики):": "tokens.csv (for stats):",
-            "Применить": "Apply",
-            "Закрыть": "Close",
-            "Санитизировать username": "Sanitize username",
-            "Префикс имени:": "Name prefix:",
-            "Суффикс имени:": "Name suffix:",
-            "Окончание username:": "Username suffix:",
-            "Разделитель перед номером:": "Separator before number:",
-            "Текст после номера:": "Text after number:",
-            "Попыток номеров:": "Number attempts:",
-            "Кастомизация сохранена для:": "Customization saved for:",
-            "Токены не найдены.": "No tokens found.",
-            "Нет дат для токенов.": "No token dates found.",
-            "Выберите дату в списке слева.": "Select a date from the list on the left.",
-            "Отметьте даты галочками слева.": "Select dates on the left.",
-            "Токены сгруппированы по датам. Можно копировать, редактировать и удалять.": "Tokens are grouped by dates. You can copy, edit, and delete them.",
-            "Ручной режим": "Manual mode",
-            "Ручной режим в этой версии использует авто-логику. Рекомендуется авто-режим.": "Manual mode in this version uses auto logic. Auto mode is recommended.",
-            "Код авторизации": "Authorization code",
-            "Введите код для": "Enter code for",
-            "Пароль 2FA": "2FA password",
-            "Введите пароль 2FA для": "Enter 2FA password for",
-            "Массовое удаление": "Mass delete",
-            "Массовый Revoke": "Mass revoke",
-            "Продолжить": "Continue",
-            "Отмена": "Cancel",
-            "Поиск": "Search",
-            "Совпадения не найдены.": "No matches found.",
-            "Результаты поиска": "Search results",
-            "Открыть": "Open",
-            "Скопировать": "Copy",
-            "ОК": "OK",
-            "Как выбрать ботов для действия: Удаление?": "How to choose bots for delete?",
-            "Как выбрать ботов для действия: Revoke Token?": "How to choose bots for revoke?",
-            "Выбрать в таблице": "Select in table",
-            "Ввести usernames вручную (без @, через /)": "Enter usernames manually (without @, via /)",
-            "Не найдены": "Not found",
-            "Не удалось найти аккаунты для:": "Could not find accounts for:",
-            "Автозапуск": "Autostart",
-            "Автозапуск доступен только в Windows.": "Autostart is available on Windows only.",
-            "Автозапуск включён.": "Autostart enabled.",
-            "Автозапуск отключён.": "Autostart disabled.",
-            "Ошибка автозапуска:": "Autostart error:",
-            "Резервная копия": "Backup",
-            "Резервная копия создана.": "Backup created.",
-            "Ошибка создания:": "Create error:",
-            "Импорт резервной копии": "Import backup",
-            "Резервная копия импортирована. Перезапустите приложение.": "Backup imported. Restart the app.",
-            "Ошибка импорта:": "Import error:",
-            "Настройки сброшены. Перезапустите приложение.": "Settings reset. Restart the app.",
-            "Ошибка сброса:": "Reset error:",
-            "Добавить аккаунты": "Add accounts",
-            "Вставьте аккаунты (по одному в строке).": "Paste accounts (one per line).",
-            "Выберите бота": "Select bot",
-            "Имя бота:": "Bot name:",
-            "Кастомизация авто-режима": "Auto mode customization",
-            "Кастомизация:": "Customization:",
-            "Скопировать": "Copy",
-            "Revoke завершён": "Revoke completed",
-            "Операция завершена. Полученные токены:": "Operation completed. Received tokens:",
-            "Токены не были получены.": "No tokens were received.",
-            "Лимит ботов": "Bot limit",
-            "На аккаунтах достигнут лимит 20 ботов:": "Accounts reached the 20-bot limit:",
-            "Перезапуск": "Restart",
-            "Рекомендуется перезапустить авто-режим, чтобы сбросить лимиты/ошибки аккаунтов. Если бот зацикливается на 1-2 аккаунтах, попробуйте снизить лимит на аккаунт и повторить запуск.": "It is recommended to restart auto mode to reset limits/errors. If the bot loops on 1-2 accounts, try lowering the per-account limit and run again.",
-            "ОК": "OK",
-        }
-        if text in mapping:
-            return mapping[text]
+        translated = TEXT_TRANSLATIONS_EN.get(text)
+        if translated is not None:
+            return translated
         if text.startswith("Введите код для "):
             return text.replace("Введите код для ", "Enter code for ")
         if text.startswith("Введите пароль 2FA для "):
             return text.replace("Введите пароль 2FA для ", "Enter 2FA password for ")
+        if text.startswith("Не удалось сохранить состояние: "):
+            return text.replace("Не удалось сохранить состояние: ", "Failed to save state: ")
+        if text.startswith("Ошибка чтения логов: "):
+            return text.replace("Ошибка чтения логов: ", "Failed to read logs: ")
+        if text.startswith("Незавершённых задач: "):
+            return text.replace("Незавершённых задач: ", "Unfinished jobs: ")
         if text.startswith("Кастомизация: "):
             return text.replace("Кастомизация: ", "Customization: ")
         if text.startswith("На аккаунтах достигнут лимит 20 ботов:"):
             return text.replace("На аккаунтах достигнут лимит 20 ботов:", "Accounts reached the 20-bot limit:")
         return text
 
-    def _translations(self) -> Dict[str, Dict[str, str]]:
-        return {
-            "Русский": {
-                "nav_auto": "Автоматическое создание",
-                "nav_bots": "Боты",
-                "nav_accounts": "Аккаунты",
-                "nav_tokens": "Токены",
-                "nav_stats": "Статистика",
-                "nav_manage": "Удаление / Revoke",
-                "nav_settings": "Настройки",
-                "search_placeholder": "Поиск по ботам...",
-                "auto_title": "Автоматическое создание",
-                "auto_chat": "Чат:",
-                "auto_names": "Имена:",
-                "auto_hamster": "Хомяк:",
-                "auto_names_placeholder": "name/name2/name3 (без пробелов)",
-                "auto_pick_img": "Выбрать аватарку (обязательно)",
-                "auto_open_tokens": "Открыть tokens.txt",
-                "auto_limit_edit": "Изменить лимит",
-                "auto_limit_hint": "Лимит: {limit} бота(ов) на аккаунт за 1 запуск (1 запуск = 1 круг).",
-                "auto_custom": "Кастомизация (all bots)",
-                "auto_edit": "Изменить (one bot)",
-                "auto_start": "Запуск (Авто режим)",
-                "auto_stop": "Стоп",
-                "bots_title": "Боты",
-                "bots_hint": "Список ботов и аккаунтов, на которых они созданы.",
-                "bots_refresh": "Обновить",
-                "accounts_title": "Аккаунты",
-                "accounts_hint": "Управление аккаунтами и авторизацией.",
-                "accounts_add": "Добавить аккаунты",
-                "accounts_edit": "Редактировать",
-                "accounts_delete": "Удалить аккаунт",
-                "accounts_auth_all": "Авторизовать все",
-                "accounts_auth_failed": "Авторизовать ошибки",
-                "accounts_refresh": "Обновить",
-                "tokens_title": "Токены",
-                "tokens_hint": "Токены сгруппированы по датам. Можно копировать, редактировать и удалять.",
-                "tokens_placeholder": "Токены для выбранной даты (по одному в строке)...",
-                "tokens_refresh": "Обновить",
-                "tokens_save": "Сохранить изменения",
-                "tokens_copy_selected": "Копировать выбранные",
-                "tokens_copy_latest": "Копировать последние",
-                "tokens_delete_selected": "Удалить выбранные",
-                "tokens_clear": "Очистить список",
-                "stats_title": "Статистика",
-                "stats_name_placeholder": "Название хомяка",
-                "stats_percent_label": "Процент:",
-                "stats_add": "Добавить хомяка",
-                "stats_edit": "Редактировать",
-                "stats_delete": "Удалить выбранный",
-                "stats_refresh": "Обновить",
-                "manage_title": "Удаление и Revoke Token",
-                "manage_hint": "Выберите ботов в таблице или введите usernames для массового удаления или revoke токена.",
-                "manage_refresh": "Обновить список",
-                "manage_delete_mass": "Массовое удаление",
-                "manage_delete_single": "Единичное удаление",
-                "manage_revoke_mass": "Массовый Revoke",
-                "manage_revoke_single": "Revoke Token",
-                "manage_open_revoked": "Открыть revoke_tokens.txt",
-                "section_files": "Файлы",
-                "section_run": "Запуск",
-                "section_actions": "Действия",
-                "section_list": "Список",
-                "section_delete": "Удаление",
-                "section_revoke": "Revoke",
-                "section_manage": "Управление",
-                "section_auth": "Авторизация",
-                "bots_table_bot": "Бот",
-                "bots_table_account": "Аккаунт",
-                "bots_table_created": "Создан",
-                "accounts_table_phone": "Телефон",
-                "accounts_table_status": "Статус",
-                "accounts_table_reason": "Причина",
-                "tokens_table_date": "Дата / Токен",
-                "tokens_table_bot": "Бот",
-                "tokens_date_label": "Дата",
-                "stats_table_hamster": "Хомяк",
-                "stats_table_percent": "Процент",
-                "stats_table_bots": "Ботов",
-                "manage_table_bot": "Бот",
-                "manage_table_account": "Аккаунт",
-                "settings_title": "Настройки",
-                "settings_hint": "",
-                "settings_language": "Язык:",
-                "settings_autostart_label": "Автозапуск с Windows:",
-                "settings_autostart_toggle": "Включить автозапуск",
-                "settings_backup": "Создать резервную копию",
-                "settings_restore": "Импорт резервной копии",
-                "settings_reset": "Сброс до заводских настроек",
-                "settings_onboarding": "Мастер новичка",
-                "settings_support": "Тех. Поддержка",
-                "settings_info_title": "Полезное",
-                "settings_info_tip": "Подсказка: для быстрых операций можно вставлять имена через «/».",
-                "settings_quick_actions": "Быстрые действия",
-                "settings_quick_tokens": "Открыть tokens.txt",
-                "settings_quick_tokens_csv": "Открыть tokens.csv",
-                "settings_quick_revoked": "Открыть revoke_tokens.txt",
-                "onb_auto_title": "Авто‑создание",
-                "onb_auto_body": "• Поле имён принимает список через «/» — это быстрый способ создать несколько ботов за один запуск.\n• Блок «Хомяк» влияет на статистику дохода — выберите того, кому начисляется доля.\n• Картинка в этом разделе назначится всем новым ботам, поэтому проверьте предпросмотр.\n• Кнопка «Запуск (Авто режим)» стартует процесс и запускает очередь по аккаунтам.\n• Лимит «ботов на аккаунт» задаёт, сколько ботов сделает один аккаунт за круг; это помогает обходить лимиты.",
-                "onb_bots_title": "Боты",
-                "onb_bots_body": "• В таблице показаны все созданные боты: username, аккаунт‑создатель и дата.\n• Нажимайте строку, чтобы быстро скопировать нужные данные.\n• «Обновить» подтягивает новые записи сразу после создания.\n• Список помогает проверить, что бот создался и на каком аккаунте он находится.",
-                "onb_accounts_title": "Аккаунты",
-                "onb_accounts_body": "• Формат строки: phone:password:api_id:api_hash. Если 2FA нет — пароль ставьте UNKOWN.\n• «Авторизовать все» проверяет вход и создаёт сессии в папке sessions/.\n• «Авторизовать ошибки» полезно, когда нужно перезапустить только проблемные аккаунты.\n• Колонка статуса показывает причину, по которой аккаунт не участвует в создании ботов.",
-                "onb_tokens_title": "Токены",
-                "onb_tokens_body": "• Токены группируются по датам — так проще находить свежие или старые партии.\n• Раскрывайте дату стрелкой, затем выделяйте нужные токены.\n• Доступны действия: копирование, редактирование и удаление выбранных строк.\n• Это ваш основной «склад» токенов для выдачи пользователям.",
-                "onb_stats_title": "Статистика",
-                "onb_stats_body": "• Здесь вы задаёте «хомяков» с процентами — это виртуальные роли для распределения статистики.\n• Таблица показывает общее количество ботов, относящихся к каждому хомяку.\n• Записи можно редактировать и удалять, если схема распределения изменилась.",
-                "onb_manage_title": "Удаление / Revoke",
-                "onb_manage_body": "• Раздел для обслуживания уже созданных ботов.\n• Массовое удаление удалит всех выделенных ботов одним запуском.\n• Единичное удаление подходит для точечной очистки.\n• Revoke Token создаёт новый токен у BotFather и сохраняет его в revoke_tokens.txt.",
-                "onb_final_title": "Финал",
-                "onb_final_body": "Готово! Теперь вы знаете ключевые функции приложения.\nЕсли захотите повторить — нажмите «Мастер новичка» в настройках.\n\ncreated by whynot",
-            },
-            "English": {
-                "nav_auto": "Auto creation",
-                "nav_bots": "Bots",
-                "nav_accounts": "Accounts",
-                "nav_tokens": "Tokens",
-                "nav_stats": "Stats",
-                "nav_manage": "Delete / Revoke",
-                "nav_settings": "Settings",
-                "search_placeholder": "Search bots...",
-                "auto_title": "Auto creation",
-                "auto_chat": "Chat:",
-                "auto_names": "Names:",
-                "auto_hamster": "Hamster:",
-                "auto_names_placeholder": "name/name2/name3 (no spaces preferred)",
-                "auto_pick_img": "Pick image (required)",
-                "auto_open_tokens": "Open tokens.txt",
-                "auto_limit_edit": "Change limit",
-                "auto_limit_hint": "Limit: {limit} bot(s) per account per run (1 run = 1 round).",
-                "auto_custom": "Customization",
-                "auto_edit": "Edit",
-                "auto_start": "Start (Auto mode)",
-                "auto_stop": "Stop",
-                "bots_title": "Bots",
-                "bots_hint": "List of bots and the accounts they were created on.",
-                "bots_refresh": "Refresh",
-                "accounts_title": "Accounts",
-                "accounts_hint": "Manage accounts and authorization.",
-                "accounts_add": "Add accounts",
-                "accounts_edit": "Edit",
-                "accounts_delete": "Delete account",
-                "accounts_auth_all": "Authorize all",
-                "accounts_auth_failed": "Authorize failed",
-                "accounts_refresh": "Refresh",
-                "tokens_title": "Tokens",
-                "tokens_hint": "Tokens are grouped by dates. You can copy, edit, and delete them.",
-                "tokens_placeholder": "Tokens for the selected date (one per line)...",
-                "tokens_refresh": "Refresh",
-                "tokens_save": "Save changes",
-                "tokens_copy_selected": "Copy selected",
-                "tokens_copy_latest": "Copy latest",
-                "tokens_delete_selected": "Delete selected",
-                "tokens_clear": "Clear list",
-                "stats_title": "Stats",
-                "stats_name_placeholder": "Hamster name",
-                "stats_percent_label": "Percent:",
-                "stats_add": "Add hamster",
-                "stats_edit": "Edit",
-                "stats_delete": "Delete selected",
-                "stats_refresh": "Refresh",
-                "manage_title": "Delete and Revoke Token",
-                "manage_hint": "Select bots in the table or enter usernames for mass delete or revoke.",
-                "manage_refresh": "Refresh list",
-                "manage_delete_mass": "Mass delete",
-                "manage_delete_single": "Single delete",
-                "manage_revoke_mass": "Mass revoke",
-                "manage_revoke_single": "Revoke token",
-                "manage_open_revoked": "Open revoke_tokens.txt",
-                "section_files": "Files",
-                "section_run": "Run",
-                "section_actions": "Actions",
-                "section_list": "List",
-                "section_delete": "Delete",
-                "section_revoke": "Revoke",
-                "section_manage": "Manage",
-                "section_auth": "Authorization",
-                "bots_table_bot": "Bot",
-                "bots_table_account": "Account",
-                "bots_table_created": "Created",
-                "accounts_table_phone": "Phone",
-                "accounts_table_status": "Status",
-                "accounts_table_reason": "Reason",
-                "tokens_table_date": "Date / Token",
-                "tokens_table_bot": "Bot",
-                "tokens_date_label": "Date",
-                "stats_table_hamster": "Hamster",
-                "stats_table_percent": "Percent",
-                "stats_table_bots": "Bots",
-                "manage_table_bot": "Bot",
-                "manage_table_account": "Account",
-                "settings_title": "Settings",
-                "settings_hint": "Manage language, autostart, and backups.",
-                "settings_language": "Language:",
-                "settings_autostart_label": "Autostart with Windows:",
-                "settings_autostart_toggle": "Enable autostart",
-                "settings_backup": "Create backup",
-                "settings_restore": "Import backup",
-                "settings_reset": "Factory reset",
-                "settings_onboarding": "Onboarding wizard",
-                "settings_support": "Support",
-                "settings_info_title": "Helpful",
-                "settings_info_tip": "Tip: you can paste names separated by “/” for quick operations.",
-                "settings_quick_actions": "Quick actions",
-                "settings_quick_tokens": "Open tokens.txt",
-                "settings_quick_tokens_csv": "Open tokens.csv",
-                "settings_quick_revoked": "Open revoke_tokens.txt",
-                "onb_auto_title": "Auto creation",
-                "onb_auto_body": "• Enter names using “/” to queue multiple bots in one run.\n• The hamster selector impacts revenue stats — pick who should receive the share.\n• The image you choose here becomes the avatar for every new bot.\n• “Start (Auto mode)” launches the creation flow and cycles through accounts.\n• The per‑account limit controls how many bots one account creates per round.",
-                "onb_bots_title": "Bots",
-                "onb_bots_body": "• This table lists every created bot with username, creator account, and date.\n• Click a row to quickly copy or verify details.\n• “Refresh” syncs new bots right after creation.\n• Use this view to confirm where a bot was created.",
-                "onb_accounts_title": "Accounts",
-                "onb_accounts_body": "• Format: phone:password:api_id:api_hash. Use UNKOWN if 2FA is not enabled.\n• “Authorize all” validates logins and creates sessions in sessions/.\n• “Authorize failed” retries only the accounts with errors.\n• Statuses explain why an account is unavailable.",
-                "onb_tokens_title": "Tokens",
-                "onb_tokens_body": "• Tokens are grouped by date to keep batches organized.\n• Expand a date to see individual tokens.\n• You can copy, edit, or delete selected rows.\n• This is your main storage for distribution.",
-                "onb_stats_title": "Stats",
-                "onb_stats_body": "• Define hamsters with percentages to track revenue distribution.\n• The table shows bot counts per hamster.\n• Edit or delete entries when your scheme changes.",
-                "onb_manage_title": "Delete / Revoke",
-                "onb_manage_body": "• This section is for maintaining existing bots.\n• Mass delete removes all selected bots in one run.\n• Single delete is for precise cleanup.\n• Revoke Token generates a new BotFather token and saves it to revoke_tokens.txt.",
-                "onb_final_title": "Finish",
-                "onb_final_body": "All set! You now know the key features.\nTo replay the tour, use “Onboarding wizard” in Settings.\n\ncreated by whynot_repow",
-            }
-        }
+    def _translations(self) -> Mapping[str, Mapping[str, str]]:
+        return UI_TRANSLATIONS
+
+    def ui_strings(self, lang: Optional[str] = None) -> Mapping[str, str]:
+        return UI_TRANSLATIONS.get(lang or self.cfg.language, UI_TRANSLATIONS["Русский"])
 
     def apply_language(self, lang: str):
-        t = self._translations().get(lang, self._translations()["Русский"])
+        t = self.ui_strings(lang)
         self.btn_auto.setText(t["nav_auto"])
         self.btn_bots.setText(t["nav_bots"])
         self.btn_accounts.setText(t["nav_accounts"])
@@ -4611,6 +4681,7 @@ class BotFactoryApp(QMainWindow):
         self.btn_stats.setText(t["nav_stats"])
         self.btn_manage.setText(t["nav_manage"])
         self.btn_settings.setText(t["nav_settings"])
+        self.btn_logs.setText(t["nav_logs"])
         if hasattr(self, "global_search") and self.global_search:
             self.global_search.setPlaceholderText(t["search_placeholder"])
         if hasattr(self, "search_button") and self.search_button:
@@ -4623,10 +4694,12 @@ class BotFactoryApp(QMainWindow):
         self.manage_page.update_language(t)
         if hasattr(self, "settings_page") and self.settings_page:
             self.settings_page.update_language(t)
+        if hasattr(self, "logs_page") and self.logs_page:
+            self.logs_page.update_language(t)
         self.auto_page.update_limit_hint()
 
     def format_limit_hint(self, limit: int) -> str:
-        t = self._translations().get(self.cfg.language, self._translations()["Русский"])
+        t = self.ui_strings()
         return t["auto_limit_hint"].format(limit=limit)
 
     def set_language(self, lang: str):
@@ -4634,6 +4707,66 @@ class BotFactoryApp(QMainWindow):
         self.save_config()
         self.apply_language(lang)
 
+    def _full_style(self) -> str:
+        if not is_performance_rendering():
+            return self._style()
+        return self._style() + """
+        #Sidebar, #ContentWrap, #Card {
+            border: 1px solid rgba(255,255,255,0.08);
+            border-bottom: 2px solid rgba(0,0,0,0.55);
+        }
+        """
+
+    def set_performance_rendering(self, enabled: bool):
+        self.cfg.performance_rendering = bool(enabled)
+        self.save_config()
+        set_performance_rendering(enabled)
+        self.setStyleSheet(self._full_style())
+
+    def set_profiling(self, enabled: bool):
+        if not enabled:
+            action_profiler.disarm()
+            self.log("[PROFILE] Профилирование выключено.")
+            return
+        count = self.settings_page.profile_count.value()
+        action_profiler.arm(count, worker=True)
+        self.log(f"[PROFILE] Профилирование включено: следующие {count} действий и следующий запуск задачи.")
+
+    def _on_profile_ready(self, name: str, path: str, elapsed_ms: float, lines: list):
+        if path:
+            self.log(f"[PROFILE] {name}: {elapsed_ms:.0f} мс, профиль: {path}")
+        else:
+            self.log(f"[PROFILE] {name}: {elapsed_ms:.0f} мс, профиль не сохранён")
+        self.log("[PROFILE]       всего       своё   вызовы  функция")
+        for line in lines:
+            self.log(f"[PROFILE] {line}")
+        if not action_profiler.armed() and hasattr(self, "settings_page"):
+            self.settings_page.profile_toggle.blockSignals(True)
+            self.settings_page.profile_toggle.setChecked(False)
+            self.settings_page.profile_toggle.blockSignals(False)
+
+    def _frame_time_ms(self, samples: int = 20) -> float:
+        targets = [w for w in (self.sidebar_frame, self.content_wrap) if w.isVisible()]
+        QApplication.processEvents()
+        started = time.perf_counter()
+        for _ in range(samples):
+            for widget in targets:
+                widget.repaint()
+        return (time.perf_counter() - started) * 1000 / samples
+
+    def measure_frame_times(self):
+        current = is_performance_rendering()
+        results = {}
+        for mode in (False, True):
+            set_performance_rendering(mode)
+            results["fast" if mode else "normal"] = self._frame_time_ms()
+        set_performance_rendering(current)
+        t = self.ui_strings()
+        text = t["settings_frame_result"].format(**results)
+        if hasattr(self, "settings_page") and self.settings_page:
+            self.settings_page.frame_result.setText(text)
+        self.log(f"[PERF] Кадр: с тенями {results['normal']:.1f} мс, без теней {results['fast']:.1f} мс")
+
     def pick_image(self):
         p, _ = QFileDialog.getOpenFileName(self, "Выбрать аватарку", str(BASE_DIR), "Images (*.png *.jpg *.jpeg *.webp)")
         if p:
@@ -4687,53 +4820,144 @@ class BotFactoryApp(QMainWindow):
             if self.settings_page:
                 self.settings_page.autostart_toggle.setChecked(self.is_autostart_enabled())
 
+    def _backup_sources(self) -> List[Tuple[Path, str]]:
+        return backup_sources(self.cfg)
+
+    def restore_running(self) -> bool:
+        worker = getattr(self, "_backup_worker", None)
+        return getattr(self, "_restoring", False) and worker is not None and worker.isRunning()
+
+    def job_blocked(self, worker=None) -> bool:
+        # Every job entry point goes through here: nothing may touch BASE_DIR while a restore swaps files
+        if self.restore_running():
+            show_message(self, "Резервная копия", "Дождитесь окончания импорта резервной копии.")
+            return True
+        if worker is not None and worker.isRunning():
+            show_message(self, "Уже работает", "Сначала остановите текущий процесс.")
+            return True
+        return False
+
+    def _run_backup_job(self, job, on_done, failure_title: str, failure_prefix: str, restoring: bool = False) -> bool:
+        worker = getattr(self, "_backup_worker", None)
+        if worker is not None and worker.isRunning():
+            show_message(self, "Уже работает", "Сначала остановите текущий процесс.")
+            return False
+        self._restoring = restoring
+        page = self.settings_page
+        page.backup_btn.setEnabled(False)
+        page.restore_btn.setEnabled(False)
+        self._backup_worker = JobWorker(job)
+        self._backup_worker.progress.connect(
+            lambda done, total, name: page.backup_status.setText(f"{done}/{total} • {name}")
+        )
+
+        def _finish():
+            page.backup_btn.setEnabled(True)
+            page.restore_btn.setEnabled(True)
+            page.backup_status.setText("")
+
+        def _ok(result: dict):
+            _finish()
+            on_done(result)
+
+        def _failed(error: str):
+            _finish()
+            show_message(self, failure_title, f"{failure_prefix} {error}")
+
+        self._backup_worker.finished_ok.connect(_ok)
+        self._backup_worker.failed.connect(_failed)
+        self._backup_worker.start()
+        return True
+
+    @action_profiler.profiled
     def create_backup(self):
-        path, _ = QFileDialog.getSaveFileName(self, "Сохранить резервную копию", str(BASE_DIR / "backup.zip"), "ZIP (*.zip)")
+        path = QFileDialog.getExistingDirectory(self, "Папка резервных копий", str(self.cfg.backup_dir_path()))
         if not path:
             return
+        if Path(path) != self.cfg.backup_dir_path():
+            self.cfg.backup_dir = path
+            self.save_config()
+        store = BackupStore(Path(path))
+        sources = self._backup_sources()
         try:
-            files = [
-                CONFIG_FILE,
-                ACCOUNTS_FILE,
-                HAMSTERS_FILE,
-                FROZEN_FILE,
-                ACCOUNTS_STATUS_FILE,
-                self.cfg.tokens_txt_path(),
-                self.cfg.tokens_csv_path(),
-                self.cfg.revoked_tokens_txt_path(),
-            ]
-            with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as zf:
-                for f in files:
-                    if f.exists():
-                        zf.write(f, f.relative_to(BASE_DIR))
-                if SESSIONS_DIR.exists():
-                    for root, _, filenames in os.walk(SESSIONS_DIR):
-                        for fname in filenames:
-                            full = Path(root) / fname
-                            zf.write(full, full.relative_to(BASE_DIR))
+            state_writer.flush()
+        except OSError as e:
+            show_message(self, "Резервная копия", f"Не удалось сохранить состояние: {e}")
+            return
+
+        keep = self.cfg.backup_keep
+
+        def _job(progress):
+            result = store.snapshot(sources, progress)
+            result["pruned"] = store.prune(keep)
+            return result
+
+        def _done(result: dict):
+            self.log(
+                f"[BACKUP] Снимок {result['id']}: файлов {result['files']}, "
+                f"без изменений {result['files_unchanged']}, записано {result['bytes_written'] // 1024} КБ"
+            )
+            pruned = result["pruned"]
+            if pruned["snapshots_removed"] or pruned["chunks_removed"]:
+                self.log(
+                    f"[BACKUP] Удалено старых снимков: {pruned['snapshots_removed']}, "
+                    f"фрагментов: {pruned['chunks_removed']} ({pruned['bytes_removed'] // 1024} КБ)"
+                )
             show_message(self, "Резервная копия", "Резервная копия создана.")
-        except Exception as e:
-            show_message(self, "Резервная копия", f"Ошибка создания: {e}")
+
+        self._run_backup_job(_job, _done, "Резервная копия", "Ошибка создания:")
 
     def restore_backup(self):
-        path, _ = QFileDialog.getOpenFileName(self, "Импорт резервной копии", str(BASE_DIR), "ZIP (*.zip)")
+        path, _ = QFileDialog.getOpenFileName(
+            self,
+            "Импорт резервной копии",
+            str(self.cfg.backup_dir_path() / "snapshots"),
+            "Снимок или ZIP (*.json *.zip)",
+        )
         if not path:
             return
+        workers = (self.worker, getattr(self.accounts_page, "worker", None), getattr(self.tokens_page, "_export_worker", None))
+        if any(worker is not None and worker.isRunning() for worker in workers):
+            show_message(self, "Уже работает", "Сначала остановите текущий процесс.")
+            return
         try:
-            with zipfile.ZipFile(path, "r") as zf:
-                zf.extractall(BASE_DIR)
-            show_message(self, "Импорт резервной копии", "Резервная копия импортирована. Перезапустите приложение.")
-        except Exception as e:
-            show_message(self, "Импорт резервной копии", f"Ошибка импорта: {e}")
+            state_writer.flush()
+        except OSError as e:
+            show_message(self, "Импорт резервной копии", f"Не удалось сохранить состояние: {e}")
+            return
+        if path.lower().endswith(".json"):
+            snapshot = Path(path)
+            store = BackupStore(snapshot.parent.parent)
+            restore = lambda progress: store.restore(snapshot.stem, BASE_DIR, progress)
+        else:
+            restore = lambda progress: restore_zip(Path(path), BASE_DIR, progress)
+
+        def _job(progress):
+            # Saves queued before or during the restore would overwrite the restored files
+            with state_writer.suspended():
+                return {"files": restore(progress)}
+
+        self._run_backup_job(
+            _job,
+            lambda result: show_message(self, "Импорт резервной копии", "Резервная копия импортирована. Перезапустите приложение."),
+            "Импорт резервной копии",
+            "Ошибка импорта:",
+            restoring=True,
+        )
 
     def reset_factory(self):
         try:
+            state_writer.flush()
             for f in [CONFIG_FILE, ACCOUNTS_FILE, HAMSTERS_FILE, FROZEN_FILE, ACCOUNTS_STATUS_FILE,
-                      self.cfg.tokens_txt_path(), self.cfg.tokens_csv_path(), self.cfg.revoked_tokens_txt_path()]:
+                      self.cfg.tokens_txt_path(), self.cfg.tokens_csv_path(), self.cfg.revoked_tokens_txt_path(),
+                      self.cfg.token_history_csv_path()]:
                 if f.exists():
                     f.unlink()
             if SESSIONS_DIR.exists():
                 shutil.rmtree(SESSIONS_DIR, ignore_errors=True)
+            if self.cfg.jobs_dir_path().exists():
+                shutil.rmtree(self.cfg.jobs_dir_path(), ignore_errors=True)
+            job_journal(self.cfg).reset()
             ensure_file(self.cfg.tokens_txt_path())
             ensure_file(self.cfg.tokens_csv_path())
             ensure_file(self.cfg.revoked_tokens_txt_path())
@@ -4750,22 +4974,7 @@ class BotFactoryApp(QMainWindow):
     def _resolve_targets_from_usernames(self, usernames: List[str]) -> List[Dict[str, str]]:
         if not usernames:
             return []
-        rows = []
-        csv_path = self.cfg.tokens_csv_path()
-        if csv_path.exists():
-            try:
-                with open(csv_path, "r", encoding="utf-8") as f:
-                    reader = csv.DictReader(f)
-                    for row in reader:
-                        rows.append(row)
-            except Exception:
-                pass
-        account_map: Dict[str, str] = {}
-        for row in rows:
-            username = (row.get("username") or "").strip()
-            account = (row.get("account") or row.get("phone") or "").strip()
-            if username and account:
-                account_map[username] = account
+        account_map = load_bot_records(self.cfg).account_by_username()
         targets = []
         missing = []
         for username in usernames:
@@ -4833,8 +5042,7 @@ class BotFactoryApp(QMainWindow):
         return self._selected_manage_targets()
 
     def delete_mass(self):
-        if self.worker and self.worker.isRunning():
-            show_message(self, "Уже работает", "Сначала остановите текущий процесс.")
+        if self.job_blocked(self.worker):
             return
         targets = self._ask_mass_targets("Массовое удаление", "Удаление")
         if targets is None:
@@ -4858,11 +5066,11 @@ class BotFactoryApp(QMainWindow):
         self.worker.log.connect(self.log)
         self.worker.progress.connect(self.log)
         self.worker.finished_ok.connect(self._on_delete_finished)
+        self.worker.cancelled.connect(self._on_delete_finished)
         self.worker.start()
 
     def delete_single(self):
-        if self.worker and self.worker.isRunning():
-            show_message(self, "Уже работает", "Сначала остановите текущий процесс.")
+        if self.job_blocked(self.worker):
             return
         targets = self._selected_manage_targets()
         if len(targets) != 1:
@@ -4884,11 +5092,11 @@ class BotFactoryApp(QMainWindow):
         self.worker.log.connect(self.log)
         self.worker.progress.connect(self.log)
         self.worker.finished_ok.connect(self._on_delete_finished)
+        self.worker.cancelled.connect(self._on_delete_finished)
         self.worker.start()
 
     def revoke_token(self):
-        if self.worker and self.worker.isRunning():
-            show_message(self, "Уже работает", "Сначала остановите текущий процесс.")
+        if self.job_blocked(self.worker):
             return
         targets = self._selected_manage_targets()
         if len(targets) != 1:
@@ -4910,11 +5118,11 @@ class BotFactoryApp(QMainWindow):
         self.worker.log.connect(self.log)
         self.worker.progress.connect(self.log)
         self.worker.finished_ok.connect(self._on_revoke_finished)
+        self.worker.cancelled.connect(self._on_revoke_finished)
         self.worker.start()
 
     def revoke_mass(self):
-        if self.worker and self.worker.isRunning():
-            show_message(self, "Уже работает", "Сначала остановите текущий процесс.")
+        if self.job_blocked(self.worker):
             return
         targets = self._ask_mass_targets("Массовый Revoke", "Revoke Token")
         if targets is None:
@@ -4938,6 +5146,73 @@ class BotFactoryApp(QMainWindow):
         self.worker.log.connect(self.log)
         self.worker.progress.connect(self.log)
         self.worker.finished_ok.connect(self._on_revoke_finished)
+        self.worker.cancelled.connect(self._on_revoke_finished)
+        self.worker.start()
+
+    def resume_manage_job(self):
+        if self.job_blocked(self.worker):
+            return
+        journal = job_journal(self.cfg)
+        jobs = journal.unfinished()
+        if not jobs:
+            show_message(self, "Задачи", "Нет незавершённых задач.")
+            self.manage_page.refresh_jobs()
+            return
+
+        dlg = StyledDialog(self, self.translate_text("Продолжить задачу"))
+        dlg.resize(640, 260)
+        label = QLabel(self.translate_text("Незавершённые задачи удаления и revoke. Готовые боты будут пропущены."))
+        label.setWordWrap(True)
+        label.setObjectName("Hint")
+        job_box = QComboBox(); job_box.setObjectName("Input")
+        job_box.addItems([job.summary() for job in jobs])
+
+        row = QHBoxLayout()
+        ok = QPushButton(self.translate_text("Продолжить")); ok.setObjectName("PrimaryBtn")
+        discard = QPushButton(self.translate_text("Удалить задачу")); discard.setObjectName("SecondaryBtn")
+        cancel = QPushButton(self.translate_text("Отмена")); cancel.setObjectName("SecondaryBtn")
+        row.addWidget(discard)
+        row.addStretch(1)
+        row.addWidget(cancel)
+        row.addWidget(ok)
+
+        body = QVBoxLayout()
+        body.addWidget(label)
+        body.addWidget(job_box)
+        body.addLayout(row)
+        dlg.set_body_layout(body)
+        ok.clicked.connect(dlg.accept)
+        discard.clicked.connect(lambda: dlg.done(2))
+        cancel.clicked.connect(dlg.reject)
+        result = dlg.exec()
+        job = jobs[job_box.currentIndex()]
+        if result == 2:
+            journal.remove(job.job_id)
+            self.manage_page.refresh_jobs()
+            return
+        if result != QDialog.DialogCode.Accepted:
+            return
+
+        targets = job.remaining()
+        self.worker = Worker(
+            job.mode,
+            self.cfg.botfather,
+            [],
+            "None",
+            "",
+            self.cfg,
+            self.bridge,
+            self.bot_overrides,
+            self.account_status,
+            delete_targets=targets if job.mode == "delete" else None,
+            revoke_targets=targets if job.mode == "revoke" else None,
+            job=job
+        )
+        self.worker.log.connect(self.log)
+        self.worker.progress.connect(self.log)
+        on_done = self._on_delete_finished if job.mode == "delete" else self._on_revoke_finished
+        self.worker.finished_ok.connect(on_done)
+        self.worker.cancelled.connect(on_done)
         self.worker.start()
 
     def _ask_code(self, phone: str):
@@ -4949,8 +5224,8 @@ class BotFactoryApp(QMainWindow):
         self.bridge.set_password(pwd or "")
 
     def stop_worker(self):
-        if self.worker:
-            self.worker.stop()
+        if self.worker and self.worker.isRunning():
+            self.worker.cancel()
             self.log("[INFO] Stop запрошен.")
 
     def _on_auto_finished(self):
@@ -4980,6 +5255,7 @@ class BotFactoryApp(QMainWindow):
         worker = self.worker
         if not worker or worker.mode != "revoke":
             return
+        self.manage_page.refresh_jobs()
         if not worker.revoked_results:
             show_message(self, "Revoke завершён", "Токены не были получены.")
             return
@@ -5183,8 +5459,7 @@ class BotFactoryApp(QMainWindow):
 
         dlg.exec()
     def start_auto(self):
-        if self.worker and self.worker.isRunning():
-            show_message(self, "Уже работает", "Сначала остановите текущий процесс.")
+        if self.job_blocked(self.worker):
             return
 
         chat = self.auto_page.chat.text().strip() or BOTFATHER_USERNAME_DEFAULT
@@ -5203,6 +5478,7 @@ class BotFactoryApp(QMainWindow):
         self.worker.log.connect(self.log)
         self.worker.progress.connect(self.log)
         self.worker.finished_ok.connect(self._on_auto_finished)
+        self.worker.cancelled.connect(self._on_auto_finished)
         self.worker.start()
 
     def start_manual(self):
@@ -5290,14 +5566,25 @@ class BotFactoryApp(QMainWindow):
 
 def main():
     install_crash_logger(BASE_DIR / "onboarding_crash.log")
+    recover_interrupted_restore(BASE_DIR)
     if hasattr(Qt.ApplicationAttribute, "AA_UseHighDpiPixmaps"):
         QApplication.setAttribute(Qt.ApplicationAttribute.AA_UseHighDpiPixmaps, True)
     if hasattr(Qt.ApplicationAttribute, "AA_EnableHighDpiScaling"):
         QApplication.setAttribute(Qt.ApplicationAttribute.AA_EnableHighDpiScaling, True)
     app = QApplication(sys.argv)
+    # Started before the window so that slow startup work is logged as well.
+    watchdog = install_stall_watchdog(BASE_DIR / "gui_stalls.log", load_config().stall_threshold_ms)
     w = BotFactoryApp()
     w.show()
-    sys.exit(app.exec())
+    code = app.exec()
+    if watchdog is not None:
+        watchdog.stop()
+    loop_service.shutdown()
+    try:
+        state_writer.flush()
+    except OSError:
+        pass  # already logged; the files keep their last saved content
+    sys.exit(code)
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,289 @@
+import hashlib
+import json
+import os
+import shutil
+import zipfile
+import zlib
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+CHUNK_SIZE = 1024 * 1024
+RESTORE_STAGING = ".restore-staging"
+RESTORE_ROLLBACK = ".restore-rollback"
+RESTORE_JOURNAL = ".restore-journal.json"
+
+ProgressCallback = Callable[[int, int, str], None]
+
+
+def _write_atomic(path: Path, data: bytes):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + ".tmp")
+    with tmp.open("wb") as handle:
+        handle.write(data)
+        handle.flush()
+        os.fsync(handle.fileno())
+    os.replace(tmp, path)
+
+
+def _safe_target(base: Path, rel: str) -> Path:
+    base = base.resolve()
+    target = (base / rel).resolve()
+    if base not in target.parents:
+        raise ValueError(f"{rel}: path outside target directory")
+    return target
+
+
+def _rollback(target_dir: Path, journal: dict):
+    rollback_dir = target_dir / RESTORE_ROLLBACK
+    for item in journal.get("files", []):
+        target = target_dir / item["path"]
+        saved = rollback_dir / item["path"]
+        if saved.exists():
+            target.parent.mkdir(parents=True, exist_ok=True)
+            os.replace(saved, target)
+        elif not item["existed"] and target.exists():
+            target.unlink()
+
+
+def _cleanup_restore(target_dir: Path):
+    shutil.rmtree(target_dir / RESTORE_ROLLBACK, ignore_errors=True)
+    shutil.rmtree(target_dir / RESTORE_STAGING, ignore_errors=True)
+
+
+def recover_interrupted_restore(target_dir: Path) -> bool:
+    journal_path = Path(target_dir) / RESTORE_JOURNAL
+    if not journal_path.exists():
+        _cleanup_restore(Path(target_dir))
+        return False
+    journal = json.loads(journal_path.read_text(encoding="utf-8"))
+    _rollback(Path(target_dir), journal)
+    journal_path.unlink()
+    _cleanup_restore(Path(target_dir))
+    return True
+
+
+def apply_staged(staging_dir: Path, target_dir: Path, rels: List[str], progress: Optional[ProgressCallback] = None) -> int:
+    target_dir = Path(target_dir)
+    rollback_dir = target_dir / RESTORE_ROLLBACK
+    journal_path = target_dir / RESTORE_JOURNAL
+    shutil.rmtree(rollback_dir, ignore_errors=True)
+    journal = {"files": [{"path": rel, "existed": (target_dir / rel).exists()} for rel in rels]}
+    _write_atomic(journal_path, json.dumps(journal, ensure_ascii=False).encode("utf-8"))
+    try:
+        for done, item in enumerate(journal["files"], start=1):
+            rel = item["path"]
+            target = _safe_target(target_dir, rel)
+            if item["existed"]:
+                saved = rollback_dir / rel
+                saved.parent.mkdir(parents=True, exist_ok=True)
+                os.replace(target, saved)
+            target.parent.mkdir(parents=True, exist_ok=True)
+            os.replace(staging_dir / rel, target)
+            if progress:
+                progress(done, len(rels), rel)
+    except BaseException:
+        _rollback(target_dir, journal)
+        journal_path.unlink()
+        _cleanup_restore(target_dir)
+        raise
+    journal_path.unlink()
+    _cleanup_restore(target_dir)
+    return len(rels)
+
+
+def stage_zip(zip_path: Path, staging_dir: Path, progress: Optional[ProgressCallback] = None) -> List[str]:
+    rels = []
+    with zipfile.ZipFile(zip_path, "r") as zf:
+        members = [info for info in zf.infolist() if not info.is_dir()]
+        for done, info in enumerate(members, start=1):
+            target = _safe_target(staging_dir, info.filename)
+            target.parent.mkdir(parents=True, exist_ok=True)
+            with zf.open(info, "r") as src, target.open("wb") as dst:
+                shutil.copyfileobj(src, dst, CHUNK_SIZE)
+            if target.stat().st_size != info.file_size:
+                raise ValueError(f"{info.filename}: size mismatch")
+            rels.append(target.relative_to(staging_dir.resolve()).as_posix())
+            if progress:
+                progress(done, len(members), info.filename)
+    return rels
+
+
+def restore_staged(stage: Callable[[Path], List[str]], target_dir: Path, progress: Optional[ProgressCallback] = None) -> int:
+    target_dir = Path(target_dir)
+    recover_interrupted_restore(target_dir)
+    staging_dir = target_dir / RESTORE_STAGING
+    staging_dir.mkdir(parents=True)
+    try:
+        rels = stage(staging_dir)
+    except BaseException:
+        _cleanup_restore(target_dir)
+        raise
+    return apply_staged(staging_dir, target_dir, rels, progress)
+
+
+def restore_zip(zip_path: Path, target_dir: Path, progress: Optional[ProgressCallback] = None) -> int:
+    return restore_staged(lambda staging: stage_zip(zip_path, staging, progress), target_dir, progress)
+
+
+class BackupStore:
+    def __init__(self, root: Path):
+        self.root = Path(root)
+        self.chunks_dir = self.root / "chunks"
+        self.snapshots_dir = self.root / "snapshots"
+        self.index_path = self.root / "index.json"
+
+    def _chunk_path(self, digest: str) -> Path:
+        return self.chunks_dir / digest[:2] / digest
+
+    def _load_index(self) -> Dict[str, dict]:
+        try:
+            data = json.loads(self.index_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        return data if isinstance(data, dict) else {}
+
+    def _store_file(self, path: Path, stats: dict) -> Tuple[str, List[str]]:
+        file_hash = hashlib.sha256()
+        chunks = []
+        with path.open("rb") as handle:
+            while True:
+                block = handle.read(CHUNK_SIZE)
+                if not block:
+                    break
+                file_hash.update(block)
+                digest = hashlib.sha256(block).hexdigest()
+                chunks.append(digest)
+                chunk_path = self._chunk_path(digest)
+                if chunk_path.exists():
+                    stats["chunks_reused"] += 1
+                    continue
+                packed = zlib.compress(block, 6)
+                _write_atomic(chunk_path, packed)
+                stats["chunks_written"] += 1
+                stats["bytes_written"] += len(packed)
+        return file_hash.hexdigest(), chunks
+
+    def snapshot(self, files: Iterable[Tuple[Path, str]], progress: Optional[ProgressCallback] = None) -> dict:
+        sources = [(Path(path), rel) for path, rel in files if Path(path).is_file()]
+        index = self._load_index()
+        stats = {"files": 0, "files_unchanged": 0, "chunks_written": 0, "chunks_reused": 0, "bytes_written": 0}
+        entries = []
+        total = len(sources)
+        for done, (path, rel) in enumerate(sources, start=1):
+            st = path.stat()
+            cached = index.get(rel)
+            if (
+                cached
+                and cached.get("size") == st.st_size
+                and cached.get("mtime_ns") == st.st_mtime_ns
+                and all(self._chunk_path(digest).exists() for digest in cached.get("chunks", []))
+            ):
+                entry = dict(cached, path=rel)
+                stats["files_unchanged"] += 1
+            else:
+                digest, chunks = self._store_file(path, stats)
+                entry = {"path": rel, "size": st.st_size, "mtime_ns": st.st_mtime_ns, "sha256": digest, "chunks": chunks}
+                index[rel] = {key: value for key, value in entry.items() if key != "path"}
+            entries.append(entry)
+            stats["files"] += 1
+            if progress:
+                progress(done, total, rel)
+
+        created = datetime.now()
+        snapshot_id = created.strftime("%Y%m%d-%H%M%S-%f")
+        manifest = {
+            "id": snapshot_id,
+            "created_at": created.isoformat(timespec="seconds"),
+            "total_bytes": sum(entry["size"] for entry in entries),
+            "files": entries,
+        }
+        _write_atomic(self.index_path, json.dumps(index, ensure_ascii=False).encode("utf-8"))
+        _write_atomic(
+            self.snapshots_dir / f"{snapshot_id}.json",
+            json.dumps(manifest, ensure_ascii=False, indent=2).encode("utf-8"),
+        )
+        return dict(stats, id=snapshot_id, total_bytes=manifest["total_bytes"])
+
+    def list_snapshots(self) -> List[dict]:
+        result = []
+        if not self.snapshots_dir.exists():
+            return result
+        for path in sorted(self.snapshots_dir.glob("*.json")):
+            try:
+                manifest = json.loads(path.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                continue
+            result.append(
+                {
+                    "id": manifest.get("id", path.stem),
+                    "created_at": manifest.get("created_at", ""),
+                    "files": len(manifest.get("files", [])),
+                    "total_bytes": manifest.get("total_bytes", 0),
+                }
+            )
+        return result
+
+    def prune(self, keep: int) -> dict:
+        stats = {"snapshots_removed": 0, "chunks_removed": 0, "bytes_removed": 0}
+        if keep <= 0 or not self.snapshots_dir.exists():
+            return stats
+        manifests = sorted(self.snapshots_dir.glob("*.json"))
+        for path in manifests[:-keep]:
+            path.unlink()
+            stats["snapshots_removed"] += 1
+        referenced = set()
+        for path in manifests[-keep:]:
+            try:
+                manifest = json.loads(path.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                # Its chunks are unknown, so none of them can be proven unused
+                return stats
+            for entry in manifest.get("files", []):
+                referenced.update(entry.get("chunks", []))
+        if self.chunks_dir.exists():
+            for chunk_path in self.chunks_dir.glob("*/*"):
+                if chunk_path.name in referenced:
+                    continue
+                stats["bytes_removed"] += chunk_path.stat().st_size
+                chunk_path.unlink()
+                stats["chunks_removed"] += 1
+        index = self._load_index()
+        kept = {rel: item for rel, item in index.items() if referenced.issuperset(item.get("chunks", []))}
+        if len(kept) != len(index):
+            _write_atomic(self.index_path, json.dumps(kept, ensure_ascii=False).encode("utf-8"))
+        return stats
+
+    def load_manifest(self, snapshot_id: str) -> dict:
+        return json.loads((self.snapshots_dir / f"{snapshot_id}.json").read_text(encoding="utf-8"))
+
+    def read_chunk(self, digest: str) -> bytes:
+        data = zlib.decompress(self._chunk_path(digest).read_bytes())
+        if hashlib.sha256(data).hexdigest() != digest:
+            raise ValueError(f"chunk {digest} is corrupted")
+        return data
+
+    def write_file(self, entry: dict, target: Path):
+        file_hash = hashlib.sha256()
+        target.parent.mkdir(parents=True, exist_ok=True)
+        tmp = target.with_name(target.name + ".tmp")
+        with tmp.open("wb") as handle:
+            for digest in entry["chunks"]:
+                block = self.read_chunk(digest)
+                file_hash.update(block)
+                handle.write(block)
+        if file_hash.hexdigest() != entry["sha256"]:
+            tmp.unlink()
+            raise ValueError(f"{entry['path']}: checksum mismatch")
+        os.replace(tmp, target)
+
+    def stage(self, snapshot_id: str, staging_dir: Path, progress: Optional[ProgressCallback] = None) -> List[str]:
+        entries = self.load_manifest(snapshot_id).get("files", [])
+        for done, entry in enumerate(entries, start=1):
+            self.write_file(entry, _safe_target(staging_dir, entry["path"]))
+            if progress:
+                progress(done, len(entries), entry["path"])
+        return [entry["path"] for entry in entries]
+
+    def restore(self, snapshot_id: str, target_dir: Path, progress: Optional[ProgressCallback] = None) -> int:
+        return restore_staged(lambda staging: self.stage(snapshot_id, staging, progress), target_dir, progress)
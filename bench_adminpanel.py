@@ -0,0 +1,539 @@
+import argparse
+import json
+import os
+import random
+import re
+import shutil
+import sqlite3
+import tempfile
+import threading
+import time
+import zlib
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+OPERATIONS = ("status", "redeem", "login", "list")
+LIST_PATHS = ("/admin/codes", "/admin/machines", "/admin/usages", "/admin/stats")
+ABUSE_KINDS = ("login", "redeem")
+ABUSE_IP = "203.0.113.66"
+ADMIN_IP = "192.0.2.10"
+DEFAULT_MIX = "status=70,redeem=15,login=5,list=10"
+ABUSE_MIX = "status=80,redeem=20"
+WRITE_STATEMENT = re.compile(r"\s*(BEGIN\s+(IMMEDIATE|EXCLUSIVE)|INSERT|UPDATE|DELETE|REPLACE)\b", re.IGNORECASE)
+END_STATEMENT = re.compile(r"\s*(COMMIT|END|ROLLBACK)\s*;?\s*$", re.IGNORECASE)
+
+
+def _parse_mix(value: str) -> Dict[str, int]:
+    mix = {}
+    for part in value.split(","):
+        name, _, weight = part.partition("=")
+        name = name.strip()
+        if name not in OPERATIONS:
+            raise argparse.ArgumentTypeError(f"unknown operation: {name}")
+        mix[name] = int(weight or "1")
+    if not any(mix.values()):
+        raise argparse.ArgumentTypeError("mix must contain a positive weight")
+    return mix
+
+
+def _client_ip_for(code: str) -> str:
+    # Every simulated client gets its own address so per-IP buckets behave like real traffic
+    value = zlib.crc32(code.encode("utf-8"))
+    return f"10.{value >> 16 & 255}.{value >> 8 & 255}.{value & 255}"
+
+
+def _percentile(values: List[float], fraction: float) -> float:
+    if not values:
+        return 0.0
+    index = min(len(values) - 1, max(0, int(round(fraction * (len(values) - 1)))))
+    return values[index]
+
+
+def seed_database(db_path: Path, codes: int, redeemed_ratio: float, rng: random.Random) -> dict:
+    stamp = int(time.time())
+    future = stamp + int(timedelta(days=30).total_seconds())
+    past = stamp - int(timedelta(days=1).total_seconds())
+
+    db = sqlite3.connect(db_path)
+    code_rows = []
+    for index in range(codes):
+        roll = rng.random()
+        expires_at = past if roll < 0.05 else future
+        revoked_at = stamp if 0.05 <= roll < 0.08 else None
+        code_rows.append((f"bench-code-{index:07d}", f"user{index}", expires_at, revoked_at, stamp, "bench"))
+    db.executemany(
+        """
+        INSERT INTO access_codes (code, issued_to, expires_at, revoked_at, created_at, created_by)
+        VALUES (?, ?, ?, ?, ?, ?)
+        """,
+        code_rows,
+    )
+
+    redeemed_count = int(codes * redeemed_ratio)
+    db.executemany(
+        "INSERT INTO machines (fingerprint, first_seen_at, last_seen_at) VALUES (?, ?, ?)",
+        [(f"bench-machine-{index:07d}", stamp, stamp) for index in range(redeemed_count)],
+    )
+    code_ids = dict(db.execute("SELECT code, id FROM access_codes WHERE created_by = 'bench'"))
+    machine_ids = dict(db.execute("SELECT fingerprint, id FROM machines"))
+    db.executemany(
+        "INSERT INTO code_usages (code_id, machine_id, used_at, revoked_at) VALUES (?, ?, ?, ?)",
+        [
+            (
+                code_ids[f"bench-code-{index:07d}"],
+                machine_ids[f"bench-machine-{index:07d}"],
+                stamp,
+                code_rows[index][3],
+            )
+            for index in range(redeemed_count)
+        ],
+    )
+    db.commit()
+    db.close()
+
+    redeemed = [
+        (f"bench-code-{index:07d}", f"bench-machine-{index:07d}") for index in range(redeemed_count)
+    ]
+    unused = [f"bench-code-{index:07d}" for index in range(redeemed_count, codes)]
+    return {"redeemed": redeemed, "unused": unused}
+
+
+class WriteLockMonitor:
+    """Times how long connections wait for the SQLite write lock held by another connection."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._holder: Optional[int] = None
+        self.acquisitions = 0
+        self.waits: List[float] = []
+
+    def acquire(self, connection: sqlite3.Connection, run):
+        with self._lock:
+            contended = self._holder not in (None, id(connection))
+        started = time.perf_counter()
+        try:
+            result = run()
+        finally:
+            elapsed = time.perf_counter() - started
+            with self._lock:
+                self.acquisitions += 1
+                if contended:
+                    self.waits.append(elapsed)
+        with self._lock:
+            self._holder = id(connection)
+        return result
+
+    def release(self, connection: sqlite3.Connection) -> None:
+        with self._lock:
+            if self._holder == id(connection):
+                self._holder = None
+
+    def report(self) -> dict:
+        with self._lock:
+            waits = sorted(self.waits)
+            return {
+                "acquisitions": self.acquisitions,
+                "waits": len(waits),
+                "wait_total_ms": round(sum(waits) * 1000, 2),
+                "wait_p95_ms": round(_percentile(waits, 0.95) * 1000, 2),
+                "wait_max_ms": round(waits[-1] * 1000, 2) if waits else 0.0,
+            }
+
+
+def timed_connection_factory(monitor: WriteLockMonitor):
+    class TimedConnection(sqlite3.Connection):
+        # The first write of a transaction takes the lock; later statements run under it
+        def _holds_write_lock(self) -> bool:
+            return getattr(self, "_writing", False) and self.in_transaction
+
+        def execute(self, sql, *args):
+            if END_STATEMENT.match(sql):
+                try:
+                    return super().execute(sql, *args)
+                finally:
+                    self._writing = False
+                    monitor.release(self)
+            if self._holds_write_lock() or not WRITE_STATEMENT.match(sql):
+                return super().execute(sql, *args)
+            cursor = monitor.acquire(self, lambda: super(TimedConnection, self).execute(sql, *args))
+            self._writing = True
+            return cursor
+
+        def executemany(self, sql, *args):
+            if self._holds_write_lock() or not WRITE_STATEMENT.match(sql):
+                return super().executemany(sql, *args)
+            cursor = monitor.acquire(self, lambda: super(TimedConnection, self).executemany(sql, *args))
+            self._writing = True
+            return cursor
+
+        def commit(self):
+            try:
+                super().commit()
+            finally:
+                self._writing = False
+                monitor.release(self)
+
+        def rollback(self):
+            try:
+                super().rollback()
+            finally:
+                self._writing = False
+                monitor.release(self)
+
+        def __exit__(self, *exc_info):
+            # The context manager commits or rolls back in C, bypassing the overrides above
+            try:
+                return super().__exit__(*exc_info)
+            finally:
+                self._writing = False
+                monitor.release(self)
+
+    return TimedConnection
+
+
+class TestClientTransport:
+    def __init__(self, module):
+        self.module = module
+        self._local = threading.local()
+
+    def _client(self):
+        client = getattr(self._local, "client", None)
+        if client is None:
+            client = self.module.app.test_client()
+            self._local.client = client
+        return client
+
+    def post(self, path: str, payload: dict, headers: Optional[dict] = None) -> Tuple[int, dict]:
+        response = self._client().post(path, json=payload, headers=headers)
+        return response.status_code, response.get_json(silent=True) or {}
+
+    def get(self, path: str, headers: Optional[dict] = None) -> Tuple[int, dict]:
+        response = self._client().get(path, headers=headers)
+        return response.status_code, {}
+
+
+class HttpTransport:
+    def __init__(self, base_url: str):
+        import requests
+
+        self.requests = requests
+        self.base_url = base_url.rstrip("/")
+        self._local = threading.local()
+
+    def _session(self):
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = self.requests.Session()
+            self._local.session = session
+        return session
+
+    def post(self, path: str, payload: dict, headers: Optional[dict] = None) -> Tuple[int, dict]:
+        response = self._session().post(self.base_url + path, json=payload, headers=headers, timeout=30)
+        try:
+            data = response.json()
+        except ValueError:
+            data = {}
+        return response.status_code, data if isinstance(data, dict) else {}
+
+    def get(self, path: str, headers: Optional[dict] = None) -> Tuple[int, dict]:
+        response = self._session().get(self.base_url + path, headers=headers, timeout=30)
+        return response.status_code, {}
+
+
+class Workload:
+    def __init__(
+        self, transport, seeded: dict, login: str, password: str, rng: random.Random, client_ips: bool = False
+    ):
+        self.transport = transport
+        self.client_ips = client_ips
+        self.redeemed = seeded["redeemed"]
+        self.unused = list(seeded["unused"])
+        self.login = login
+        self.password = password
+        self.rng = rng
+        self._lock = threading.Lock()
+        self._fresh = 0
+        self.token = None
+
+    def _from(self, ip: str, headers: Optional[dict] = None) -> Optional[dict]:
+        if not self.client_ips:
+            return headers
+        return dict(headers or {}, **{"X-Forwarded-For": ip})
+
+    def authorize(self) -> None:
+        status, data = self.transport.post(
+            "/admin/login", {"login": self.login, "password": self.password}, self._from(ADMIN_IP)
+        )
+        if status != 200:
+            raise SystemExit(f"admin login failed with HTTP {status}")
+        self.token = data["token"]
+
+    def _pick_redeemed(self) -> Tuple[str, str]:
+        with self._lock:
+            return self.rng.choice(self.redeemed)
+
+    def status(self) -> int:
+        code, fingerprint = self._pick_redeemed()
+        return self.transport.post(
+            "/client/status", {"code": code, "fingerprint": fingerprint}, self._from(_client_ip_for(code))
+        )[0]
+
+    def redeem(self) -> int:
+        with self._lock:
+            if self.unused:
+                code = self.unused.pop()
+                self._fresh += 1
+                fingerprint = f"bench-fresh-{self._fresh:07d}"
+            else:
+                code, fingerprint = self.rng.choice(self.redeemed)
+        return self.transport.post(
+            "/client/redeem", {"code": code, "fingerprint": fingerprint}, self._from(_client_ip_for(code))
+        )[0]
+
+    def admin_login(self) -> int:
+        return self.transport.post(
+            "/admin/login", {"login": self.login, "password": self.password}, self._from(ADMIN_IP)
+        )[0]
+
+    def list_rows(self) -> int:
+        with self._lock:
+            path = self.rng.choice(LIST_PATHS)
+        return self.transport.get(path, self._from(ADMIN_IP, {"Authorization": f"Bearer {self.token}"}))[0]
+
+    def run(self, operation: str) -> int:
+        handlers = {
+            "status": self.status,
+            "redeem": self.redeem,
+            "login": self.admin_login,
+            "list": self.list_rows,
+        }
+        return handlers[operation]()
+
+
+def run_benchmark(workload: Workload, mix: Dict[str, int], requests: int, concurrency: int, rng: random.Random) -> dict:
+    names = [name for name in OPERATIONS if mix.get(name)]
+    plan = rng.choices(names, weights=[mix[name] for name in names], k=requests)
+    latencies: Dict[str, List[float]] = defaultdict(list)
+    statuses: Dict[str, Counter] = defaultdict(Counter)
+    lock = threading.Lock()
+
+    def _one(operation: str) -> None:
+        started = time.perf_counter()
+        try:
+            status = workload.run(operation)
+        except Exception as exc:
+            status = type(exc).__name__
+        elapsed = time.perf_counter() - started
+        with lock:
+            latencies[operation].append(elapsed)
+            statuses[operation][status] += 1
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        list(pool.map(_one, plan))
+    elapsed = time.perf_counter() - started
+
+    operations = {}
+    for name in names:
+        values = sorted(latencies[name])
+        operations[name] = {
+            "requests": len(values),
+            "p50_ms": round(_percentile(values, 0.50) * 1000, 2),
+            "p95_ms": round(_percentile(values, 0.95) * 1000, 2),
+            "p99_ms": round(_percentile(values, 0.99) * 1000, 2),
+            "max_ms": round(values[-1] * 1000, 2) if values else 0.0,
+            "statuses": {str(key): value for key, value in sorted(statuses[name].items(), key=str)},
+        }
+    return {
+        "requests": requests,
+        "concurrency": concurrency,
+        "elapsed_s": round(elapsed, 3),
+        "rps": round(requests / elapsed, 1) if elapsed else 0.0,
+        "operations": operations,
+    }
+
+
+def _abuse(transport, kind: str, login: str, stop: threading.Event, statuses: Counter, lock: threading.Lock) -> None:
+    # One address hammering the endpoint as fast as it can: a password guesser or a code brute-forcer
+    headers = {"X-Forwarded-For": ABUSE_IP}
+    while not stop.is_set():
+        guess = os.urandom(8).hex()
+        try:
+            if kind == "login":
+                status = transport.post("/admin/login", {"login": login, "password": guess}, headers)[0]
+            else:
+                status = transport.post("/client/redeem", {"code": guess, "fingerprint": "bench-abuser"}, headers)[0]
+        except Exception as exc:
+            status = type(exc).__name__
+        with lock:
+            statuses[status] += 1
+
+
+def run_abuse_scenario(
+    workload: Workload, mix: Dict[str, int], requests: int, concurrency: int, rng: random.Random, abusers: int, kind: str
+) -> dict:
+    stop = threading.Event()
+    lock = threading.Lock()
+    abuse_statuses: Counter = Counter()
+    threads = [
+        threading.Thread(target=_abuse, args=(workload.transport, kind, workload.login, stop, abuse_statuses, lock))
+        for _ in range(abusers)
+    ]
+    for thread in threads:
+        thread.start()
+    try:
+        result = run_benchmark(workload, mix, requests, concurrency, rng)
+    finally:
+        stop.set()
+        for thread in threads:
+            thread.join()
+    result["abuse"] = {
+        "threads": abusers,
+        "kind": kind,
+        "requests": sum(abuse_statuses.values()),
+        "statuses": {str(key): value for key, value in sorted(abuse_statuses.items(), key=str)},
+    }
+    return result
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Seed adminpanel and benchmark a mixed workload")
+    parser.add_argument("--codes", type=int, default=2000)
+    parser.add_argument("--redeemed-ratio", type=float, default=0.8)
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument(
+        "--mix", type=_parse_mix, default=None, help=f"Default: {DEFAULT_MIX} ({ABUSE_MIX} with --abuse)"
+    )
+    parser.add_argument("--db", type=Path, default=None, help="Database to seed (default: temporary file)")
+    parser.add_argument("--url", default=None, help="Benchmark a running server instead of the test client")
+    parser.add_argument("--login", default=None)
+    parser.add_argument("--password", default=None)
+    parser.add_argument("--no-cache", action="store_true", help="Disable the /client/status cache")
+    parser.add_argument(
+        "--abuse",
+        type=int,
+        default=0,
+        help="Abusive threads from one IP; compares legit latency with and without the rate limiter",
+    )
+    parser.add_argument("--abuse-kind", choices=ABUSE_KINDS, default="login")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--output", type=Path, default=None)
+    return parser
+
+
+def main() -> int:
+    parser = _build_parser()
+    args = parser.parse_args()
+    if args.url and args.db is None:
+        parser.error("--url requires --db pointing at the database of that server")
+    rng = random.Random(args.seed)
+    workdir = None
+    db_path = args.db
+    if db_path is None:
+        workdir = Path(tempfile.mkdtemp(prefix="bench_adminpanel_"))
+        db_path = workdir / "adminpanel.db"
+    os.environ["ADMINPANEL_DB_PATH"] = str(db_path)
+    if args.no_cache:
+        os.environ["ADMIN_STATUS_CACHE_TTL"] = "0"
+    if not args.abuse:
+        # The plain mix runs from one address and would only measure the limiter
+        os.environ["ADMIN_RATE_LIMIT"] = "0"
+    elif not args.url:
+        # Simulated client addresses arrive in X-Forwarded-For, as if from one Nginx
+        os.environ["ADMIN_TRUSTED_PROXIES"] = "1"
+    mix = args.mix or _parse_mix(ABUSE_MIX if args.abuse else DEFAULT_MIX)
+
+    import adminpanel
+
+    busy_errors = Counter()
+
+    def _count_busy(sender, exception, **extra):
+        if isinstance(exception, sqlite3.OperationalError):
+            message = str(exception).lower()
+            if "locked" in message or "busy" in message:
+                busy_errors[message] += 1
+
+    write_lock = WriteLockMonitor()
+    timed_connection = timed_connection_factory(write_lock)
+    plain_connect = sqlite3.connect
+
+    def _timed_connect(*args, **kwargs):
+        kwargs.setdefault("factory", timed_connection)
+        return plain_connect(*args, **kwargs)
+
+    try:
+        adminpanel.init_db()
+        seeded = seed_database(db_path, args.codes, args.redeemed_ratio, rng)
+        db = sqlite3.connect(db_path)
+        with db:
+            adminpanel.rebuild_stats(db)
+        db.close()
+        if args.url:
+            transport = HttpTransport(args.url)
+        else:
+            from flask import got_request_exception
+
+            adminpanel.app.logger.disabled = True
+            got_request_exception.connect(_count_busy, adminpanel.app)
+            # Pooled connections are opened lazily, so every request and flush goes through the monitor
+            sqlite3.connect = _timed_connect
+            transport = TestClientTransport(adminpanel)
+        workload = Workload(
+            transport,
+            seeded,
+            args.login or adminpanel.ADMIN_USERNAME,
+            args.password or adminpanel.ADMIN_PASSWORD,
+            rng,
+            client_ips=bool(args.abuse),
+        )
+        workload.authorize()
+        if args.abuse:
+            result = {"scenarios": {}}
+            scenarios = [("baseline", 0, True), ("abuse_unlimited", args.abuse, False), ("abuse_limited", args.abuse, True)]
+            if args.url:
+                # The limiter of a remote server cannot be toggled from here
+                scenarios = [("baseline", 0, True), ("abuse", args.abuse, True)]
+            for name, abusers, limited in scenarios:
+                if not args.url:
+                    adminpanel.rate_limiter.enabled = limited
+                    adminpanel.rate_limiter.clear()
+                result["scenarios"][name] = run_abuse_scenario(
+                    workload, mix, args.requests, args.concurrency, rng, abusers, args.abuse_kind
+                )
+        else:
+            result = run_benchmark(workload, mix, args.requests, args.concurrency, rng)
+        result.update(
+            {
+                "target": args.url or "test-client",
+                "seeded_codes": args.codes,
+                "status_cache": not args.no_cache,
+                "sqlite_busy_errors": sum(busy_errors.values()) if not args.url else None,
+                "write_lock": write_lock.report() if not args.url else None,
+                "server_errors": sum(
+                    count
+                    for run in result.get("scenarios", {"": result}).values()
+                    for op in run["operations"].values()
+                    for status, count in op["statuses"].items()
+                    if status.startswith("5") or not status.isdigit()
+                ),
+            }
+        )
+    finally:
+        sqlite3.connect = plain_connect
+        adminpanel.close_all_connections()
+        if workdir is not None:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+    text = json.dumps(result, ensure_ascii=False, indent=2)
+    print(text)
+    if args.output:
+        args.output.write_text(text + "\n", encoding="utf-8")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,83 @@
+import argparse
+import csv
+import gc
+import json
+import random
+import shutil
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+from tokens import read_bot_records
+
+
+def _seed_tokens(path: Path, rows: int, accounts: int, hamsters: int, rng: random.Random):
+    start = int(time.time()) - rows * 60
+    account_names = [f"+7900{index:07d}" for index in range(accounts)]
+    hamster_names = [""] + [f"hamster_{index}" for index in range(hamsters)]
+    with path.open("w", newline="", encoding="utf-8") as handle:
+        writer = csv.writer(handle)
+        writer.writerow(["username", "token", "hamster", "account", "ts"])
+        for index in range(rows):
+            writer.writerow([
+                f"bench_{index}_bot",
+                f"{6000000000 + index}:AA{rng.getrandbits(160):040x}"[:46],
+                rng.choice(hamster_names),
+                rng.choice(account_names),
+                start + index * 60,
+            ])
+
+
+def _load_dicts(path: Path):
+    with open(path, "r", encoding="utf-8") as f:
+        return list(csv.DictReader(f))
+
+
+def _measure(loader, path: Path) -> dict:
+    gc.collect()
+    tracemalloc.start()
+    started = time.perf_counter()
+    data = loader(path)
+    elapsed = time.perf_counter() - started
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    result = {
+        "rows": len(data),
+        "retained_mb": round(current / 1024 / 1024, 2),
+        "peak_mb": round(peak / 1024 / 1024, 2),
+        "load_ms": round(elapsed * 1000, 1),
+    }
+    del data
+    gc.collect()
+    return result
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Compare memory of dict-per-row and columnar bot records")
+    parser.add_argument("--rows", type=int, default=100000)
+    parser.add_argument("--accounts", type=int, default=50)
+    parser.add_argument("--hamsters", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    workdir = Path(tempfile.mkdtemp(prefix="bench_records_"))
+    try:
+        tokens_csv = workdir / "tokens.csv"
+        _seed_tokens(tokens_csv, args.rows, args.accounts, args.hamsters, random.Random(args.seed))
+        dicts = _measure(_load_dicts, tokens_csv)
+        columnar = _measure(read_bot_records, tokens_csv)
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    result = {
+        "csv.DictReader rows": dicts,
+        "BotRecords": columnar,
+        "retained_ratio": round(dicts["retained_mb"] / columnar["retained_mb"], 2) if columnar["retained_mb"] else None,
+    }
+    print(json.dumps(result, ensure_ascii=False, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,124 @@
+import argparse
+import csv
+import json
+import os
+import shutil
+import statistics
+import tempfile
+import time
+from collections import ChainMap
+from datetime import datetime, timedelta
+from pathlib import Path
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import app
+from bench_translations_previous import PreviousCatalogs
+from core import AutoConfig
+from PyQt6.QtWidgets import QApplication
+
+
+def _timed(fn, repeat: int) -> dict:
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - started) * 1000)
+    samples.sort()
+    return {
+        "calls": repeat,
+        "mean_ms": round(statistics.fmean(samples), 4),
+        "p50_ms": round(samples[len(samples) // 2], 4),
+        "max_ms": round(samples[-1], 4),
+    }
+
+
+def _previous_ui_strings(previous: PreviousCatalogs):
+    def ui_strings(lang=None):
+        lang = lang or previous.cfg.language
+        table = previous._translations().get(lang, previous._translations()["Русский"])
+        # Keys added after the old catalog was frozen still come from the current table
+        return ChainMap(table, app.UI_TRANSLATIONS.get(lang, app.UI_TRANSLATIONS["Русский"]))
+    return ui_strings
+
+
+def _bench_config(workdir: Path) -> AutoConfig:
+    return AutoConfig(
+        first_run_done=True,
+        language="English",
+        tokens_txt=str(workdir / "tokens.txt"),
+        tokens_csv=str(workdir / "tokens.csv"),
+        revoked_tokens_txt=str(workdir / "revoked_tokens.txt"),
+        token_history_csv=str(workdir / "token_history.csv"),
+        backup_dir=str(workdir / "backups"),
+        jobs_dir=str(workdir / "jobs"),
+        log_dir=str(workdir / "logs"),
+    )
+
+
+def _seed_tokens(path: Path, rows: int):
+    # Same layout _write_token produces: integer Unix seconds, a few hundred bots a day
+    start = int((datetime.now() - timedelta(days=max(1, rows // 200))).timestamp())
+    with path.open("w", newline="", encoding="utf-8") as handle:
+        writer = csv.writer(handle)
+        writer.writerow(["username", "token", "hamster", "account", "ts"])
+        for index in range(rows):
+            writer.writerow([f"bench_{index}_bot", f"{100000000 + index}:AA{'x' * 33}", "", "+10000000000", start + index * 420])
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark translation lookups and language switching")
+    parser.add_argument("--repeat", type=int, default=200)
+    parser.add_argument("--tokens", type=int, default=2000)
+    args = parser.parse_args()
+
+    workdir = Path(tempfile.mkdtemp(prefix="bench_translations_"))
+    cfg = _bench_config(workdir)
+    _seed_tokens(cfg.tokens_csv_path(), args.tokens)
+    previous = PreviousCatalogs(cfg)
+    # The window loads and saves its own config; keep it and every data file in the temp dir
+    original_load_config, original_config_file = app.load_config, app.CONFIG_FILE
+    app.load_config = lambda: cfg
+    app.CONFIG_FILE = workdir / "config.json"
+    qa = QApplication.instance() or QApplication([])
+    window = None
+    languages = ["English", "Русский"]
+
+    try:
+        window = app.BotFactoryApp()
+        groups = len(window.tokens_page._load_rows().indices_by_date())
+        refresh_key = f"tokens_refresh_view ({args.tokens} rows, {groups} dates)"
+        switch_language = lambda: window.apply_language(languages.append(languages.pop(0)) or languages[0])
+        result = {
+            "previous ui_strings": _timed(_previous_ui_strings(previous), args.repeat),
+            "ui_strings": _timed(window.ui_strings, args.repeat),
+            "previous translate_text": _timed(lambda: previous.translate_text("Отмена"), args.repeat),
+            "translate_text": _timed(lambda: window.translate_text("Отмена"), args.repeat),
+            "previous format_limit_hint": _timed(lambda: previous.format_limit_hint(2), args.repeat),
+            "format_limit_hint": _timed(lambda: window.format_limit_hint(2), args.repeat),
+            "apply_language": _timed(switch_language, args.repeat),
+            refresh_key: _timed(window.tokens_page.refresh_view, max(1, args.repeat // 10)),
+        }
+        # Same widget code, with the old per-call catalog builders plugged back in
+        window.ui_strings = _previous_ui_strings(previous)
+        window.translate_text = previous.translate_text
+        window.format_limit_hint = previous.format_limit_hint
+        result["previous apply_language"] = _timed(switch_language, args.repeat)
+        result[f"previous {refresh_key}"] = _timed(window.tokens_page.refresh_view, max(1, args.repeat // 10))
+    finally:
+        if window is not None:
+            window.close()
+            qa.processEvents()
+            app.state_writer.flush()
+            for handler in list(window._run_log.handlers):
+                window._run_log.removeHandler(handler)
+                handler.close()
+        app.load_config, app.CONFIG_FILE = original_load_config, original_config_file
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    print(json.dumps(result, ensure_ascii=False, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
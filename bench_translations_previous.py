@@ -0,0 +1,368 @@
+from typing import Dict
+
+
+# BotFactoryApp's catalog methods as they were before the tables moved to module level:
+# every call rebuilt the whole dict. Kept verbatim as the baseline for bench_translations.py.
+class PreviousCatalogs:
+    def __init__(self, cfg):
+        self.cfg = cfg
+
+    def translate_text(self, text: str) -> str:
+        if self.cfg.language != "English":
+            return text
+        mapping = {
+            "Ошибка": "Error",
+            "Готово": "Done",
+            "Сброс": "Reset",
+            "Пусто": "Empty",
+            "Нет даты": "No date",
+            "Нет выбора": "No selection",
+            "Нет аккаунтов": "No accounts",
+            "Нет аккаунтов для авторизации.": "No accounts for authorization.",
+            "Введите название хомяка.": "Enter a hamster name.",
+            "Уже работает": "Already running",
+            "Сначала остановите текущий процесс.": "Stop the current process first.",
+            "Введите имена через '/'.": "Enter names separated by '/'.",
+            "Выберите картинку (обязательно).": "Select an image (required).",
+            "Выберите одного бота для единичного удаления.": "Select one bot for single deletion.",
+            "Выберите одного бота для revoke token.": "Select one bot for revoke token.",
+            "Выберите ботов в таблице или укажите usernames для удаления.": "Select bots in the table or enter usernames for deletion.",
+            "Выберите ботов или укажите usernames для массового revoke.": "Select bots or enter usernames for mass revoke.",
+            "Нет выбранных ботов для удаления.": "No bots selected for deletion.",
+            "Введите хотя бы один username.": "Enter at least one username.",
+            "Нет доступных аккаунтов для создания.": "No available accounts for creation.",
+            "Лимит ботов": "Bot limit",
+            "Сколько ботов можно создать на аккаунт за запуск?": "How many bots can be created per account per run?",
+            "Редактировать хомяка": "Edit hamster",
+            "Название:": "Name:",
+            "Процент:": "Percent:",
+            "Сохранить": "Save",
+            "Кастомизация авто-режима": "Auto mode customization",
+            "Имя бота (видимое в Telegram)": "Bot name (visible in Telegram)",
+            "Префикс (будет ПЕРЕД СУФФИКСОМ):": "Prefix (before suffix):",
+            "Суффикс (БУДЕТ ПОСЛЕ ПРЕФИКСА):": "Suffix (after prefix):",
+            "Username бота (адрес @...)": "Bot username (address @...)",
+            "Автоматически приводить username к допустимому виду (латиница/цифры/_)": "Automatically sanitize username (latin/number/_)",
+            "Окончание (пример: cat + _bot → cat_bot):": "Suffix (example: cat + _bot → cat_bot):",
+            "Разделитель перед номером (пример: cat_1bot):": "Separator before number (example: cat_1bot):",
+            "Текст после номера (пример: cat_1bot):": "Text after number (example: cat_1bot):",
+            "Сколько вариантов с номером пробовать:": "How many numbered variants to try:",
+            "Сохранение токенов": "Token saving",
+            "Изменить": "Change",
+            "Куда сохранить tokens.txt": "Where to save tokens.txt",
+            "Куда сохранить tokens.csv": "Where to save tokens.csv",
+            "tokens.txt (только токены):": "tokens.txt (tokens only):",
+            "tokens.csv (для статистики):": "tokens.csv (for stats):",
+            "Применить": "Apply",
+            "Закрыть": "Close",
+            "Санитизировать username": "Sanitize username",
+            "Префикс имени:": "Name prefix:",
+            "Суффикс имени:": "Name suffix:",
+            "Окончание username:": "Username suffix:",
+            "Разделитель перед номером:": "Separator before number:",
+            "Текст после номера:": "Text after number:",
+            "Попыток номеров:": "Number attempts:",
+            "Кастомизация сохранена для:": "Customization saved for:",
+            "Токены не найдены.": "No tokens found.",
+            "Нет дат для токенов.": "No token dates found.",
+            "Выберите дату в списке слева.": "Select a date from the list on the left.",
+            "Отметьте даты галочками слева.": "Select dates on the left.",
+            "Токены сгруппированы по датам. Можно копировать, редактировать и удалять.": "Tokens are grouped by dates. You can copy, edit, and delete them.",
+            "Ручной режим": "Manual mode",
+            "Ручной режим в этой версии использует авто-логику. Рекомендуется авто-режим.": "Manual mode in this version uses auto logic. Auto mode is recommended.",
+            "Код авторизации": "Authorization code",
+            "Введите код для": "Enter code for",
+            "Пароль 2FA": "2FA password",
+            "Введите пароль 2FA для": "Enter 2FA password for",
+            "Массовое удаление": "Mass delete",
+            "Массовый Revoke": "Mass revoke",
+            "Продолжить": "Continue",
+            "Отмена": "Cancel",
+            "Поиск": "Search",
+            "Совпадения не найдены.": "No matches found.",
+            "Результаты поиска": "Search results",
+            "Открыть": "Open",
+            "Скопировать": "Copy",
+            "ОК": "OK",
+            "Как выбрать ботов для действия: Удаление?": "How to choose bots for delete?",
+            "Как выбрать ботов для действия: Revoke Token?": "How to choose bots for revoke?",
+            "Выбрать в таблице": "Select in table",
+            "Ввести usernames вручную (без @, через /)": "Enter usernames manually (without @, via /)",
+            "Не найдены": "Not found",
+            "Не удалось найти аккаунты для:": "Could not find accounts for:",
+            "Автозапуск": "Autostart",
+            "Автозапуск доступен только в Windows.": "Autostart is available on Windows only.",
+            "Автозапуск включён.": "Autostart enabled.",
+            "Автозапуск отключён.": "Autostart disabled.",
+            "Ошибка автозапуска:": "Autostart error:",
+            "Резервная копия": "Backup",
+            "Резервная копия создана.": "Backup created.",
+            "Ошибка создания:": "Create error:",
+            "Импорт резервной копии": "Import backup",
+            "Резервная копия импортирована. Перезапустите приложение.": "Backup imported. Restart the app.",
+            "Ошибка импорта:": "Import error:",
+            "Настройки сброшены. Перезапустите приложение.": "Settings reset. Restart the app.",
+            "Ошибка сброса:": "Reset error:",
+            "Добавить аккаунты": "Add accounts",
+            "Вставьте аккаунты (по одному в строке).": "Paste accounts (one per line).",
+            "Выберите бота": "Select bot",
+            "Имя бота:": "Bot name:",
+            "Кастомизация авто-режима": "Auto mode customization",
+            "Кастомизация:": "Customization:",
+            "Скопировать": "Copy",
+            "Revoke завершён": "Revoke completed",
+            "Операция завершена. Полученные токены:": "Operation completed. Received tokens:",
+            "Токены не были получены.": "No tokens were received.",
+            "Лимит ботов": "Bot limit",
+            "На аккаунтах достигнут лимит 20 ботов:": "Accounts reached the 20-bot limit:",
+            "Перезапуск": "Restart",
+            "Рекомендуется перезапустить авто-режим, чтобы сбросить лимиты/ошибки аккаунтов. Если бот зацикливается на 1-2 аккаунтах, попробуйте снизить лимит на аккаунт и повторить запуск.": "It is recommended to restart auto mode to reset limits/errors. If the bot loops on 1-2 accounts, try lowering the per-account limit and run again.",
+            "ОК": "OK",
+        }
+        if text in mapping:
+            return mapping[text]
+        if text.startswith("Введите код для "):
+            return text.replace("Введите код для ", "Enter code for ")
+        if text.startswith("Введите пароль 2FA для "):
+            return text.replace("Введите пароль 2FA для ", "Enter 2FA password for ")
+        if text.startswith("Кастомизация: "):
+            return text.replace("Кастомизация: ", "Customization: ")
+        if text.startswith("На аккаунтах достигнут лимит 20 ботов:"):
+            return text.replace("На аккаунтах достигнут лимит 20 ботов:", "Accounts reached the 20-bot limit:")
+        return text
+
+    def _translations(self) -> Dict[str, Dict[str, str]]:
+        return {
+            "Русский": {
+                "nav_auto": "Автоматическое создание",
+                "nav_bots": "Боты",
+                "nav_accounts": "Аккаунты",
+                "nav_tokens": "Токены",
+                "nav_stats": "Статистика",
+                "nav_manage": "Удаление / Revoke",
+                "nav_settings": "Настройки",
+                "search_placeholder": "Поиск по ботам...",
+                "auto_title": "Автоматическое создание",
+                "auto_chat": "Чат:",
+                "auto_names": "Имена:",
+                "auto_hamster": "Хомяк:",
+                "auto_names_placeholder": "name/name2/name3 (без пробелов)",
+                "auto_pick_img": "Выбрать аватарку (обязательно)",
+                "auto_open_tokens": "Открыть tokens.txt",
+                "auto_limit_edit": "Изменить лимит",
+                "auto_limit_hint": "Лимит: {limit} бота(ов) на аккаунт за 1 запуск (1 запуск = 1 круг).",
+                "auto_custom": "Кастомизация (all bots)",
+                "auto_edit": "Изменить (one bot)",
+                "auto_start": "Запуск (Авто режим)",
+                "auto_stop": "Стоп",
+                "bots_title": "Боты",
+                "bots_hint": "Список ботов и аккаунтов, на которых они созданы.",
+                "bots_refresh": "Обновить",
+                "accounts_title": "Аккаунты",
+                "accounts_hint": "Управление аккаунтами и авторизацией.",
+                "accounts_add": "Добавить аккаунты",
+                "accounts_edit": "Редактировать",
+                "accounts_delete": "Удалить аккаунт",
+                "accounts_auth_all": "Авторизовать все",
+                "accounts_auth_failed": "Авторизовать ошибки",
+                "accounts_refresh": "Обновить",
+                "tokens_title": "Токены",
+                "tokens_hint": "Токены сгруппированы по датам. Можно копировать, редактировать и удалять.",
+                "tokens_placeholder": "Токены для выбранной даты (по одному в строке)...",
+                "tokens_refresh": "Обновить",
+                "tokens_save": "Сохранить изменения",
+                "tokens_copy_selected": "Копировать выбранные",
+                "tokens_copy_latest": "Копировать последние",
+                "tokens_delete_selected": "Удалить выбранные",
+                "tokens_clear": "Очистить список",
+                "stats_title": "Статистика",
+                "stats_name_placeholder": "Название хомяка",
+                "stats_percent_label": "Процент:",
+                "stats_add": "Добавить хомяка",
+                "stats_edit": "Редактировать",
+                "stats_delete": "Удалить выбранный",
+                "stats_refresh": "Обновить",
+                "manage_title": "Удаление и Revoke Token",
+                "manage_hint": "Выберите ботов в таблице или введите usernames для массового удаления или revoke токена.",
+                "manage_refresh": "Обновить список",
+                "manage_delete_mass": "Массовое удаление",
+                "manage_delete_single": "Единичное удаление",
+                "manage_revoke_mass": "Массовый Revoke",
+                "manage_revoke_single": "Revoke Token",
+                "manage_open_revoked": "Открыть revoke_tokens.txt",
+                "section_files": "Файлы",
+                "section_run": "Запуск",
+                "section_actions": "Действия",
+                "section_list": "Список",
+                "section_delete": "Удаление",
+                "section_revoke": "Revoke",
+                "section_manage": "Управление",
+                "section_auth": "Авторизация",
+                "bots_table_bot": "Бот",
+                "bots_table_account": "Аккаунт",
+                "bots_table_created": "Создан",
+                "accounts_table_phone": "Телефон",
+                "accounts_table_status": "Статус",
+                "accounts_table_reason": "Причина",
+                "tokens_table_date": "Дата / Токен",
+                "tokens_table_bot": "Бот",
+                "tokens_date_label": "Дата",
+                "stats_table_hamster": "Хомяк",
+                "stats_table_percent": "Процент",
+                "stats_table_bots": "Ботов",
+                "manage_table_bot": "Бот",
+                "manage_table_account": "Аккаунт",
+                "settings_title": "Настройки",
+                "settings_hint": "",
+                "settings_language": "Язык:",
+                "settings_autostart_label": "Автозапуск с Windows:",
+                "settings_autostart_toggle": "Включить автозапуск",
+                "settings_perf_label": "Отрисовка:",
+                "settings_perf_toggle": "Режим производительности (без теней и анимаций)",
+                "settings_frame_measure": "Замерить кадр",
+                "settings_frame_result": "Кадр: с тенями {normal:.1f} мс, без теней {fast:.1f} мс",
+                "settings_backup": "Создать резервную копию",
+                "settings_restore": "Импорт резервной копии",
+                "settings_reset": "Сброс до заводских настроек",
+                "settings_onboarding": "Мастер новичка",
+                "settings_support": "Тех. Поддержка",
+                "settings_info_title": "Полезное",
+                "settings_info_tip": "Подсказка: для быстрых операций можно вставлять имена через «/».",
+                "settings_quick_actions": "Быстрые действия",
+                "settings_quick_tokens": "Открыть tokens.txt",
+                "settings_quick_tokens_csv": "Открыть tokens.csv",
+                "settings_quick_revoked": "Открыть revoke_tokens.txt",
+                "onb_auto_title": "Авто‑создание",
+                "onb_auto_body": "• Поле имён принимает список через «/» — это быстрый способ создать несколько ботов за один запуск.\n• Блок «Хомяк» влияет на статистику дохода — выберите того, кому начисляется доля.\n• Картинка в этом разделе назначится всем новым ботам, поэтому проверьте предпросмотр.\n• Кнопка «Запуск (Авто режим)» стартует процесс и запускает очередь по аккаунтам.\n• Лимит «ботов на аккаунт» задаёт, сколько ботов сделает один аккаунт за круг; это помогает обходить лимиты.",
+                "onb_bots_title": "Боты",
+                "onb_bots_body": "• В таблице показаны все созданные боты: username, аккаунт‑создатель и дата.\n• Нажимайте строку, чтобы быстро скопировать нужные данные.\n• «Обновить» подтягивает новые записи сразу после создания.\n• Список помогает проверить, что бот создался и на каком аккаунте он находится.",
+                "onb_accounts_title": "Аккаунты",
+                "onb_accounts_body": "• Формат строки: phone:password:api_id:api_hash. Если 2FA нет — пароль ставьте UNKOWN.\n• «Авторизовать все» проверяет вход и создаёт сессии в папке sessions/.\n• «Авторизовать ошибки» полезно, когда нужно перезапустить только проблемные аккаунты.\n• Колонка статуса показывает причину, по которой аккаунт не участвует в создании ботов.",
+                "onb_tokens_title": "Токены",
+                "onb_tokens_body": "• Токены группируются по датам — так проще находить свежие или старые партии.\n• Раскрывайте дату стрелкой, затем выделяйте нужные токены.\n• Доступны действия: копирование, редактирование и удаление выбранных строк.\n• Это ваш основной «склад» токенов для выдачи пользователям.",
+                "onb_stats_title": "Статистика",
+                "onb_stats_body": "• Здесь вы задаёте «хомяков» с процентами — это виртуальные роли для распределения статистики.\n• Таблица показывает общее количество ботов, относящихся к каждому хомяку.\n• Записи можно редактировать и удалять, если схема распределения изменилась.",
+                "onb_manage_title": "Удаление / Revoke",
+                "onb_manage_body": "• Раздел для обслуживания уже созданных ботов.\n• Массовое удаление удалит всех выделенных ботов одним запуском.\n• Единичное удаление подходит для точечной очистки.\n• Revoke Token создаёт новый токен у BotFather и сохраняет его в revoke_tokens.txt.",
+                "onb_final_title": "Финал",
+                "onb_final_body": "Готово! Теперь вы знаете ключевые функции приложения.\nЕсли захотите повторить — нажмите «Мастер новичка» в настройках.\n\ncreated by whynot",
+            },
+            "English": {
+                "nav_auto": "Auto creation",
+                "nav_bots": "Bots",
+                "nav_accounts": "Accounts",
+                "nav_tokens": "Tokens",
+                "nav_stats": "Stats",
+                "nav_manage": "Delete / Revoke",
+                "nav_settings": "Settings",
+                "search_placeholder": "Search bots...",
+                "auto_title": "Auto creation",
+                "auto_chat": "Chat:",
+                "auto_names": "Names:",
+                "auto_hamster": "Hamster:",
+                "auto_names_placeholder": "name/name2/name3 (no spaces preferred)",
+                "auto_pick_img": "Pick image (required)",
+                "auto_open_tokens": "Open tokens.txt",
+                "auto_limit_edit": "Change limit",
+                "auto_limit_hint": "Limit: {limit} bot(s) per account per run (1 run = 1 round).",
+                "auto_custom": "Customization",
+                "auto_edit": "Edit",
+                "auto_start": "Start (Auto mode)",
+                "auto_stop": "Stop",
+                "bots_title": "Bots",
+                "bots_hint": "List of bots and the accounts they were created on.",
+                "bots_refresh": "Refresh",
+                "accounts_title": "Accounts",
+                "accounts_hint": "Manage accounts and authorization.",
+                "accounts_add": "Add accounts",
+                "accounts_edit": "Edit",
+                "accounts_delete": "Delete account",
+                "accounts_auth_all": "Authorize all",
+                "accounts_auth_failed": "Authorize failed",
+                "accounts_refresh": "Refresh",
+                "tokens_title": "Tokens",
+                "tokens_hint": "Tokens are grouped by dates. You can copy, edit, and delete them.",
+                "tokens_placeholder": "Tokens for the selected date (one per line)...",
+                "tokens_refresh": "Refresh",
+                "tokens_save": "Save changes",
+                "tokens_copy_selected": "Copy selected",
+                "tokens_copy_latest": "Copy latest",
+                "tokens_delete_selected": "Delete selected",
+                "tokens_clear": "Clear list",
+                "stats_title": "Stats",
+                "stats_name_placeholder": "Hamster name",
+                "stats_percent_label": "Percent:",
+                "stats_add": "Add hamster",
+                "stats_edit": "Edit",
+                "stats_delete": "Delete selected",
+                "stats_refresh": "Refresh",
+                "manage_title": "Delete and Revoke Token",
+                "manage_hint": "Select bots in the table or enter usernames for mass delete or revoke.",
+                "manage_refresh": "Refresh list",
+                "manage_delete_mass": "Mass delete",
+                "manage_delete_single": "Single delete",
+                "manage_revoke_mass": "Mass revoke",
+                "manage_revoke_single": "Revoke token",
+                "manage_open_revoked": "Open revoke_tokens.txt",
+                "section_files": "Files",
+                "section_run": "Run",
+                "section_actions": "Actions",
+                "section_list": "List",
+                "section_delete": "Delete",
+                "section_revoke": "Revoke",
+                "section_manage": "Manage",
+                "section_auth": "Authorization",
+                "bots_table_bot": "Bot",
+                "bots_table_account": "Account",
+                "bots_table_created": "Created",
+                "accounts_table_phone": "Phone",
+                "accounts_table_status": "Status",
+                "accounts_table_reason": "Reason",
+                "tokens_table_date": "Date / Token",
+                "tokens_table_bot": "Bot",
+                "tokens_date_label": "Date",
+                "stats_table_hamster": "Hamster",
+                "stats_table_percent": "Percent",
+                "stats_table_bots": "Bots",
+                "manage_table_bot": "Bot",
+                "manage_table_account": "Account",
+                "settings_title": "Settings",
+                "settings_hint": "Manage language, autostart, and backups.",
+                "settings_language": "Language:",
+                "settings_autostart_label": "Autostart with Windows:",
+                "settings_autostart_toggle": "Enable autostart",
+                "settings_perf_label": "Rendering:",
+                "settings_perf_toggle": "Performance mode (no shadows or animations)",
+                "settings_frame_measure": "Measure frame",
+                "settings_frame_result": "Frame: with shadows {normal:.1f} ms, flat {fast:.1f} ms",
+                "settings_backup": "Create backup",
+                "settings_restore": "Import backup",
+                "settings_reset": "Factory reset",
+                "settings_onboarding": "Onboarding wizard",
+                "settings_support": "Support",
+                "settings_info_title": "Helpful",
+                "settings_info_tip": "Tip: you can paste names separated by “/” for quick operations.",
+                "settings_quick_actions": "Quick actions",
+                "settings_quick_tokens": "Open tokens.txt",
+                "settings_quick_tokens_csv": "Open tokens.csv",
+                "settings_quick_revoked": "Open revoke_tokens.txt",
+                "onb_auto_title": "Auto creation",
+                "onb_auto_body": "• Enter names using “/” to queue multiple bots in one run.\n• The hamster selector impacts revenue stats — pick who should receive the share.\n• The image you choose here becomes the avatar for every new bot.\n• “Start (Auto mode)” launches the creation flow and cycles through accounts.\n• The per‑account limit controls how many bots one account creates per round.",
+                "onb_bots_title": "Bots",
+                "onb_bots_body": "• This table lists every created bot with username, creator account, and date.\n• Click a row to quickly copy or verify details.\n• “Refresh” syncs new bots right after creation.\n• Use this view to confirm where a bot was created.",
+                "onb_accounts_title": "Accounts",
+                "onb_accounts_body": "• Format: phone:password:api_id:api_hash. Use UNKOWN if 2FA is not enabled.\n• “Authorize all” validates logins and creates sessions in sessions/.\n• “Authorize failed” retries only the accounts with errors.\n• Statuses explain why an account is unavailable.",
+                "onb_tokens_title": "Tokens",
+                "onb_tokens_body": "• Tokens are grouped by date to keep batches organized.\n• Expand a date to see individual tokens.\n• You can copy, edit, or delete selected rows.\n• This is your main storage for distribution.",
+                "onb_stats_title": "Stats",
+                "onb_stats_body": "• Define hamsters with percentages to track revenue distribution.\n• The table shows bot counts per hamster.\n• Edit or delete entries when your scheme changes.",
+                "onb_manage_title": "Delete / Revoke",
+                "onb_manage_body": "• This section is for maintaining existing bots.\n• Mass delete removes all selected bots in one run.\n• Single delete is for precise cleanup.\n• Revoke Token generates a new BotFather token and saves it to revoke_tokens.txt.",
+                "onb_final_title": "Finish",
+                "onb_final_body": "All set! You now know the key features.\nTo replay the tour, use “Onboarding wizard” in Settings.\n\ncreated by whynot_repow",
+            }
+        }
+
+    def format_limit_hint(self, limit: int) -> str:
+        t = self._translations().get(self.cfg.language, self._translations()["Русский"])
+        return t["auto_limit_hint"].format(limit=limit)
@@ -0,0 +1,220 @@
+import argparse
+import json
+import re
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+from typing import List
+
+from backups import BackupStore, restore_zip
+from core import (
+    BASE_DIR,
+    backup_sources,
+    load_bot_records,
+    load_config,
+    parse_usernames,
+    token_history,
+)
+from exports import EXPORT_FORMATS, ExportFilter, export_tokens
+from storage import state_writer
+
+
+def _print_json(data):
+    print(json.dumps(data, ensure_ascii=False, indent=2))
+
+
+def _progress(done: int, total: int, name: str):
+    print(f"{done}/{total} {name}", file=sys.stderr)
+
+
+def cmd_stats(args, cfg) -> int:
+    records = load_bot_records(cfg)
+    by_date = Counter(records.date_key(index) or "-" for index in range(len(records)))
+    result = {
+        "bots": len(records),
+        "by_hamster": dict(sorted(records.hamster_counts().items())),
+        "by_account": dict(sorted(Counter(account or "-" for account in records.accounts).items())),
+        "by_date": dict(sorted(by_date.items())),
+        "revoked": sum(1 for version in records.versions if version),
+    }
+    if args.by:
+        result = {"bots": result["bots"], f"by_{args.by}": result[f"by_{args.by}"]}
+    _print_json(result)
+    return 0
+
+
+def cmd_export(args, cfg) -> int:
+    flt = ExportFilter(
+        date_from=args.date_from or "",
+        date_to=args.date_to or "",
+        hamsters=set(args.hamster or []),
+        accounts=set(args.account or []),
+    )
+    try:
+        flt.bounds()
+    except ValueError:
+        print("[ERROR] Дата должна быть в формате YYYY-MM-DD.", file=sys.stderr)
+        return 2
+    output = args.output or Path(f"tokens_export_{time.strftime('%Y%m%d_%H%M%S')}.{args.format}")
+    result = export_tokens(
+        cfg.tokens_csv_path(),
+        output,
+        args.format,
+        flt,
+        token_history(cfg).snapshot(),
+        _progress if args.progress else None,
+    )
+    _print_json(result)
+    return 0
+
+
+def cmd_search(args, cfg) -> int:
+    records = load_bot_records(cfg)
+    if args.regex:
+        pattern = re.compile(args.query, re.IGNORECASE)
+        match = lambda value: bool(pattern.search(value))
+    else:
+        needle = args.query.lower().lstrip("@")
+        match = lambda value: needle in value.lower()
+    fields = [args.field] if args.field else ["username", "token", "account", "hamster"]
+    columns = {"username": records.usernames, "token": records.tokens, "account": records.accounts, "hamster": records.hamsters}
+    found = 0
+    for index in range(len(records)):
+        if not any(match(columns[name][index]) for name in fields):
+            continue
+        found += 1
+        print("\t".join([
+            records.usernames[index],
+            records.tokens[index],
+            records.hamsters[index] or "None",
+            records.accounts[index] or "-",
+            records.date_key(index) or "-",
+        ]))
+        if args.limit and found >= args.limit:
+            break
+    return 0 if found else 1
+
+
+def cmd_backup(args, cfg) -> int:
+    store = BackupStore(args.dir or cfg.backup_dir_path())
+    if args.list:
+        _print_json(store.list_snapshots())
+        return 0
+    state_writer.flush()
+    result = store.snapshot(backup_sources(cfg), _progress if args.progress else None)
+    result["pruned"] = store.prune(cfg.backup_keep if args.keep is None else args.keep)
+    _print_json(result)
+    return 0
+
+
+def cmd_restore(args, cfg) -> int:
+    state_writer.flush()
+    progress = _progress if args.progress else None
+    source = Path(args.source)
+    suffix = source.suffix.lower()
+    with state_writer.suspended():
+        if suffix == ".zip":
+            restored = restore_zip(source, BASE_DIR, progress)
+        elif suffix == ".json":
+            restored = BackupStore(args.dir or source.resolve().parent.parent).restore(source.stem, BASE_DIR, progress)
+        else:
+            restored = BackupStore(args.dir or cfg.backup_dir_path()).restore(args.source, BASE_DIR, progress)
+    _print_json({"files": restored})
+    return 0
+
+
+def _resolve_targets(cfg, usernames: List[str]):
+    accounts = load_bot_records(cfg).account_by_username()
+    targets, missing = [], []
+    for username in usernames:
+        account = accounts.get(username)
+        if account:
+            targets.append({"username": username, "account": account})
+        else:
+            missing.append(username)
+    return targets, missing
+
+
+def cmd_manage(args, cfg) -> int:
+    import asyncio
+
+    from management import ManagementRunner
+
+    usernames = parse_usernames(" ".join(args.usernames))
+    if args.from_file:
+        usernames += [name for name in parse_usernames(Path(args.from_file).read_text(encoding="utf-8")) if name not in usernames]
+    targets, missing = _resolve_targets(cfg, usernames)
+    for username in missing:
+        print(f"[WARN] Аккаунт для @{username} не найден в tokens.csv.", file=sys.stderr)
+    if not targets:
+        print("[ERROR] Нет ботов для обработки.", file=sys.stderr)
+        return 2
+    runner = ManagementRunner(cfg, args.command, targets)
+    try:
+        asyncio.run(runner.run())
+    except KeyboardInterrupt:
+        print("[INFO] Stop запрошен.", file=sys.stderr)
+        return 130
+    if args.command == "revoke":
+        _print_json([{"username": username, "token": token} for username, token in runner.revoked_results])
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="botfactory", description="Headless Telegram Bot Factory tools")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    stats = sub.add_parser("stats", help="Bot counts by hamster, account and date")
+    stats.add_argument("--by", choices=["hamster", "account", "date"], default=None)
+    stats.set_defaults(handler=cmd_stats)
+
+    export = sub.add_parser("export", help="Stream tokens to TXT, CSV or JSONL")
+    export.add_argument("--format", choices=EXPORT_FORMATS, default="txt")
+    export.add_argument("--from", dest="date_from", default=None, help="YYYY-MM-DD, inclusive")
+    export.add_argument("--to", dest="date_to", default=None, help="YYYY-MM-DD, inclusive")
+    export.add_argument("--hamster", action="append", help="May be repeated")
+    export.add_argument("--account", action="append", help="May be repeated")
+    export.add_argument("--output", "-o", type=Path, default=None)
+    export.add_argument("--progress", action="store_true")
+    export.set_defaults(handler=cmd_export)
+
+    search = sub.add_parser("search", help="Find bots by username, token, account or hamster")
+    search.add_argument("query")
+    search.add_argument("--field", choices=["username", "token", "account", "hamster"], default=None)
+    search.add_argument("--regex", action="store_true")
+    search.add_argument("--limit", type=int, default=0)
+    search.set_defaults(handler=cmd_search)
+
+    backup = sub.add_parser("backup", help="Create a deduplicated snapshot")
+    backup.add_argument("--dir", type=Path, default=None)
+    backup.add_argument("--list", action="store_true", help="List snapshots instead of creating one")
+    backup.add_argument("--keep", type=int, default=None, help="Snapshots to keep, older ones and their unused chunks are removed (default: backup_keep from config.json, 0 keeps all)")
+    backup.add_argument("--progress", action="store_true")
+    backup.set_defaults(handler=cmd_backup)
+
+    restore = sub.add_parser("restore", help="Restore a snapshot id, manifest .json or .zip backup")
+    restore.add_argument("source")
+    restore.add_argument("--dir", type=Path, default=None)
+    restore.add_argument("--progress", action="store_true")
+    restore.set_defaults(handler=cmd_restore)
+
+    for name, help_text in (("delete", "Delete bots through BotFather"), ("revoke", "Revoke bot tokens through BotFather")):
+        manage = sub.add_parser(name, help=help_text)
+        manage.add_argument("usernames", nargs="*")
+        manage.add_argument("--from-file", default=None, help="File with usernames separated by spaces, newlines or '/'")
+        manage.set_defaults(handler=cmd_manage)
+    return parser
+
+
+def main(argv=None) -> int:
+    args = build_parser().parse_args(argv)
+    cfg = load_config()
+    try:
+        return args.handler(args, cfg)
+    finally:
+        state_writer.flush()
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,227 @@
+import json
+import re
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+from accounts import AccountRegistry
+from jobs import JobJournal, job_journal_for
+from storage import state_writer
+from tokens import (
+    EVENT_REVOKED,
+    BotRecords,
+    TokenHistory,
+    bot_record_store_for,
+    read_bot_records,
+    read_revoked_lines,
+    token_history_for,
+)
+
+BASE_DIR = Path(__file__).resolve().parent
+SESSIONS_DIR = BASE_DIR / "sessions"
+ACCOUNTS_FILE = BASE_DIR / "accounts_tg.txt"
+CONFIG_FILE = BASE_DIR / "config.json"
+HAMSTERS_FILE = BASE_DIR / "hamsters.json"
+FROZEN_FILE = BASE_DIR / "frozen.json"
+ACCOUNTS_STATUS_FILE = BASE_DIR / "accounts_status.json"
+SESSIONS_DIR.mkdir(parents=True, exist_ok=True)
+account_registry = AccountRegistry(ACCOUNTS_FILE)
+
+BOTFATHER_USERNAME_DEFAULT = "BotFather"
+
+
+def ensure_file(path: Path):
+    if not path.exists():
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("", encoding="utf-8")
+
+
+def safe_int(s: str, default: int = 0) -> int:
+    try:
+        return int(s)
+    except:
+        return default
+
+
+def parse_usernames(raw: str) -> List[str]:
+    if not raw:
+        return []
+    parts = re.split(r"[\s/]+", raw.strip())
+    seen = set()
+    result = []
+    for part in parts:
+        name = part.strip().lstrip("@")
+        if not name or name in seen:
+            continue
+        seen.add(name)
+        result.append(name)
+    return result
+
+
+def extract_try_again_seconds(text: str) -> Optional[int]:
+    if not text:
+        return None
+    patterns = [
+        r"Please try again in (\d+) seconds",
+        r"Попробуйте снова через (\d+)\s*сек",
+        r"Повторите через (\d+)\s*сек",
+        r"Try again in (\d+) seconds",
+    ]
+    for pattern in patterns:
+        m = re.search(pattern, text, re.IGNORECASE)
+        if m:
+            return int(m.group(1))
+    return None
+
+
+def extract_created_username(text: str) -> Optional[str]:
+    if not text:
+        return None
+    m = re.search(r"(?:t\.me/|@)([A-Za-z0-9_]{4,})", text)
+    return m.group(1) if m else None
+
+
+def is_manual_prompt(text: str) -> bool:
+    if not text:
+        return False
+    lowered = text.lower()
+    return "see the manual" in lowered
+
+
+def extract_token(text: str) -> Optional[str]:
+    # Robust: BotFather token is like 123456789:AA... (base64url-ish)
+    m = re.search(r"\b\d{6,12}:[A-Za-z0-9_-]{20,}\b", text or "")
+    return m.group(0) if m else None
+
+
+def has_too_many_bots(text: str) -> bool:
+    return "can't add more than 20 bots" in (text or "").lower()
+
+
+def sanitize_base(base: str) -> str:
+    b = base.lower()
+    b = re.sub(r"[^a-z0-9_]", "", b)
+    b = re.sub(r"_+", "_", b).strip("_")
+    return b or "bot"
+
+
+def load_json(path: Path, default):
+    try:
+        state_writer.flush(path)
+        if path.exists():
+            return json.loads(path.read_text(encoding="utf-8"))
+    except:
+        pass
+    return default
+
+
+def save_json(path: Path, data):
+    state_writer.save(path, data)
+
+
+@dataclass
+class AutoConfig:
+    botfather: str = BOTFATHER_USERNAME_DEFAULT
+    name_prefix: str = "ОРИГ С ТТ❤️"
+    name_suffix: str = ""
+    username_suffix: str = "_bot"
+    numbered_separator: str = "_"
+    numbered_suffix: str = "bot"
+    max_number_attempts: int = 5
+    sanitize_username: bool = True
+    tokens_txt: str = "tokens.txt"
+    tokens_csv: str = "tokens.csv"
+    revoked_tokens_txt: str = "revoked_tokens.txt"
+    token_history_csv: str = "token_history.csv"
+    per_account_limit: int = 2
+    freeze_threshold_seconds: int = 350
+    force_setuserpic_delay1: float = 1.0
+    force_setuserpic_delay2: float = 1.0
+    first_run_done: bool = False
+    language: str = "Русский"
+    performance_rendering: bool = False
+    stall_threshold_ms: int = 250
+    backup_dir: str = "backups"
+    backup_keep: int = 10
+    jobs_dir: str = "jobs"
+    log_dir: str = "logs"
+
+    def tokens_txt_path(self) -> Path:
+        p = Path(self.tokens_txt)
+        return p if p.is_absolute() else BASE_DIR / p
+
+    def tokens_csv_path(self) -> Path:
+        p = Path(self.tokens_csv)
+        return p if p.is_absolute() else BASE_DIR / p
+
+    def revoked_tokens_txt_path(self) -> Path:
+        p = Path(self.revoked_tokens_txt)
+        return p if p.is_absolute() else BASE_DIR / p
+
+    def token_history_csv_path(self) -> Path:
+        p = Path(self.token_history_csv)
+        return p if p.is_absolute() else BASE_DIR / p
+
+    def backup_dir_path(self) -> Path:
+        p = Path(self.backup_dir)
+        return p if p.is_absolute() else BASE_DIR / p
+
+    def jobs_dir_path(self) -> Path:
+        p = Path(self.jobs_dir)
+        return p if p.is_absolute() else BASE_DIR / p
+
+    def log_dir_path(self) -> Path:
+        p = Path(self.log_dir)
+        return p if p.is_absolute() else BASE_DIR / p
+
+
+def token_history(cfg: AutoConfig) -> TokenHistory:
+    def _seed():
+        for record in read_bot_records(cfg.tokens_csv_path()):
+            yield {"username": record.username, "token": record.token, "account": record.account, "ts": record.ts}
+        for username, account, token in read_revoked_lines(cfg.revoked_tokens_txt_path()):
+            yield {"username": username, "token": token, "account": account, "event": EVENT_REVOKED}
+    return token_history_for(cfg.token_history_csv_path(), _seed)
+
+
+def job_journal(cfg: AutoConfig) -> JobJournal:
+    return job_journal_for(cfg.jobs_dir_path())
+
+
+def load_bot_records(cfg: AutoConfig) -> BotRecords:
+    try:
+        return bot_record_store_for(cfg.tokens_csv_path(), token_history(cfg)).records()
+    except Exception:
+        return BotRecords()
+
+
+def load_config() -> AutoConfig:
+    data = load_json(CONFIG_FILE, asdict(AutoConfig()))
+    if not isinstance(data, dict):
+        data = {}
+    known = AutoConfig.__dataclass_fields__
+    return AutoConfig(**{key: value for key, value in data.items() if key in known})
+
+
+def backup_sources(cfg: AutoConfig) -> List[Tuple[Path, str]]:
+    files = [
+        CONFIG_FILE,
+        ACCOUNTS_FILE,
+        HAMSTERS_FILE,
+        FROZEN_FILE,
+        ACCOUNTS_STATUS_FILE,
+        cfg.tokens_txt_path(),
+        cfg.tokens_csv_path(),
+        cfg.revoked_tokens_txt_path(),
+        cfg.token_history_csv_path(),
+    ]
+    if SESSIONS_DIR.exists():
+        files.extend(p for p in sorted(SESSIONS_DIR.rglob("*")) if p.is_file())
+    sources = []
+    for f in files:
+        try:
+            rel = f.relative_to(BASE_DIR).as_posix()
+        except ValueError:
+            rel = f.name
+        sources.append((f, rel))
+    return sources
@@ -0,0 +1,134 @@
+import csv
+import json
+import os
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, Iterator, Optional, Set
+
+from tokens import TOKEN_CSV_FIELDS, iter_bot_rows
+
+EXPORT_FORMATS = ("txt", "csv", "jsonl")
+PROGRESS_EVERY = 2000
+
+ProgressCallback = Callable[[int, int, str], None]
+
+
+def day_start(date_text: str) -> int:
+    return int(time.mktime(time.strptime(date_text, "%Y-%m-%d")))
+
+
+def day_end(date_text: str) -> int:
+    parsed = time.strptime(date_text, "%Y-%m-%d")
+    return int(time.mktime((parsed.tm_year, parsed.tm_mon, parsed.tm_mday + 1, 0, 0, 0, 0, 0, -1)))
+
+
+@dataclass
+class ExportFilter:
+    date_from: str = ""
+    date_to: str = ""
+    hamsters: Set[str] = field(default_factory=set)
+    accounts: Set[str] = field(default_factory=set)
+
+    def bounds(self):
+        low = day_start(self.date_from) if self.date_from else None
+        high = day_end(self.date_to) if self.date_to else None
+        return low, high
+
+    def compile(self) -> Callable[[str, str, int], bool]:
+        low, high = self.bounds()
+        hamsters = {name or "None" for name in self.hamsters}
+        accounts = set(self.accounts)
+
+        def _matches(hamster: str, account: str, ts: int) -> bool:
+            if low is not None and ts < low:
+                return False
+            if high is not None and (ts <= 0 or ts >= high):
+                return False
+            if hamsters and (hamster or "None") not in hamsters:
+                return False
+            if accounts and account not in accounts:
+                return False
+            return True
+
+        return _matches
+
+
+def _counted_lines(handle, counter: list) -> Iterator[str]:
+    for line in handle:
+        counter[0] += len(line)
+        yield line
+
+
+def _write_txt(handle, username, token, hamster, account, ts, version):
+    handle.write(f"{token}\n")
+
+
+def _csv_writer(handle):
+    writer = csv.writer(handle)
+    writer.writerow(TOKEN_CSV_FIELDS + ["version"])
+
+    def _write(_, username, token, hamster, account, ts, version):
+        writer.writerow([username, token, hamster, account, ts or "", version])
+
+    return _write
+
+
+def _write_jsonl(handle, username, token, hamster, account, ts, version):
+    handle.write(json.dumps(
+        {"username": username, "token": token, "hamster": hamster, "account": account, "ts": ts, "version": version},
+        ensure_ascii=False,
+    ))
+    handle.write("\n")
+
+
+def export_tokens(
+    source: Path,
+    target: Path,
+    fmt: str,
+    flt: Optional[ExportFilter] = None,
+    current: Optional[Dict[str, dict]] = None,
+    progress: Optional[ProgressCallback] = None,
+    should_stop: Optional[Callable[[], bool]] = None,
+) -> dict:
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(f"unknown export format: {fmt}")
+    source = Path(source)
+    target = Path(target)
+    matches = (flt or ExportFilter()).compile()
+    total = source.stat().st_size if source.exists() else 0
+    counter = [0]
+    scanned = 0
+    exported = 0
+    target.parent.mkdir(parents=True, exist_ok=True)
+    tmp = target.with_name(target.name + ".tmp")
+    try:
+        with open(tmp, "w", newline="", encoding="utf-8") as out:
+            if fmt == "txt":
+                write = _write_txt
+            elif fmt == "csv":
+                write = _csv_writer(out)
+            else:
+                write = _write_jsonl
+            if source.exists():
+                with open(source, "r", newline="", encoding="utf-8") as f:
+                    for username, token, hamster, account, ts, version in iter_bot_rows(_counted_lines(f, counter), current):
+                        scanned += 1
+                        if token and matches(hamster, account, ts):
+                            write(out, username, token, hamster, account, ts, version)
+                            exported += 1
+                        if scanned % PROGRESS_EVERY == 0:
+                            if should_stop and should_stop():
+                                raise InterruptedError("export cancelled")
+                            if progress:
+                                progress(counter[0], total, str(exported))
+        os.replace(tmp, target)
+    except BaseException:
+        try:
+            tmp.unlink()
+        except OSError:
+            pass
+        raise
+    if progress:
+        progress(total, total, str(exported))
+    return {"path": str(target), "format": fmt, "scanned": scanned, "exported": exported}
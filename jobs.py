@@ -0,0 +1,224 @@
+import json
+import os
+import threading
+import time
+import uuid
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from storage import write_text_atomic
+
+JOB_PENDING = "pending"
+JOB_DONE = "done"
+JOB_FAILED = "failed"
+# No account known for the bot yet; like failed targets, these are retried on resume
+# once the user adds the account
+JOB_SKIPPED = "skipped"
+JOB_STATES = (JOB_PENDING, JOB_DONE, JOB_FAILED, JOB_SKIPPED)
+JOB_FINAL_STATES = (JOB_DONE,)
+
+
+class ManagementJob:
+    def __init__(self, path: Path, job_id: str, mode: str, targets: List[Dict[str, str]], created: int):
+        self.path = Path(path)
+        self.job_id = job_id
+        self.mode = mode
+        self.targets = targets
+        self.created = created
+        self.states: Dict[str, str] = {target["username"]: JOB_PENDING for target in targets}
+        self.reasons: Dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    def _header(self) -> dict:
+        return {"job": self.job_id, "mode": self.mode, "created": self.created, "targets": self.targets}
+
+    def _append(self, entry: dict):
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(entry, ensure_ascii=False))
+            f.write("\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+    def _apply(self, entry: dict):
+        username = entry.get("username") or ""
+        state = entry.get("state")
+        if username not in self.states or state not in JOB_STATES:
+            return
+        self.states[username] = state
+        if entry.get("reason"):
+            self.reasons[username] = entry["reason"]
+        else:
+            self.reasons.pop(username, None)
+
+    @classmethod
+    def create(cls, jobs_dir: Path, mode: str, targets: List[Dict[str, str]]) -> "ManagementJob":
+        jobs_dir = Path(jobs_dir)
+        jobs_dir.mkdir(parents=True, exist_ok=True)
+        created = int(time.time())
+        job_id = f"{time.strftime('%Y%m%d_%H%M%S', time.localtime(created))}_{mode}_{uuid.uuid4().hex[:6]}"
+        unique = []
+        seen = set()
+        for target in targets:
+            username = (target.get("username") or "").strip()
+            if not username or username in seen:
+                continue
+            seen.add(username)
+            unique.append({"username": username, "account": (target.get("account") or "").strip()})
+        job = cls(jobs_dir / f"{job_id}.jsonl", job_id, mode, unique, created)
+        job._append(job._header())
+        return job
+
+    @classmethod
+    def load(cls, path: Path) -> Optional["ManagementJob"]:
+        path = Path(path)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                lines = f.read().splitlines()
+        except OSError:
+            return None
+        entries = []
+        for line in lines:
+            try:
+                entries.append(json.loads(line))
+            except ValueError:
+                continue
+        if not entries or "job" not in entries[0]:
+            return None
+        header = entries[0]
+        job = cls(path, header["job"], header.get("mode") or "", list(header.get("targets") or []), int(header.get("created") or 0))
+        for entry in entries[1:]:
+            job._apply(entry)
+        return job
+
+    def mark(self, username: str, state: str, reason: str = ""):
+        entry = {"username": username, "state": state, "reason": reason, "ts": int(time.time())}
+        with self._lock:
+            self._append(entry)
+            self._apply(entry)
+
+    def state(self, username: str) -> str:
+        return self.states.get(username, JOB_PENDING)
+
+    def remaining(self) -> List[Dict[str, str]]:
+        return [target for target in self.targets if self.states.get(target["username"]) not in JOB_FINAL_STATES]
+
+    def counts(self) -> Dict[str, int]:
+        counts = {state: 0 for state in JOB_STATES}
+        for state in self.states.values():
+            counts[state] += 1
+        return counts
+
+    def is_complete(self) -> bool:
+        return all(state in JOB_FINAL_STATES for state in self.states.values())
+
+    def compact(self):
+        # One line per finished target instead of one per attempt, so resumes do not grow the file
+        lines = [json.dumps(self._header(), ensure_ascii=False)]
+        with self._lock:
+            for username, state in self.states.items():
+                if state == JOB_PENDING:
+                    continue
+                entry = {"username": username, "state": state, "reason": self.reasons.get(username, "")}
+                lines.append(json.dumps(entry, ensure_ascii=False))
+            write_text_atomic(self.path, "\n".join(lines) + "\n")
+
+    def summary(self) -> str:
+        counts = self.counts()
+        created = time.strftime("%Y-%m-%d %H:%M", time.localtime(self.created))
+        return (
+            f"{created} | {self.mode} | {counts[JOB_DONE]}/{len(self.targets)}"
+            f" | {counts[JOB_FAILED]} err | {counts[JOB_SKIPPED]} skipped | {counts[JOB_PENDING]} pending"
+        )
+
+
+class JobJournal:
+    def __init__(self, jobs_dir: Path):
+        self.jobs_dir = Path(jobs_dir)
+        self._lock = threading.Lock()
+        # job_id -> mode of unfinished jobs; filled by one directory scan, then kept up to date
+        # by create/finish/remove so the UI never rescans the run history
+        self._unfinished: Optional[Dict[str, str]] = None
+
+    def _path(self, job_id: str) -> Path:
+        return self.jobs_dir / f"{job_id}.jsonl"
+
+    def _scan(self) -> Dict[str, str]:
+        if self._unfinished is None:
+            found = {}
+            if self.jobs_dir.exists():
+                for path in self.jobs_dir.glob("*.jsonl"):
+                    job = ManagementJob.load(path)
+                    if job is None:
+                        continue
+                    if job.is_complete():
+                        self._delete(path)
+                    else:
+                        found[job.job_id] = job.mode
+            self._unfinished = found
+        return self._unfinished
+
+    @staticmethod
+    def _delete(path: Path):
+        try:
+            path.unlink()
+        except OSError:
+            pass
+
+    def create(self, mode: str, targets: List[Dict[str, str]]) -> ManagementJob:
+        job = ManagementJob.create(self.jobs_dir, mode, targets)
+        with self._lock:
+            self._scan()[job.job_id] = job.mode
+        return job
+
+    def finish(self, job: ManagementJob) -> bool:
+        # Finished jobs are deleted; interrupted ones are compacted and stay resumable
+        with self._lock:
+            unfinished = self._scan()
+            if job.is_complete():
+                self._delete(job.path)
+                unfinished.pop(job.job_id, None)
+                return True
+            job.compact()
+            unfinished[job.job_id] = job.mode
+            return False
+
+    def get(self, job_id: str) -> Optional[ManagementJob]:
+        return ManagementJob.load(self._path(job_id))
+
+    def unfinished_count(self) -> int:
+        with self._lock:
+            return len(self._scan())
+
+    def unfinished(self, mode: Optional[str] = None) -> List[ManagementJob]:
+        with self._lock:
+            ids = [job_id for job_id, job_mode in self._scan().items() if mode is None or job_mode == mode]
+        found = []
+        for job_id in ids:
+            job = self.get(job_id)
+            if job is not None and not job.is_complete():
+                found.append(job)
+        found.sort(key=lambda job: (job.created, job.job_id), reverse=True)
+        return found
+
+    def remove(self, job_id: str):
+        with self._lock:
+            self._delete(self._path(job_id))
+            self._scan().pop(job_id, None)
+
+    def reset(self):
+        with self._lock:
+            self._unfinished = None
+
+
+_JOURNALS: Dict[Path, JobJournal] = {}
+_JOURNALS_LOCK = threading.Lock()
+
+
+def job_journal_for(jobs_dir: Path) -> JobJournal:
+    key = Path(jobs_dir).resolve()
+    with _JOURNALS_LOCK:
+        journal = _JOURNALS.get(key)
+        if journal is None:
+            journal = JobJournal(key)
+            _JOURNALS[key] = journal
+        return journal
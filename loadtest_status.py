@@ -0,0 +1,170 @@
+import argparse
+import asyncio
+import json
+import time
+from collections import Counter
+from typing import List, Optional, Tuple
+from urllib.parse import urlsplit
+
+
+def _percentile(values: List[float], fraction: float) -> float:
+    if not values:
+        return 0.0
+    index = min(len(values) - 1, max(0, int(round(fraction * (len(values) - 1)))))
+    return values[index]
+
+
+class HttpConnection:
+    def __init__(self, host: str, port: int):
+        self.host = host
+        self.port = port
+        self.reader: Optional[asyncio.StreamReader] = None
+        self.writer: Optional[asyncio.StreamWriter] = None
+
+    async def _open(self) -> None:
+        self.reader, self.writer = await asyncio.open_connection(self.host, self.port)
+
+    async def close(self) -> None:
+        if self.writer is not None:
+            self.writer.close()
+            try:
+                await self.writer.wait_closed()
+            except ConnectionError:
+                pass
+        self.reader = None
+        self.writer = None
+
+    async def post(self, path: str, payload: dict, headers: Optional[dict] = None) -> Tuple[int, dict, bytes]:
+        if self.writer is None:
+            await self._open()
+        body = json.dumps(payload).encode("utf-8")
+        lines = [
+            f"POST {path} HTTP/1.1",
+            f"Host: {self.host}:{self.port}",
+            "Content-Type: application/json",
+            f"Content-Length: {len(body)}",
+        ]
+        for name, value in (headers or {}).items():
+            lines.append(f"{name}: {value}")
+        self.writer.write(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1") + body)
+        await self.writer.drain()
+
+        status_line = await self.reader.readline()
+        if not status_line:
+            await self.close()
+            raise ConnectionError("connection closed by server")
+        version, status = status_line.decode("latin-1").split()[:2]
+        response_headers = {}
+        while True:
+            line = await self.reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            response_headers[name.strip().lower()] = value.strip()
+        length = int(response_headers.get("content-length", "0"))
+        data = await self.reader.readexactly(length) if length else b""
+        if version == "HTTP/1.0" or response_headers.get("connection", "").lower() == "close":
+            await self.close()
+        return int(status), response_headers, data
+
+
+async def _worker(
+    host: str,
+    port: int,
+    payload: dict,
+    etag: Optional[str],
+    deadline: float,
+    remaining: List[int],
+    latencies: List[float],
+    statuses: Counter,
+) -> None:
+    conn = HttpConnection(host, port)
+    headers = {"If-None-Match": etag} if etag else None
+    try:
+        while time.perf_counter() < deadline:
+            if remaining[0] <= 0:
+                break
+            remaining[0] -= 1
+            started = time.perf_counter()
+            try:
+                status, _, _ = await conn.post("/client/status", payload, headers)
+            except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+                statuses["error"] += 1
+                await conn.close()
+                continue
+            latencies.append(time.perf_counter() - started)
+            statuses[status] += 1
+    finally:
+        await conn.close()
+
+
+async def run_loadtest(args: argparse.Namespace) -> dict:
+    parts = urlsplit(args.url)
+    host = parts.hostname or "127.0.0.1"
+    port = parts.port or 80
+    payload = {"code": args.code, "fingerprint": args.fingerprint}
+
+    etag = None
+    setup = HttpConnection(host, port)
+    try:
+        if args.redeem:
+            await setup.post("/client/redeem", payload)
+        status, headers, _ = await setup.post("/client/status", payload)
+        if args.conditional:
+            etag = headers.get("etag")
+    finally:
+        await setup.close()
+
+    latencies: List[float] = []
+    statuses: Counter = Counter()
+    remaining = [args.requests if args.requests > 0 else float("inf")]
+    started = time.perf_counter()
+    deadline = started + args.duration if args.duration > 0 else float("inf")
+    await asyncio.gather(
+        *(
+            _worker(host, port, payload, etag, deadline, remaining, latencies, statuses)
+            for _ in range(args.concurrency)
+        )
+    )
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        "url": args.url,
+        "concurrency": args.concurrency,
+        "first_status": status,
+        "conditional": bool(etag),
+        "requests": len(latencies),
+        "elapsed_s": round(elapsed, 3),
+        "rps": round(len(latencies) / elapsed, 1) if elapsed else 0.0,
+        "p50_ms": round(_percentile(latencies, 0.50) * 1000, 2),
+        "p99_ms": round(_percentile(latencies, 0.99) * 1000, 2),
+        "max_ms": round(latencies[-1] * 1000, 2) if latencies else 0.0,
+        "statuses": {str(key): value for key, value in sorted(statuses.items(), key=str)},
+    }
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Load test for adminpanel /client/status")
+    parser.add_argument("--url", default="http://127.0.0.1:8000")
+    parser.add_argument("--code", required=True)
+    parser.add_argument("--fingerprint", default="loadtest-machine")
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--duration", type=float, default=0.0, help="Seconds; overrides --requests when set")
+    parser.add_argument("--no-redeem", dest="redeem", action="store_false")
+    parser.add_argument("--conditional", action="store_true", help="Send If-None-Match with the first ETag")
+    return parser
+
+
+def main() -> int:
+    args = _build_parser().parse_args()
+    if args.duration > 0:
+        args.requests = 0
+    result = asyncio.run(run_loadtest(args))
+    print(json.dumps(result, ensure_ascii=False, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
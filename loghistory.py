@@ -0,0 +1,222 @@
+import logging
+import logging.handlers
+import mmap
+import os
+import re
+import time
+from array import array
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+
+RUN_LOG_NAME = "run.log"
+RUN_LOG_MAX_BYTES = 2_000_000
+RUN_LOG_BACKUPS = 60
+BLOCK_BYTES = 64 * 1024
+TS_FORMAT = "%Y-%m-%d %H:%M:%S"
+# "[2026-10-19 02:42:04] [OK] message"
+TS_END = 21
+TAG_START = 23
+# A literal leading newline lets the regex engine skip ahead quickly
+TAG_RE = re.compile(rb"\n\[.{19}\] \[([A-Z]{1,15})\]")
+
+_TAG_BITS: Dict[bytes, int] = {}
+
+
+def tag_bit(tag: bytes) -> int:
+    bit = _TAG_BITS.get(tag)
+    if bit is None:
+        bit = 1 << min(len(_TAG_BITS), 62)
+        _TAG_BITS[tag] = bit
+    return bit
+
+
+def line_tag(line: bytes) -> bytes:
+    if line[TAG_START - 1:TAG_START] != b"[":
+        return b""
+    end = line.find(b"]", TAG_START, TAG_START + 16)
+    return line[TAG_START:end] if end > 0 else b""
+
+
+def line_key(line: bytes) -> int:
+    # YYYYMMDDHHMMSS as an int keeps the order of the text stamps
+    stamp = line[1:TS_END - 1]
+    digits = stamp[0:4] + stamp[5:7] + stamp[8:10] + stamp[11:13] + stamp[14:16] + stamp[17:19]
+    return int(digits) if len(digits) == 14 and digits.isdigit() else 0
+
+
+def date_key(date_text: str, end: bool = False) -> int:
+    parsed = time.strptime(date_text, "%Y-%m-%d")
+    return int(time.strftime("%Y%m%d", parsed)) * 1_000_000 + (235959 if end else 0)
+
+
+def open_run_logger(log_dir: Path) -> logging.Logger:
+    logger = logging.getLogger("botfactory.runs")
+    logger.propagate = False
+    logger.setLevel(logging.INFO)
+    if not logger.handlers:
+        log_dir.mkdir(parents=True, exist_ok=True)
+        handler = logging.handlers.RotatingFileHandler(
+            log_dir / RUN_LOG_NAME, maxBytes=RUN_LOG_MAX_BYTES, backupCount=RUN_LOG_BACKUPS, encoding="utf-8"
+        )
+        handler.setFormatter(logging.Formatter("[%(asctime)s] %(message)s", TS_FORMAT))
+        logger.addHandler(handler)
+    return logger
+
+
+class LogFileIndex:
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._reset()
+
+    def _reset(self):
+        self.offsets = array("q")
+        self.first_keys = array("q")
+        self.tag_masks = array("q")
+        self.lines = 0
+        self.indexed_size = 0
+        self._last_block_lines = 0
+
+    def update(self, mm: mmap.mmap, size: int):
+        if size < self.indexed_size:
+            self._reset()
+        if self.offsets:
+            # The last block may still be filling up, so index it again
+            self.indexed_size = self.offsets.pop()
+            self.first_keys.pop()
+            self.tag_masks.pop()
+            self.lines -= self._last_block_lines
+        pos = self.indexed_size
+        end = mm.rfind(b"\n", pos, size) + 1
+        while pos < end:
+            stop = mm.rfind(b"\n", pos, min(pos + BLOCK_BYTES, end)) + 1
+            if stop <= pos:
+                stop = mm.find(b"\n", pos, end) + 1
+            chunk = mm[pos:stop]
+            mask = 0
+            for tag in set(TAG_RE.findall(b"\n" + chunk)):
+                mask |= tag_bit(tag)
+            self.offsets.append(pos)
+            self.first_keys.append(line_key(chunk[:TS_END]))
+            self.tag_masks.append(mask)
+            self._last_block_lines = chunk.count(b"\n")
+            self.lines += self._last_block_lines
+            pos = stop
+        self.indexed_size = pos
+
+    def block_range(self, block: int) -> Tuple[int, int]:
+        start = self.offsets[block]
+        end = self.offsets[block + 1] if block + 1 < len(self.offsets) else self.indexed_size
+        return start, end
+
+
+@dataclass
+class LogQuery:
+    date_from: str = ""
+    date_to: str = ""
+    tags: Set[str] = field(default_factory=set)
+    text: str = ""
+
+    def compile(self):
+        low = date_key(self.date_from) if self.date_from else 0
+        high = date_key(self.date_to, end=True) if self.date_to else 0
+        mask = 0
+        for tag in self.tags:
+            mask |= tag_bit(tag.strip("[]").encode("utf-8"))
+        needle = self.text.strip().lstrip("@").lower().encode("utf-8")
+        return low, high, mask, needle
+
+
+class LogHistory:
+    def __init__(self, log_dir: Path, name: str = RUN_LOG_NAME):
+        self.log_dir = Path(log_dir)
+        self.name = name
+        self._indexes: Dict[Tuple[int, int], LogFileIndex] = {}
+
+    def files(self) -> List[Path]:
+        if not self.log_dir.exists():
+            return []
+        rotated = []
+        for path in self.log_dir.glob(f"{self.name}.*"):
+            suffix = path.name[len(self.name) + 1:]
+            if suffix.isdigit():
+                rotated.append((int(suffix), path))
+        ordered = [path for _, path in sorted(rotated, reverse=True)]
+        current = self.log_dir / self.name
+        if current.exists():
+            ordered.append(current)
+        return ordered
+
+    def _index(self, path: Path, mm: mmap.mmap, st: os.stat_result) -> LogFileIndex:
+        # Rotation renames files, so the inode (not the name) identifies an index
+        key = (st.st_dev, st.st_ino) if st.st_ino else (0, hash(str(path)))
+        index = self._indexes.get(key)
+        if index is None:
+            index = LogFileIndex(path)
+            self._indexes[key] = index
+        if index.indexed_size != st.st_size:
+            index.update(mm, st.st_size)
+        return index
+
+    def stats(self) -> Dict[str, int]:
+        files = self.files()
+        return {
+            "files": len(files),
+            "bytes": sum(path.stat().st_size for path in files if path.exists()),
+            "lines": sum(index.lines for index in self._indexes.values()),
+        }
+
+    def search(self, query: Optional[LogQuery] = None, limit: int = 2000) -> Tuple[List[str], int]:
+        low, high, mask, needle = (query or LogQuery()).compile()
+        found: List[str] = []
+        scanned = 0
+        for path in reversed(self.files()):
+            if len(found) >= limit:
+                break
+            try:
+                handle = open(path, "rb")
+            except OSError:
+                continue
+            # Maps are opened per search and closed at once so Windows can still rotate the file
+            with handle:
+                st = os.fstat(handle.fileno())
+                if st.st_size == 0:
+                    continue
+                with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    index = self._index(path, mm, st)
+                    scanned += self._search_file(index, mm, low, high, mask, needle, found, limit)
+        return found, scanned
+
+    def _search_file(self, index: LogFileIndex, mm: mmap.mmap, low: int, high: int, mask: int, needle: bytes,
+                     found: List[str], limit: int) -> int:
+        scanned = 0
+        blocks = len(index.offsets)
+        for block in range(blocks - 1, -1, -1):
+            if high and index.first_keys[block] > high:
+                continue
+            if low and block + 1 < blocks and index.first_keys[block + 1] < low:
+                break
+            if mask and not index.tag_masks[block] & mask:
+                continue
+            start, end = index.block_range(block)
+            chunk = mm[start:end]
+            if needle and needle not in chunk.lower():
+                continue
+            scanned += 1
+            for line in reversed(chunk.split(b"\n")):
+                if not line:
+                    continue
+                if low or high:
+                    key = line_key(line)
+                    if (low and key < low) or (high and key > high):
+                        continue
+                if mask:
+                    tag = line_tag(line)
+                    if not tag or not tag_bit(tag) & mask:
+                        continue
+                if needle and needle not in line.lower():
+                    continue
+                found.append(line.decode("utf-8", errors="replace"))
+                if len(found) >= limit:
+                    return scanned
+        return scanned
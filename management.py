@@ -0,0 +1,380 @@
+import asyncio
+import getpass
+import sys
+import time
+from typing import Dict, List, Optional, Tuple
+
+from telethon import TelegramClient
+from telethon.errors import (
+    FloodWaitError,
+    PasswordHashInvalidError,
+    SendCodeUnavailableError,
+    SessionPasswordNeededError,
+)
+from telethon.tl.functions.messages import SendMessageRequest
+
+from core import (
+    SESSIONS_DIR,
+    AutoConfig,
+    account_registry,
+    ensure_file,
+    extract_token,
+    job_journal,
+    load_bot_records,
+    token_history,
+)
+from jobs import JOB_DONE, JOB_FAILED, JOB_PENDING, JOB_SKIPPED, ManagementJob
+from tokens import EVENT_REVOKED, read_bot_records, write_bot_records
+
+
+async def request_login_code(
+    client: TelegramClient,
+    phone: str,
+    log,
+) -> bool:
+    try:
+        await client.send_code_request(phone)
+        return True
+    except SendCodeUnavailableError:
+        if getattr(client, "_phone_code_hash", None):
+            log.emit("[WARN] Код уже был отправлен ранее. Используйте последний код или подождите перед повторной отправкой.")
+            return False
+        log.emit("[ERROR] Нельзя повторно запросить код сейчас. Подождите и попробуйте позже.")
+        raise
+    except FloodWaitError as e:
+        log.emit(f"[RATE] FloodWait {e.seconds}s. Ждём.")
+        await asyncio.sleep(e.seconds)
+        await client.send_code_request(phone)
+        return True
+
+
+class LogSink:
+    def __init__(self, stream=None):
+        self.stream = stream or sys.stdout
+
+    def emit(self, text: str):
+        print(text, file=self.stream, flush=True)
+
+
+class ConsolePromptBridge:
+    async def get_code(self, phone: str) -> str:
+        loop = asyncio.get_running_loop()
+        code = await loop.run_in_executor(None, input, f"Код для {phone}: ")
+        return code.strip()
+
+    async def get_password(self, phone: str) -> str:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, getpass.getpass, f"Пароль 2FA для {phone}: ")
+
+
+class BotFatherOps:
+    async def _ensure_auth(self, client: TelegramClient, acc: Dict):
+        if await client.is_user_authorized():
+            return
+        await request_login_code(client, acc["phone"], self.log)
+        code = await self.bridge.get_code(acc["phone"])
+        try:
+            await client.sign_in(acc["phone"], code)
+        except SessionPasswordNeededError:
+            pass
+        if await client.is_user_authorized():
+            return
+        pwd = acc.get("password") or await self.bridge.get_password(acc["phone"])
+        if not pwd:
+            self.log.emit("[ERROR] 2FA пароль не введён.")
+            return
+        try:
+            await client.sign_in(password=pwd)
+        except PasswordHashInvalidError:
+            retry = await self.bridge.get_password(acc["phone"])
+            if retry:
+                await client.sign_in(password=retry)
+
+    async def _wait_for_new_message(self, client: TelegramClient, peer: str, last_id: int, timeout: float = 20.0) -> Optional[str]:
+        started = time.time()
+        while time.time() - started < timeout:
+            msgs = await client.get_messages(peer, limit=6)
+            new_msgs = [m for m in reversed(msgs) if getattr(m, "id", 0) > last_id]
+            if new_msgs:
+                texts = []
+                for m in new_msgs:
+                    txt = (getattr(m, "raw_text", "") or getattr(m, "message", "") or "")
+                    if txt:
+                        texts.append(txt)
+                return "\n".join(texts) if texts else ""
+            await asyncio.sleep(0.6)
+        return None
+
+    async def _wait_for_message_contains(
+        self,
+        client: TelegramClient,
+        peer: str,
+        last_id: int,
+        phrases: List[str],
+        timeout: float = 35.0
+    ) -> Optional[str]:
+        started = time.time()
+        expect = [p.lower() for p in phrases]
+        current_last = last_id
+        while time.time() - started < timeout:
+            msgs = await client.get_messages(peer, limit=10)
+            found = False
+            for m in reversed(msgs):
+                mid = getattr(m, "id", 0)
+                if mid <= current_last:
+                    continue
+                txt = (getattr(m, "raw_text", "") or getattr(m, "message", "") or "")
+                if not txt:
+                    continue
+                current_last = max(current_last, mid)
+                lowered = txt.lower()
+                if any(p in lowered for p in expect):
+                    return txt
+                found = True
+            if found:
+                await asyncio.sleep(0.6)
+            else:
+                await asyncio.sleep(0.6)
+        return None
+
+    def _remove_token_rows(self, username: str) -> bool:
+        path = self.cfg.tokens_csv_path()
+        if not path.exists():
+            return False
+        try:
+            token_history(self.cfg).forget(username)
+            records = read_bot_records(path)
+            write_bot_records(path, (record for record in records if record.username != username))
+            return True
+        except Exception:
+            return False
+
+    def _write_revoked_token(self, username: str, token: str, account: str):
+        try:
+            version = token_history(self.cfg).record(username, token, account, EVENT_REVOKED)
+            self.log.emit(f"[TOKEN] @{username}: актуальный токен v{version}")
+        except Exception as e:
+            self.log.emit(f"[WARN] История токенов: {e}")
+        ensure_file(self.cfg.revoked_tokens_txt_path())
+        with open(self.cfg.revoked_tokens_txt_path(), "a", encoding="utf-8") as f:
+            f.write(f"{username},{account},{token}\n")
+
+    async def _delete_bot(self, client: TelegramClient, username: str) -> bool:
+        peer = self.chat
+        last = await client.get_messages(peer, limit=1)
+        last_id = last[0].id if last else 0
+        await client(SendMessageRequest(peer, "/start"))
+        await asyncio.sleep(0.5)
+        await self._wait_for_new_message(client, peer, last_id, timeout=12.0)
+
+        last = await client.get_messages(peer, limit=1)
+        last_id = last[0].id if last else 0
+        await client(SendMessageRequest(peer, "/deletebot"))
+        choose = await self._wait_for_message_contains(
+            client,
+            peer,
+            last_id,
+            ["Choose a bot to delete"],
+            timeout=20.0
+        )
+        if not choose:
+            self.log.emit("[WARN] Нет запроса выбора бота для удаления.")
+            return False
+
+        last = await client.get_messages(peer, limit=1)
+        last_id = last[0].id if last else 0
+        await client(SendMessageRequest(peer, f"@{username}"))
+        await self._wait_for_new_message(client, peer, last_id, timeout=12.0)
+
+        last = await client.get_messages(peer, limit=1)
+        last_id = last[0].id if last else 0
+        await client(SendMessageRequest(peer, "Yes, I am totally sure."))
+        done = await self._wait_for_message_contains(
+            client,
+            peer,
+            last_id,
+            ["Done! The bot is gone", "/help"],
+            timeout=20.0
+        )
+        return bool(done)
+
+    async def _revoke_token(self, client: TelegramClient, username: str, account: str) -> Optional[str]:
+        peer = self.chat
+        last = await client.get_messages(peer, limit=1)
+        last_id = last[0].id if last else 0
+        await client(SendMessageRequest(peer, "/start"))
+        await asyncio.sleep(0.5)
+        await self._wait_for_new_message(client, peer, last_id, timeout=12.0)
+
+        last = await client.get_messages(peer, limit=1)
+        last_id = last[0].id if last else 0
+        await client(SendMessageRequest(peer, "/revoke"))
+        choose = await self._wait_for_message_contains(
+            client,
+            peer,
+            last_id,
+            ["Choose a bot to generate a new token", "Warning: your old token will stop working"],
+            timeout=20.0
+        )
+        if not choose:
+            self.log.emit("[WARN] Нет запроса выбора бота для revoke.")
+            return None
+
+        last = await client.get_messages(peer, limit=1)
+        last_id = last[0].id if last else 0
+        await client(SendMessageRequest(peer, f"@{username}"))
+        done = await self._wait_for_message_contains(
+            client,
+            peer,
+            last_id,
+            ["Your token was replaced with a new one", "new token"],
+            timeout=20.0
+        )
+        if not done:
+            self.log.emit("[WARN] Нет подтверждения revoke токена.")
+            return None
+        token = extract_token(done) or ""
+        if token:
+            self._write_revoked_token(username, token, account)
+        return token or None
+
+    def _open_job(self, mode: str, targets: List[Dict[str, str]]) -> Optional[ManagementJob]:
+        job = getattr(self, "job", None)
+        if job is not None:
+            self.log.emit(f"[JOB] Продолжение задачи {job.job_id}: осталось {len(targets)} из {len(job.targets)}.")
+            return job
+        try:
+            self.job = job_journal(self.cfg).create(mode, targets)
+        except Exception as e:
+            self.job = None
+            self.log.emit(f"[WARN] Журнал задачи: {e}")
+        return self.job
+
+    def _mark_job(self, job: Optional[ManagementJob], username: str, state: str, reason: str = ""):
+        if job is None or not username:
+            return
+        try:
+            job.mark(username, state, reason)
+        except Exception as e:
+            self.log.emit(f"[WARN] Журнал задачи: {e}")
+
+    def _close_job(self, job: Optional[ManagementJob]):
+        if job is None:
+            return
+        counts = job.counts()
+        self.log.emit(
+            f"[JOB] Задача {job.job_id}: выполнено {counts[JOB_DONE]}, "
+            f"ошибок {counts[JOB_FAILED]}, пропущено {counts[JOB_SKIPPED]}, осталось {counts[JOB_PENDING]}."
+        )
+        try:
+            job_journal(self.cfg).finish(job)
+        except Exception as e:
+            self.log.emit(f"[WARN] Журнал задачи: {e}")
+
+    async def _run_targets(self, mode: str, targets: List[Dict[str, str]], action):
+        accs = account_registry.snapshot()
+        if not accs:
+            self.log.emit("[ERROR] accounts_tg.txt не найден или пуст.")
+            return False
+        if not targets:
+            if mode == "delete":
+                self.log.emit("[ERROR] Нет выбранных ботов для удаления.")
+            else:
+                self.log.emit("[ERROR] Нет выбранного бота для revoke.")
+            return False
+        job = self._open_job(mode, targets)
+        known_accounts: Optional[Dict[str, str]] = None
+        try:
+            for target in targets:
+                username = (target.get("username") or "").strip()
+                phone = (target.get("account") or "").strip()
+                if username and not phone:
+                    # A resumed job may target bots whose account was added since it was created
+                    if known_accounts is None:
+                        known_accounts = load_bot_records(self.cfg).account_by_username()
+                    phone = known_accounts.get(username, "")
+                if not username or not phone:
+                    self.log.emit("[WARN] Пропуск: нет username или аккаунта.")
+                    self._mark_job(job, username, JOB_SKIPPED, "no account")
+                    continue
+                acc = accs.get(phone)
+                if not acc:
+                    self.log.emit(f"[WARN] Аккаунт {phone} не найден в accounts_tg.txt.")
+                    self._mark_job(job, username, JOB_SKIPPED, f"account {phone} not found")
+                    continue
+                self.current_phone = acc["phone"]
+                if mode == "delete":
+                    self.progress.emit(f"Удаление: @{username} | Акк: {acc['phone']}")
+                session_path = SESSIONS_DIR / acc["phone"]
+                client = TelegramClient(str(session_path), acc["api_id"], acc["api_hash"])
+                try:
+                    await client.connect()
+                    await self._ensure_auth(client, acc)
+                    ok = await action(client, username, acc)
+                    self._mark_job(job, username, JOB_DONE if ok else JOB_FAILED, "" if ok else "not confirmed by BotFather")
+                except Exception as e:
+                    self.log.emit(f"[ERROR] {e}")
+                    self._mark_job(job, username, JOB_FAILED, str(e))
+                finally:
+                    try:
+                        await client.disconnect()
+                    except Exception:
+                        pass
+        finally:
+            self._close_job(job)
+        return True
+
+    async def _delete_target(self, client: TelegramClient, username: str, acc: Dict) -> bool:
+        ok = await self._delete_bot(client, username)
+        if ok:
+            self._remove_token_rows(username)
+            self.log.emit(f"[OK] Удалён @{username}")
+        else:
+            self.log.emit(f"[ERROR] Не удалось удалить @{username}")
+        return ok
+
+    async def _revoke_target(self, client: TelegramClient, username: str, acc: Dict) -> bool:
+        token = await self._revoke_token(client, username, acc["phone"])
+        if token:
+            self.revoked_results.append((username, token))
+            self.log.emit(f"[OK] Revoke токен для @{username} сохранён.")
+        else:
+            self.log.emit(f"[ERROR] Не удалось выполнить revoke для @{username}")
+        return bool(token)
+
+    async def _run_delete(self):
+        if await self._run_targets("delete", self.delete_targets, self._delete_target):
+            self.log.emit("[OK] Удаление завершено.")
+
+    async def _run_revoke(self):
+        if await self._run_targets("revoke", self.revoke_targets, self._revoke_target):
+            self.log.emit("[OK] Revoke завершён.")
+
+
+class ManagementRunner(BotFatherOps):
+    def __init__(
+        self,
+        cfg: AutoConfig,
+        mode: str,
+        targets: List[Dict[str, str]],
+        log=None,
+        bridge=None,
+        job: Optional[ManagementJob] = None,
+    ):
+        self.cfg = cfg
+        self.mode = mode
+        self.chat = cfg.botfather
+        self.delete_targets = targets if mode == "delete" else []
+        self.revoke_targets = targets if mode == "revoke" else []
+        self.log = log or LogSink()
+        self.progress = self.log
+        self.bridge = bridge or ConsolePromptBridge()
+        self.current_phone = ""
+        self.revoked_results: List[Tuple[str, str]] = []
+        self.job = job
+
+    async def run(self):
+        if self.mode == "delete":
+            await self._run_delete()
+        else:
+            await self._run_revoke()
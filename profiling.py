@@ -0,0 +1,124 @@
+import cProfile
+import functools
+import os
+import pstats
+import re
+import threading
+import time
+from pathlib import Path
+from typing import Callable, List, Optional
+
+PROFILE_TOP = 12
+
+ResultCallback = Callable[[str, str, float, List[str]], None]
+
+
+def _safe_name(name: str) -> str:
+    return re.sub(r"[^A-Za-z0-9_.-]+", "_", name).strip("_") or "action"
+
+
+def top_functions(profile: cProfile.Profile, limit: int = PROFILE_TOP) -> List[str]:
+    stats = pstats.Stats(profile)
+    stats.sort_stats(pstats.SortKey.CUMULATIVE)
+    lines = []
+    for func in stats.fcn_list[:limit]:
+        filename, line, name = func
+        calls, _, own, cumulative, _ = stats.stats[func]
+        where = f"{os.path.basename(filename)}:{line}" if line else filename
+        lines.append(f"{cumulative * 1000:9.1f} ms {own * 1000:8.1f} ms x{calls:<6} {where}({name})")
+    return lines
+
+
+class ActionProfiler:
+    def __init__(self, out_dir: Path, top: int = PROFILE_TOP):
+        self.out_dir = Path(out_dir)
+        self.top = top
+        self.on_result: Optional[ResultCallback] = None
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._actions_left = 0
+        self._worker_armed = False
+
+    def arm(self, actions: int, worker: bool = True):
+        with self._lock:
+            self._actions_left = max(0, int(actions))
+            self._worker_armed = bool(worker)
+
+    def disarm(self):
+        self.arm(0, False)
+
+    def armed(self) -> bool:
+        with self._lock:
+            return self._actions_left > 0 or self._worker_armed
+
+    def actions_left(self) -> int:
+        with self._lock:
+            return self._actions_left
+
+    def _take_action(self) -> bool:
+        with self._lock:
+            if self._actions_left <= 0:
+                return False
+            self._actions_left -= 1
+            return True
+
+    def _take_worker(self) -> bool:
+        with self._lock:
+            if not self._worker_armed:
+                return False
+            self._worker_armed = False
+            return True
+
+    def _finish(self, name: str, profile: cProfile.Profile, elapsed: float):
+        path = self.out_dir / f"{time.strftime('%Y%m%d_%H%M%S')}_{_safe_name(name)}.prof"
+        try:
+            self.out_dir.mkdir(parents=True, exist_ok=True)
+            profile.dump_stats(str(path))
+        except OSError:
+            path = None
+        if self.on_result is not None:
+            self.on_result(name, str(path or ""), elapsed * 1000, top_functions(profile, self.top))
+
+    def call(self, name: str, fn: Callable, *args, **kwargs):
+        # Nested handlers (e.g. _nav -> refresh_table) belong to the outer profile
+        if getattr(self._local, "active", False) or not self._take_action():
+            return fn(*args, **kwargs)
+        profile = cProfile.Profile()
+        self._local.active = True
+        started = time.perf_counter()
+        try:
+            return profile.runcall(fn, *args, **kwargs)
+        finally:
+            elapsed = time.perf_counter() - started
+            self._local.active = False
+            self._finish(name, profile, elapsed)
+
+    def wrap_coroutine(self, name: str, coro):
+        if not self._take_worker():
+            return coro
+        return self._profile_coroutine(name, coro)
+
+    async def _profile_coroutine(self, name: str, coro):
+        # The profile stays enabled on the loop thread across awaits, so time
+        # spent waiting on Telegram shows up under the selector calls.
+        profile = cProfile.Profile()
+        self._local.active = True
+        started = time.perf_counter()
+        profile.enable()
+        try:
+            return await coro
+        finally:
+            profile.disable()
+            elapsed = time.perf_counter() - started
+            self._local.active = False
+            self._finish(name, profile, elapsed)
+
+    def profiled(self, fn: Callable) -> Callable:
+        # Qt hands signal arguments (clicked(bool) etc.) to slots that may not take them
+        positional = fn.__code__.co_argcount - 1
+
+        @functools.wraps(fn)
+        def wrapper(owner, *args):
+            return self.call(f"{type(owner).__name__}.{fn.__name__}", fn, owner, *args[:positional])
+
+        return wrapper
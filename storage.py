@@ -0,0 +1,138 @@
+import atexit
+import json
+import logging
+import os
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Optional
+
+DEFAULT_DEBOUNCE_SECONDS = 0.5
+RETRY_SECONDS = 5.0
+
+_logger = logging.getLogger("botfactory.state")
+
+
+def write_text_atomic(path: Path, text: str):
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        with tmp.open("w", encoding="utf-8") as handle:
+            handle.write(text)
+            handle.flush()
+            os.fsync(handle.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            tmp.unlink()
+        except OSError:
+            pass
+        raise
+
+
+def dump_json(data) -> str:
+    return json.dumps(data, ensure_ascii=False, indent=2)
+
+
+def write_json_atomic(path: Path, data):
+    write_text_atomic(path, dump_json(data))
+
+
+class JsonStateWriter:
+    def __init__(self, delay: float = DEFAULT_DEBOUNCE_SECONDS):
+        self.delay = delay
+        self._lock = threading.Lock()
+        self._io_lock = threading.Lock()
+        self._pending: Dict[Path, str] = {}
+        self._timer: Optional[threading.Timer] = None
+        self.requests = 0
+        self.writes = 0
+        self.failures = 0
+
+    def save(self, path: Path, data):
+        text = dump_json(data)
+        with self._lock:
+            self._pending[Path(path)] = text
+            self.requests += 1
+            if self.delay <= 0:
+                immediate = True
+            else:
+                immediate = False
+                self._schedule(self.delay)
+        if immediate:
+            self.flush(path)
+
+    def _schedule(self, delay: float):
+        # Caller holds self._lock
+        if self._timer is None:
+            self._timer = threading.Timer(delay, self._flush_in_background)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def _flush_in_background(self):
+        try:
+            self.flush()
+        except Exception:
+            # Nobody waits on the timer thread; flush() logged the error and queued a retry
+            pass
+
+    def flush(self, path: Optional[Path] = None):
+        with self._io_lock:
+            with self._lock:
+                if path is None:
+                    batch = self._pending
+                    self._pending = {}
+                    if self._timer is not None:
+                        self._timer.cancel()
+                        self._timer = None
+                else:
+                    key = Path(path)
+                    batch = {key: self._pending.pop(key)} if key in self._pending else {}
+            error: Optional[BaseException] = None
+            failed: Dict[Path, str] = {}
+            for target, text in batch.items():
+                try:
+                    write_text_atomic(target, text)
+                except Exception as e:
+                    failed[target] = text
+                    error = error or e
+                    continue
+                self.writes += 1
+            if error is not None:
+                with self._lock:
+                    self.failures += len(failed)
+                    for target, text in failed.items():
+                        # A save queued while we were writing is newer and wins
+                        self._pending.setdefault(target, text)
+                    if self.delay > 0:
+                        self._schedule(RETRY_SECONDS)
+                _logger.error("State save failed for %d file(s), kept for retry: %s", len(failed), error)
+                raise error
+
+    def discard(self) -> int:
+        with self._lock:
+            dropped = len(self._pending)
+            self._pending = {}
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+        return dropped
+
+    @contextmanager
+    def suspended(self):
+        # Holds off every flush and drops queued saves, so nothing overwrites files replaced meanwhile
+        with self._io_lock:
+            self.discard()
+            try:
+                yield
+            finally:
+                self.discard()
+
+    def has_pending(self) -> bool:
+        with self._lock:
+            return bool(self._pending)
+
+
+state_writer = JsonStateWriter()
+atexit.register(state_writer.flush)
@@ -0,0 +1,86 @@
+import zipfile
+
+import pytest
+
+from backups import RESTORE_JOURNAL, RESTORE_ROLLBACK, RESTORE_STAGING, BackupStore, recover_interrupted_restore, restore_zip
+
+
+def _files(tmp_path):
+    data = tmp_path / "data"
+    (data / "sessions").mkdir(parents=True)
+    (data / "tokens.csv").write_text("username,token\na_bot,1:AAA\n", encoding="utf-8")
+    (data / "sessions" / "one.session").write_bytes(b"session-one")
+    return data
+
+
+def _leftovers(target):
+    return [name for name in (RESTORE_STAGING, RESTORE_ROLLBACK, RESTORE_JOURNAL) if (target / name).exists()]
+
+
+def test_snapshot_restore_roundtrip(tmp_path):
+    data = _files(tmp_path)
+    store = BackupStore(tmp_path / "backups")
+    first = store.snapshot([(data / "tokens.csv", "tokens.csv"), (data / "sessions" / "one.session", "sessions/one.session")])
+    second = store.snapshot([(data / "tokens.csv", "tokens.csv")])
+    assert second["files_unchanged"] == 1
+
+    (data / "tokens.csv").write_text("changed", encoding="utf-8")
+    calls = []
+    assert store.restore(first["id"], data, lambda done, total, name: calls.append((done, total))) == 2
+
+    assert (data / "tokens.csv").read_text(encoding="utf-8") == "username,token\na_bot,1:AAA\n"
+    assert calls == [(1, 2), (2, 2), (1, 2), (2, 2)]
+    assert _leftovers(data) == []
+
+
+def test_failed_apply_rolls_back_replaced_files(tmp_path):
+    data = _files(tmp_path)
+    archive = tmp_path / "backup.zip"
+    with zipfile.ZipFile(archive, "w") as zf:
+        zf.writestr("tokens.csv", "from backup")
+        zf.writestr("new.txt", "only in backup")
+
+    def _fail_on_second_apply(done, total, name):
+        calls.append(done)
+        if len(calls) == 4:
+            raise OSError("disk full")
+
+    calls = []
+    with pytest.raises(OSError):
+        restore_zip(archive, data, _fail_on_second_apply)
+
+    assert (data / "tokens.csv").read_text(encoding="utf-8") == "username,token\na_bot,1:AAA\n"
+    assert not (data / "new.txt").exists()
+    assert _leftovers(data) == []
+
+
+def test_unsafe_archive_fails_while_staging(tmp_path):
+    data = _files(tmp_path)
+    archive = tmp_path / "evil.zip"
+    with zipfile.ZipFile(archive, "w") as zf:
+        zf.writestr("tokens.csv", "from backup")
+        zf.writestr("../escape.txt", "outside")
+
+    with pytest.raises(ValueError):
+        restore_zip(archive, data)
+
+    assert (data / "tokens.csv").read_text(encoding="utf-8") == "username,token\na_bot,1:AAA\n"
+    assert not (tmp_path / "escape.txt").exists()
+    assert _leftovers(data) == []
+
+
+def test_recover_interrupted_restore_puts_originals_back(tmp_path):
+    data = _files(tmp_path)
+    (data / RESTORE_ROLLBACK).mkdir()
+    (data / "tokens.csv").replace(data / RESTORE_ROLLBACK / "tokens.csv")
+    (data / "tokens.csv").write_text("half restored", encoding="utf-8")
+    (data / "new.txt").write_text("from backup", encoding="utf-8")
+    (data / RESTORE_JOURNAL).write_text(
+        '{"files": [{"path": "tokens.csv", "existed": true}, {"path": "new.txt", "existed": false}]}',
+        encoding="utf-8",
+    )
+
+    assert recover_interrupted_restore(data)
+    assert (data / "tokens.csv").read_text(encoding="utf-8") == "username,token\na_bot,1:AAA\n"
+    assert not (data / "new.txt").exists()
+    assert _leftovers(data) == []
@@ -0,0 +1,22 @@
+from core import parse_usernames
+
+
+def test_parse_usernames_splits_on_spaces():
+    assert parse_usernames("bot1 bot2\tbot3") == ["bot1", "bot2", "bot3"]
+
+
+def test_parse_usernames_splits_on_newlines():
+    assert parse_usernames("bot1\nbot2\r\n\nbot3\n") == ["bot1", "bot2", "bot3"]
+
+
+def test_parse_usernames_splits_on_slashes():
+    assert parse_usernames("bot1/bot2 / @bot3//bot4") == ["bot1", "bot2", "bot3", "bot4"]
+
+
+def test_parse_usernames_keeps_letter_s():
+    assert parse_usernames("mybots_bot sales_bot") == ["mybots_bot", "sales_bot"]
+
+
+def test_parse_usernames_strips_at_and_duplicates():
+    assert parse_usernames("@bot1 bot1 @bot2") == ["bot1", "bot2"]
+    assert parse_usernames("") == []
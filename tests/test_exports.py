@@ -0,0 +1,64 @@
+import csv
+import json
+
+from exports import ExportFilter, day_start, export_tokens
+from tokens import TOKEN_CSV_FIELDS
+
+
+def _write_tokens(path, rows):
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(TOKEN_CSV_FIELDS)
+        writer.writerows(rows)
+
+
+def _tokens_csv(tmp_path):
+    first = day_start("2026-03-01") + 3600
+    second = day_start("2026-03-02") + 3600
+    path = tmp_path / "tokens.csv"
+    _write_tokens(path, [
+        ["a_bot", "1:AAA", "Hamster", "+100", first],
+        ["b_bot", "2:BBB", "", "+200", second],
+        ["c_bot", "3:CCC", "Hamster", "+200", second],
+        ["d_bot", "", "Hamster", "+200", second],
+        ["e_bot", "5:EEE", "Hamster", "+200", ""],
+    ])
+    return path
+
+
+def test_export_filters_by_date_range(tmp_path):
+    source = _tokens_csv(tmp_path)
+    target = tmp_path / "out.txt"
+    result = export_tokens(source, target, "txt", ExportFilter(date_from="2026-03-02", date_to="2026-03-02"))
+
+    assert target.read_text(encoding="utf-8").splitlines() == ["2:BBB", "3:CCC"]
+    assert result["scanned"] == 5
+    assert result["exported"] == 2
+
+
+def test_export_filters_by_hamster_and_account(tmp_path):
+    source = _tokens_csv(tmp_path)
+    target = tmp_path / "out.jsonl"
+    export_tokens(source, target, "jsonl", ExportFilter(hamsters={"Hamster"}, accounts={"+200"}))
+
+    rows = [json.loads(line) for line in target.read_text(encoding="utf-8").splitlines()]
+    assert [row["username"] for row in rows] == ["c_bot", "e_bot"]
+
+
+def test_export_treats_empty_hamster_as_none(tmp_path):
+    source = _tokens_csv(tmp_path)
+    target = tmp_path / "out.csv"
+    export_tokens(source, target, "csv", ExportFilter(hamsters={"None"}))
+
+    with open(target, newline="", encoding="utf-8") as f:
+        rows = list(csv.DictReader(f))
+    assert [row["username"] for row in rows] == ["b_bot"]
+
+
+def test_export_uses_current_token_version(tmp_path):
+    source = _tokens_csv(tmp_path)
+    target = tmp_path / "out.txt"
+    current = {"a_bot": {"token": "1:NEW", "version": 3}}
+    export_tokens(source, target, "txt", ExportFilter(accounts={"+100"}), current=current)
+
+    assert target.read_text(encoding="utf-8").splitlines() == ["1:NEW"]
@@ -0,0 +1,50 @@
+from jobs import JOB_DONE, JOB_FAILED, JOB_PENDING, JOB_SKIPPED, JobJournal, ManagementJob
+
+
+def _targets(*usernames):
+    return [{"username": username, "account": "+100"} for username in usernames]
+
+
+def test_job_create_drops_blank_and_duplicate_targets(tmp_path):
+    job = ManagementJob.create(tmp_path, "delete", _targets("a_bot", "", "b_bot", "a_bot"))
+    assert [target["username"] for target in job.targets] == ["a_bot", "b_bot"]
+    assert job.counts()[JOB_PENDING] == 2
+
+
+def test_job_load_replays_marks(tmp_path):
+    job = ManagementJob.create(tmp_path, "delete", _targets("a_bot", "b_bot", "c_bot"))
+    job.mark("a_bot", JOB_DONE)
+    job.mark("b_bot", JOB_FAILED, "flood wait")
+    job.mark("c_bot", JOB_SKIPPED, "no account")
+
+    loaded = ManagementJob.load(job.path)
+    assert loaded.state("a_bot") == JOB_DONE
+    assert loaded.reasons == {"b_bot": "flood wait", "c_bot": "no account"}
+    assert [target["username"] for target in loaded.remaining()] == ["b_bot", "c_bot"]
+    assert not loaded.is_complete()
+
+
+def test_job_compact_keeps_only_last_state(tmp_path):
+    job = ManagementJob.create(tmp_path, "delete", _targets("a_bot", "b_bot"))
+    job.mark("a_bot", JOB_FAILED, "timeout")
+    job.mark("a_bot", JOB_DONE)
+    job.compact()
+
+    assert len(job.path.read_text(encoding="utf-8").splitlines()) == 2
+    loaded = ManagementJob.load(job.path)
+    assert loaded.state("a_bot") == JOB_DONE
+    assert loaded.state("b_bot") == JOB_PENDING
+    assert loaded.reasons == {}
+
+
+def test_journal_finish_deletes_complete_jobs_only(tmp_path):
+    journal = JobJournal(tmp_path)
+    done = journal.create("delete", _targets("a_bot"))
+    interrupted = journal.create("revoke", _targets("b_bot"))
+    done.mark("a_bot", JOB_DONE)
+
+    assert journal.finish(done)
+    assert not journal.finish(interrupted)
+    assert not done.path.exists()
+    assert [job.job_id for job in journal.unfinished()] == [interrupted.job_id]
+    assert [job.job_id for job in JobJournal(tmp_path).unfinished("revoke")] == [interrupted.job_id]
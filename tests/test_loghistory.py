@@ -0,0 +1,59 @@
+import loghistory
+from loghistory import LogHistory, LogQuery
+
+
+def _write_log(path, lines):
+    path.write_text("".join(f"{line}\n" for line in lines), encoding="utf-8")
+
+
+def _day_lines(day, tag, count):
+    return [f"[2026-03-{day:02d} 12:00:{second:02d}] [{tag}] bot_{day}_{second}" for second in range(count)]
+
+
+def test_search_skips_blocks_outside_the_date_range(tmp_path, monkeypatch):
+    monkeypatch.setattr(loghistory, "BLOCK_BYTES", 256)
+    _write_log(tmp_path / "run.log", [line for day in range(1, 6) for line in _day_lines(day, "OK", 20)])
+    history = LogHistory(tmp_path)
+
+    everything, all_blocks = history.search()
+    found, scanned = history.search(LogQuery(date_from="2026-03-03", date_to="2026-03-03"))
+
+    assert len(everything) == 100
+    assert len(found) == 20
+    assert all(line.startswith("[2026-03-03") for line in found)
+    assert scanned < all_blocks / 2
+
+
+def test_search_uses_tag_masks_and_text(tmp_path, monkeypatch):
+    monkeypatch.setattr(loghistory, "BLOCK_BYTES", 256)
+    _write_log(tmp_path / "run.log", _day_lines(1, "OK", 30) + _day_lines(2, "ERR", 3) + _day_lines(3, "OK", 30))
+    history = LogHistory(tmp_path)
+
+    found, scanned = history.search(LogQuery(tags={"[ERR]"}))
+    assert [line.rsplit(" ", 1)[1] for line in found] == ["bot_2_2", "bot_2_1", "bot_2_0"]
+    assert scanned <= 2
+
+    found, _ = history.search(LogQuery(text="@BOT_3_29"))
+    assert found == ["[2026-03-03 12:00:29] [OK] bot_3_29"]
+
+
+def test_search_reads_rotated_files_newest_first(tmp_path):
+    _write_log(tmp_path / "run.log.2", _day_lines(1, "OK", 2))
+    _write_log(tmp_path / "run.log.1", _day_lines(2, "OK", 2))
+    _write_log(tmp_path / "run.log", _day_lines(3, "OK", 2))
+
+    found, _ = LogHistory(tmp_path).search(limit=3)
+    assert [line.rsplit(" ", 1)[1] for line in found] == ["bot_3_1", "bot_3_0", "bot_2_1"]
+
+
+def test_index_extends_after_append(tmp_path):
+    path = tmp_path / "run.log"
+    _write_log(path, _day_lines(1, "OK", 5))
+    history = LogHistory(tmp_path)
+    assert len(history.search()[0]) == 5
+
+    with open(path, "a", encoding="utf-8") as f:
+        f.write("[2026-03-02 08:00:00] [WARN] late line\n")
+    found, _ = history.search(LogQuery(tags={"WARN"}))
+    assert found == ["[2026-03-02 08:00:00] [WARN] late line"]
+    assert history.stats()["lines"] == 6
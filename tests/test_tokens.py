@@ -0,0 +1,37 @@
+from tokens import EVENT_CREATED, EVENT_DELETED, EVENT_REVOKED, TokenHistory
+
+
+def test_record_increments_version_per_bot(tmp_path):
+    history = TokenHistory(tmp_path / "history.csv")
+
+    assert history.record("a_bot", "1:AAA", "+100") == 1
+    assert history.record("a_bot", "1:BBB", "+100", EVENT_REVOKED) == 2
+    assert history.record("b_bot", "2:AAA", "+200") == 1
+    assert history.current_token("a_bot") == "1:BBB"
+    assert [row["token"] for row in history.history("a_bot")] == ["1:AAA", "1:BBB"]
+
+
+def test_forget_appends_deleted_version(tmp_path):
+    history = TokenHistory(tmp_path / "history.csv")
+    history.record("a_bot", "1:AAA", "+100")
+    history.forget("a_bot")
+
+    assert history.current("a_bot") is None
+    assert [(row["version"], row["event"]) for row in history.history("a_bot")] == [
+        ("1", EVENT_CREATED),
+        ("2", EVENT_DELETED),
+    ]
+
+
+def test_seed_runs_only_when_file_is_missing(tmp_path):
+    path = tmp_path / "history.csv"
+    seeded = TokenHistory(path, seed=lambda: [
+        {"username": "a_bot", "token": "1:AAA", "account": "+100"},
+        {"username": "a_bot", "token": "1:BBB", "account": "+100"},
+        {"username": "", "token": "9:ZZZ"},
+    ])
+    assert seeded.current("a_bot")["version"] == 2
+
+    reopened = TokenHistory(path, seed=lambda: [{"username": "x_bot", "token": "7:XXX"}])
+    assert set(reopened.snapshot()) == {"a_bot"}
+    assert reopened.current("a_bot")["version"] == 2
@@ -0,0 +1,350 @@
+import csv
+import sys
+import threading
+import time
+from array import array
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+HISTORY_FIELDS = ["username", "version", "token", "account", "event", "ts"]
+EVENT_CREATED = "created"
+EVENT_REVOKED = "revoked"
+EVENT_DELETED = "deleted"
+
+
+def read_revoked_lines(path: Path) -> List[Tuple[str, str, str]]:
+    entries = []
+    if not path.exists():
+        return entries
+    for raw in path.read_text(encoding="utf-8").splitlines():
+        parts = raw.strip().split(",")
+        if len(parts) < 3:
+            continue
+        username, account, token = parts[0].strip(), parts[1].strip(), ",".join(parts[2:]).strip()
+        if username and token:
+            entries.append((username, account, token))
+    return entries
+
+
+class TokenHistory:
+    def __init__(self, path: Path, seed: Optional[Callable[[], Iterable[dict]]] = None):
+        self.path = Path(path)
+        self.seed = seed
+        self._lock = threading.RLock()
+        self._current: Dict[str, dict] = {}
+        self._signature: Optional[Tuple[int, int]] = None
+
+    def _stat(self) -> Optional[Tuple[int, int]]:
+        try:
+            st = self.path.stat()
+        except OSError:
+            return None
+        return st.st_mtime_ns, st.st_size
+
+    def _apply(self, entry: dict):
+        username = entry["username"]
+        if entry["event"] == EVENT_DELETED:
+            self._current.pop(username, None)
+        else:
+            self._current[username] = entry
+
+    def _append(self, entries: List[dict]):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        exists = self.path.exists() and self.path.stat().st_size > 0
+        with open(self.path, "a", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, fieldnames=HISTORY_FIELDS)
+            if not exists:
+                writer.writeheader()
+            writer.writerows(entries)
+        for entry in entries:
+            self._apply(entry)
+        self._signature = self._stat()
+
+    def _ensure_seeded(self):
+        if self.path.exists() or self.seed is None:
+            return
+        versions: Dict[str, int] = {}
+        entries = []
+        for item in self.seed():
+            username = (item.get("username") or "").strip()
+            token = (item.get("token") or "").strip()
+            if not username or not token:
+                continue
+            versions[username] = versions.get(username, 0) + 1
+            entries.append({
+                "username": username,
+                "version": versions[username],
+                "token": token,
+                "account": (item.get("account") or "").strip(),
+                "event": item.get("event") or EVENT_CREATED,
+                "ts": item.get("ts") or int(time.time()),
+            })
+        self._append(entries)
+
+    def _reload(self):
+        signature = self._stat()
+        if signature is not None and signature == self._signature:
+            return
+        self._current = {}
+        if signature is not None:
+            with open(self.path, "r", encoding="utf-8") as f:
+                for row in csv.DictReader(f):
+                    username = (row.get("username") or "").strip()
+                    if not username:
+                        continue
+                    row["version"] = int(row.get("version") or 0)
+                    self._apply(row)
+        self._signature = signature
+
+    def _refresh(self):
+        self._ensure_seeded()
+        self._reload()
+
+    def signature(self) -> Optional[Tuple[int, int]]:
+        with self._lock:
+            self._refresh()
+            return self._signature
+
+    def current(self, username: str) -> Optional[dict]:
+        with self._lock:
+            self._refresh()
+            return self._current.get(username)
+
+    def current_token(self, username: str) -> str:
+        entry = self.current(username)
+        return entry["token"] if entry else ""
+
+    def snapshot(self) -> Dict[str, dict]:
+        with self._lock:
+            self._refresh()
+            return dict(self._current)
+
+    def history(self, username: str) -> List[dict]:
+        with self._lock:
+            self._refresh()
+            with open(self.path, "r", encoding="utf-8") as f:
+                return [row for row in csv.DictReader(f) if (row.get("username") or "").strip() == username]
+
+    def record(self, username: str, token: str, account: str, event: str = EVENT_CREATED) -> int:
+        with self._lock:
+            self._refresh()
+            previous = self._current.get(username)
+            version = (int(previous["version"]) + 1) if previous else 1
+            self._append([{
+                "username": username,
+                "version": version,
+                "token": token,
+                "account": account,
+                "event": event,
+                "ts": int(time.time()),
+            }])
+            return version
+
+    def forget(self, username: str):
+        with self._lock:
+            self._refresh()
+            previous = self._current.get(username)
+            if previous is None:
+                return
+            self._append([dict(previous, event=EVENT_DELETED, version=int(previous["version"]) + 1, ts=int(time.time()))])
+
+
+_HISTORIES: Dict[Path, TokenHistory] = {}
+_HISTORIES_LOCK = threading.Lock()
+
+
+def token_history_for(path: Path, seed: Optional[Callable[[], Iterable[dict]]] = None) -> TokenHistory:
+    key = Path(path).resolve()
+    with _HISTORIES_LOCK:
+        history = _HISTORIES.get(key)
+        if history is None:
+            history = TokenHistory(key, seed)
+            _HISTORIES[key] = history
+        return history
+
+
+TOKEN_CSV_FIELDS = ["username", "token", "hamster", "account", "ts"]
+NO_DATE = ""
+
+
+class BotRecord:
+    __slots__ = ("username", "token", "hamster", "account", "ts", "version")
+
+    def __init__(self, username: str = "", token: str = "", hamster: str = "", account: str = "", ts: int = 0, version: int = 0):
+        self.username = username
+        self.token = token
+        self.hamster = hamster
+        self.account = account
+        self.ts = ts
+        self.version = version
+
+    def csv_row(self) -> List:
+        return [self.username, self.token, self.hamster, self.account, self.ts or ""]
+
+
+class BotRecords:
+    __slots__ = ("usernames", "tokens", "hamsters", "accounts", "timestamps", "versions", "_day_cache")
+
+    def __init__(self):
+        self.usernames: List[str] = []
+        self.tokens: List[str] = []
+        self.hamsters: List[str] = []
+        self.accounts: List[str] = []
+        self.timestamps = array("q")
+        self.versions = array("l")
+        self._day_cache: Dict[int, str] = {}
+
+    def __len__(self) -> int:
+        return len(self.usernames)
+
+    def __iter__(self):
+        for index in range(len(self.usernames)):
+            yield self.record(index)
+
+    def append(self, username: str, token: str, hamster: str, account: str, ts: int, version: int = 0):
+        self.usernames.append(username)
+        self.tokens.append(token)
+        self.hamsters.append(sys.intern(hamster))
+        self.accounts.append(sys.intern(account))
+        self.timestamps.append(ts)
+        self.versions.append(version)
+
+    def record(self, index: int) -> BotRecord:
+        return BotRecord(
+            self.usernames[index],
+            self.tokens[index],
+            self.hamsters[index],
+            self.accounts[index],
+            self.timestamps[index],
+            self.versions[index],
+        )
+
+    def date_key(self, index: int) -> str:
+        ts = self.timestamps[index]
+        if ts <= 0:
+            return NO_DATE
+        bucket = ts // 900
+        day = self._day_cache.get(bucket)
+        if day is None:
+            day = time.strftime("%Y-%m-%d", time.localtime(bucket * 900))
+            self._day_cache[bucket] = day
+        return day
+
+    def indices_by_date(self) -> Dict[str, List[int]]:
+        groups: Dict[str, List[int]] = {}
+        for index in range(len(self.usernames)):
+            groups.setdefault(self.date_key(index), []).append(index)
+        return groups
+
+    def hamster_counts(self) -> Dict[str, int]:
+        counts: Dict[str, int] = {}
+        for hamster in self.hamsters:
+            key = hamster or "None"
+            counts[key] = counts.get(key, 0) + 1
+        return counts
+
+    def account_by_username(self) -> Dict[str, str]:
+        return {username: account for username, account in zip(self.usernames, self.accounts) if username and account}
+
+
+def _parse_ts(value: str) -> int:
+    value = (value or "").strip()
+    return int(value) if value.isdigit() else 0
+
+
+def iter_bot_rows(lines: Iterable[str], current: Optional[Dict[str, dict]] = None) -> Iterator[Tuple[str, str, str, str, int, int]]:
+    current = current or {}
+    reader = csv.reader(lines)
+    header = next(reader, None)
+    if not header:
+        return
+    columns = {name.strip(): index for index, name in enumerate(header)}
+    account_col = columns.get("account", columns.get("phone"))
+    picks = [columns.get("username"), columns.get("token"), columns.get("hamster"), account_col, columns.get("ts")]
+    for row in reader:
+        size = len(row)
+        username, token, hamster, account, ts = (
+            row[col].strip() if col is not None and col < size else "" for col in picks
+        )
+        version = 0
+        entry = current.get(username) if username else None
+        if entry and entry["token"] != token:
+            token = entry["token"]
+            version = int(entry["version"])
+        yield username, token, hamster, account, _parse_ts(ts), version
+
+
+def read_bot_records(path: Path, current: Optional[Dict[str, dict]] = None) -> BotRecords:
+    records = BotRecords()
+    if not path.exists():
+        return records
+    with open(path, "r", newline="", encoding="utf-8") as f:
+        for row in iter_bot_rows(f, current):
+            records.append(*row)
+    return records
+
+
+def write_bot_records(csv_path: Path, records: Iterable[BotRecord], txt_path: Optional[Path] = None):
+    csv_path.parent.mkdir(parents=True, exist_ok=True)
+    txt_file = None
+    if txt_path is not None:
+        txt_path.parent.mkdir(parents=True, exist_ok=True)
+        txt_file = open(txt_path, "w", encoding="utf-8")
+    try:
+        with open(csv_path, "w", newline="", encoding="utf-8") as csv_file:
+            writer = csv.writer(csv_file)
+            writer.writerow(TOKEN_CSV_FIELDS)
+            for record in records:
+                writer.writerow(record.csv_row())
+                if txt_file is not None and record.token:
+                    txt_file.write(f"{record.token}\n")
+    finally:
+        if txt_file is not None:
+            txt_file.close()
+
+
+class BotRecordStore:
+    def __init__(self, path: Path, history: Optional[TokenHistory] = None):
+        self.path = Path(path)
+        self.history = history
+        self._lock = threading.Lock()
+        self._records = BotRecords()
+        self._signature = None
+        self.loads = 0
+
+    def _stat(self):
+        try:
+            st = self.path.stat()
+        except OSError:
+            return None
+        return st.st_mtime_ns, st.st_size
+
+    def records(self) -> BotRecords:
+        signature = (self._stat(), self.history.signature() if self.history is not None else None)
+        with self._lock:
+            if signature != self._signature:
+                current = self.history.snapshot() if self.history is not None else {}
+                self._records = read_bot_records(self.path, current)
+                self._signature = signature
+                self.loads += 1
+            return self._records
+
+    def invalidate(self):
+        with self._lock:
+            self._signature = None
+
+
+_STORES: Dict[Path, BotRecordStore] = {}
+_STORES_LOCK = threading.Lock()
+
+
+def bot_record_store_for(path: Path, history: Optional[TokenHistory] = None) -> BotRecordStore:
+    key = Path(path).resolve()
+    with _STORES_LOCK:
+        store = _STORES.get(key)
+        if store is None:
+            store = BotRecordStore(key, history)
+            _STORES[key] = store
+        elif history is not None:
+            store.history = history
+        return store